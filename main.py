@@ -1,12 +1,53 @@
 """
 ORE v1.1.1 application entry point.
 Loads environment and delegates to the CLI.
+
+Imports are deferred until after a raw scan of sys.argv so that --help and
+--version do not pay for python-dotenv or the engine import graph; dotenv is
+imported only when a .env file is actually found.
 """
 
-from dotenv import load_dotenv
+import sys
+from pathlib import Path
+from typing import Optional
 
-from ore import cli
+# Flags answered without loading .env (they never reach a reasoner backend)
+_HELP_FLAGS = frozenset({"-h", "--help"})
+_VERSION_FLAGS = frozenset({"-V", "--version"})
+
+
+def _find_env_file() -> Optional[Path]:
+    """
+    Return the nearest .env walking up from this file's directory, or None.
+    Same search as python-dotenv's find_dotenv() when called from here, so
+    the dotenv import is skipped entirely when there is nothing to load.
+    """
+    here = Path(__file__).resolve().parent
+    for directory in (here, *here.parents):
+        candidate = directory / ".env"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    if not _VERSION_FLAGS.isdisjoint(argv):
+        from ore._version import __version__
+
+        print(f"ORE {__version__}")
+        return
+    if _HELP_FLAGS.isdisjoint(argv):
+        env_file = _find_env_file()
+        if env_file is not None:
+            from dotenv import load_dotenv
+
+            load_dotenv(env_file)
+
+    from ore import cli
 
-if __name__ == "__main__":
-    load_dotenv()
     cli.run()
+
+
+if __name__ == "__main__":
+    main()
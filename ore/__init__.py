@@ -4,42 +4,102 @@ Irreducible loop: Input -> Reasoner -> Output. Tools (v0.6) run pre-reasoning, g
 Routing (v0.7) selects tools by intent when --route is used.
 Skills (v0.8) inject filesystem-based instructions into context on-demand.
 Artifacts (v0.9) enable chainable execution via --artifact-out / --artifact-in.
+
+Public names are re-exported lazily (PEP 562): `import ore` loads only the
+version; each submodule is imported on first attribute access.
 """
 
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from ._version import __version__
 
-from .cli import run
-from .core import ORE
-from .gate import Gate, GateError, Permission
-from .models import default_model, fetch_models
-from .reasoner import AyaReasoner, Reasoner
-from .reasoner_deepseek import DeepSeekReasoner
-from .router import (
-    RuleRouter,
-    Router,
-    TEST_ROUTING_TARGET,
-    build_targets_from_registry,
-)
-from .skills import (
-    build_skill_registry,
-    build_targets_from_skill_registry,
-    load_skill_instructions,
-    load_skill_metadata,
-    load_skill_resource,
-)
-from .store import FileSessionStore, SessionStore
-from .tools import TOOL_REGISTRY, Tool
-from .types import (
-    ARTIFACT_VERSION,
-    ExecutionArtifact,
-    Message,
-    Response,
-    RoutingDecision,
-    RoutingTarget,
-    Session,
-    SkillMetadata,
-    ToolResult,
-)
+if TYPE_CHECKING:
+    from .cli import run
+    from .core import ORE
+    from .gate import Gate, GateError, Permission
+    from .models import default_model, fetch_models
+    from .reasoner import AyaReasoner, Reasoner
+    from .reasoner_deepseek import DeepSeekReasoner
+    from .router import (
+        RuleRouter,
+        Router,
+        TEST_ROUTING_TARGET,
+        build_targets_from_registry,
+    )
+    from .skills import (
+        build_skill_registry,
+        build_targets_from_skill_registry,
+        load_skill_instructions,
+        load_skill_metadata,
+        load_skill_resource,
+    )
+    from .store import FileSessionStore, SessionStore
+    from .tools import TOOL_REGISTRY, Tool
+    from .types import (
+        ARTIFACT_VERSION,
+        ExecutionArtifact,
+        Message,
+        Response,
+        RoutingDecision,
+        RoutingTarget,
+        Session,
+        SkillMetadata,
+        ToolResult,
+    )
+
+# Public name -> submodule that defines it (relative to this package)
+_LAZY_IMPORTS = {
+    "run": ".cli",
+    "ORE": ".core",
+    "Gate": ".gate",
+    "GateError": ".gate",
+    "Permission": ".gate",
+    "default_model": ".models",
+    "fetch_models": ".models",
+    "AyaReasoner": ".reasoner",
+    "Reasoner": ".reasoner",
+    "DeepSeekReasoner": ".reasoner_deepseek",
+    "RuleRouter": ".router",
+    "Router": ".router",
+    "TEST_ROUTING_TARGET": ".router",
+    "build_targets_from_registry": ".router",
+    "build_skill_registry": ".skills",
+    "build_targets_from_skill_registry": ".skills",
+    "load_skill_instructions": ".skills",
+    "load_skill_metadata": ".skills",
+    "load_skill_resource": ".skills",
+    "FileSessionStore": ".store",
+    "SessionStore": ".store",
+    "TOOL_REGISTRY": ".tools",
+    "Tool": ".tools",
+    "ARTIFACT_VERSION": ".types",
+    "ExecutionArtifact": ".types",
+    "Message": ".types",
+    "Response": ".types",
+    "RoutingDecision": ".types",
+    "RoutingTarget": ".types",
+    "Session": ".types",
+    "SkillMetadata": ".types",
+    "ToolResult": ".types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access and cache the name here."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "__version__",
@@ -1,2 +1,2 @@
 # Single source of truth for ORE package version.
-__version__ = "1.2.0"
+__version__ = "1.3.0"
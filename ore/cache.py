@@ -0,0 +1,127 @@
+"""
+Opt-in response cache (--cache).
+Maps (reasoner, model, messages) to a prior Response in a local SQLite file so
+repeated identical prompts skip the backend. The engine is unaware of it: the
+CLI wraps the reasoner in CachingReasoner.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Generator, List, Optional
+
+from .reasoner import Reasoner
+from .types import Message, Response
+
+
+def _default_path() -> Path:
+    return Path.home() / ".ore" / "cache" / "responses.db"
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache.
+    Default location: ~/.ore/cache/responses.db
+    The database is opened on first use; hits and misses are counted per instance.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path or _default_path()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(namespace: str, model_id: str, messages: List[Message]) -> str:
+        """Stable sha256 over namespace, model and (role, content) of each message."""
+        payload = {
+            "namespace": namespace,
+            "model": model_id,
+            "messages": [[m.role, m.content] for m in messages],
+        }
+        blob = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, content TEXT NOT NULL, "
+                "model_id TEXT NOT NULL, metadata TEXT NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[Response]:
+        """Return a fresh Response built from the cached entry, or None."""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT content, model_id, metadata FROM responses WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        content, model_id, metadata = row
+        return Response(
+            content=content, model_id=model_id, metadata=json.loads(metadata)
+        )
+
+    def put(self, key: str, response: Response) -> None:
+        """Store response under key, replacing any previous entry."""
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    response.content,
+                    response.model_id,
+                    json.dumps(response.metadata, default=str),
+                ),
+            )
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class CachingReasoner(Reasoner):
+    """Reasoner wrapper that consults a ResponseCache before the wrapped backend."""
+
+    def __init__(self, reasoner: Reasoner, cache: ResponseCache) -> None:
+        self.reasoner = reasoner
+        self.cache = cache
+        self.model_id = getattr(reasoner, "model_id", "")
+        self._namespace = type(reasoner).__name__
+
+    def _key(self, messages: List[Message]) -> str:
+        return ResponseCache.key(self._namespace, self.model_id, messages)
+
+    def reason(self, messages: List[Message]) -> Response:
+        key = self._key(messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        response = self.reasoner.reason(messages)
+        self.cache.put(key, response)
+        return response
+
+    def stream_reason(self, messages: List[Message]) -> Generator[str, None, Response]:
+        key = self._key(messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached.content
+            return cached
+        response = yield from self.reasoner.stream_reason(messages)
+        self.cache.put(key, response)
+        return response
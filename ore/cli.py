@@ -10,51 +10,130 @@ v0.8 adds --skill / --list-skills for skill activation; routing merges tool + sk
 v0.9 adds --artifact-out / --artifact-in for chainable execution artifacts.
 """
 
-import argparse
-import json
+from __future__ import annotations
+
+import dataclasses
+import functools
 import os
 import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+)
 
 from ._version import __version__
-from .core import ORE
 from .gate import Gate, GateError, Permission
-from .models import default_model, fetch_models
-from .reasoner import AyaReasoner
-from .reasoner_deepseek import DeepSeekReasoner
-from .router import RuleRouter, build_targets_from_registry
-from .skills import (
-    build_skill_registry,
-    build_targets_from_skill_registry,
-    load_skill_instructions,
-)
-from .store import FileSessionStore
-from .tools import TOOL_REGISTRY
 from .types import (
     ExecutionArtifact,
     Response,
     RoutingDecision,
+    RoutingTarget,
     Session,
     SkillMetadata,
     ToolResult,
 )
 
-# Commands that exit any REPL mode (case-insensitive)
-_REPL_EXIT_COMMANDS = frozenset({"quit", "exit"})
+if TYPE_CHECKING:
+    import argparse
+
+    from .core import ORE
+    from .router import Router
+    from .tools import Tool
+
+# Commands that exit any REPL mode (case-insensitive): "quit", "exit".
+# Both are four characters, so longer lines are rejected before lower().
+_REPL_EXIT_LEN = 4
+
+# Answered from raw sys.argv before the parser or engine is built
+_VERSION_FLAGS = frozenset({"-V", "--version"})
+
+# Fast-path argv scan: option string -> (dest, kind). Mirrors _build_parser();
+# anything not listed here (help, --artifact-out, abbreviations, bundled short
+# flags, "--opt=value") falls back to argparse. kind is one of "flag"
+# (store_true), "value", "append", or "float".
+_FAST_OPTIONS: Dict[str, Tuple[str, str]] = {
+    "--model": ("model", "value"),
+    "--backend": ("backend", "value"),
+    "--list-models": ("list_models", "flag"),
+    "--interactive": ("interactive", "flag"),
+    "-i": ("interactive", "flag"),
+    "--conversational": ("conversational", "flag"),
+    "-c": ("conversational", "flag"),
+    "--save-session": ("save_session", "value"),
+    "--resume-session": ("resume_session", "value"),
+    "--stream": ("stream", "flag"),
+    "-s": ("stream", "flag"),
+    "--verbose": ("verbose", "flag"),
+    "-v": ("verbose", "flag"),
+    "--json": ("json", "flag"),
+    "-j": ("json", "flag"),
+    "--tool": ("tool", "value"),
+    "--tool-arg": ("tool_arg", "append"),
+    "--list-tools": ("list_tools", "flag"),
+    "--grant": ("grant", "append"),
+    "--route": ("route", "flag"),
+    "--route-threshold": ("route_threshold", "float"),
+    "--skill": ("skill", "value"),
+    "--list-skills": ("list_skills", "flag"),
+    "--artifact-in": ("artifact_in", "value"),
+    "--system": ("system", "value"),
+    "--cache": ("cache", "flag"),
+    "--daemon": ("daemon", "flag"),
+    "--via-daemon": ("via_daemon", "flag"),
+    "--refresh-models": ("refresh_models", "flag"),
+}
+_BACKEND_CHOICES = ("ollama", "deepseek")
+
+# Valid --grant values, in Permission declaration order. Checked after parsing
+# (not via argparse choices=) because an unknown permission exits 1, not 2.
+_PERM_BY_VALUE: Dict[str, Permission] = {p.value: p for p in Permission}
+_GRANT_CHOICES = tuple(_PERM_BY_VALUE)
+
+# --save-session: compact the journal into <name>.json every N turns
+_SESSION_COMPACT_TURNS = 20
+
+# --stream: chunks are written as they arrive but stdout is flushed only at
+# newlines, every _STREAM_FLUSH_CHUNKS chunks, or when this many seconds have
+# passed since the last flush.
+_STREAM_FLUSH_INTERVAL_S = 0.05
+_STREAM_FLUSH_CHUNKS = 8
 
 
 def _validate_output_path(path: str) -> Path:
     """
     Validate artifact output path. Rejects .. components; warns if outside cwd.
-    Returns resolved Path. Raises ValueError if path contains .. components.
+    Returns an absolute Path. Raises ValueError if path contains .. components.
     Caller must skip validation when path == "-" (stdout).
+
+    A relative path without .. and without symlinked components stays inside
+    cwd, so it is made absolute lexically (one lstat per component, no full
+    resolve). Absolute paths, and relative paths through a symlink, are
+    resolved and compared against the resolved cwd.
     """
     p = Path(path)
     if ".." in p.parts:
         raise ValueError(
             f"Artifact output path must not contain .. components: {path!r}"
         )
+    if not p.is_absolute():
+        prefix = ""
+        for part in p.parts:
+            prefix = os.path.join(prefix, part)
+            if os.path.islink(prefix):
+                break  # may point outside cwd: resolve below
+        else:
+            return Path(os.path.abspath(p))
     resolved = p.resolve()
     cwd = Path(os.getcwd()).resolve()
     try:
@@ -74,10 +153,10 @@ def _load_artifact_and_set_prompt(args: argparse.Namespace) -> None:
     """
     path = args.artifact_in
     if path == "-":
-        raw = sys.stdin.read()
+        raw: str | bytes = sys.stdin.read()
     else:
         try:
-            raw = Path(path).read_text(encoding="utf-8")
+            raw = Path(path).read_bytes()
         except FileNotFoundError:
             print(f"Artifact file not found: {path}", file=sys.stderr)
             sys.exit(1)
@@ -85,8 +164,8 @@ def _load_artifact_and_set_prompt(args: argparse.Namespace) -> None:
             print(f"Error reading artifact: {e}", file=sys.stderr)
             sys.exit(1)
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as e:
+        data = _json_loads(raw)
+    except ValueError as e:  # JSONDecodeError (either library) or bad UTF-8
         print(f"Invalid artifact JSON: {e}", file=sys.stderr)
         sys.exit(1)
     try:
@@ -105,33 +184,38 @@ def _parse_tool_args(tool_arg_list: Optional[List[str]]) -> dict:
         return {}
     out: dict = {}
     for s in tool_arg_list:
-        if "=" in s:
-            k, _, v = s.partition("=")
-            out[k.strip()] = v.strip()
-        else:
+        i = s.find("=")
+        if i < 0:
             out[s.strip()] = ""
+        else:
+            # strip() returns the same object when there is nothing to strip
+            out[s[:i].strip()] = s[i + 1 :].strip()
     return out
 
 
-def _get_tool_results(
-    tool_name: Optional[str],
-    tool_arg_list: Optional[List[str]],
-    gate: Gate,
-) -> Optional[List[ToolResult]]:
+def _resolve_tool(tool_name: Optional[str]) -> Optional[Tool]:
     """
-    If tool_name is set, resolve tool, run through gate, return [result].
-    On unknown tool or GateError: print to stderr and exit(1).
+    Look up --tool once per run. None if tool_name is unset; on unknown tool:
+    print to stderr and exit(1).
     """
     if not tool_name:
         return None
+    from .tools import TOOL_REGISTRY
+
     if tool_name not in TOOL_REGISTRY:
         print(f"Unknown tool: {tool_name}", file=sys.stderr)
         sys.exit(1)
-    tool = TOOL_REGISTRY[tool_name]
-    args = _parse_tool_args(tool_arg_list)
+    return TOOL_REGISTRY[tool_name]
+
+
+def _run_tool(tool: Tool, tool_args: Dict[str, str], gate: Gate) -> List[ToolResult]:
+    """
+    Run tool through gate and return [result]. tool_args is an already-parsed
+    dict (see _parse_tool_args); each run gets its own copy. On GateError:
+    print to stderr and exit(1).
+    """
     try:
-        result = gate.run(tool, args)
-        return [result]
+        return [gate.run(tool, dict(tool_args))]
     except GateError as e:
         print(str(e), file=sys.stderr)
         sys.exit(1)
@@ -151,8 +235,47 @@ def _get_skill_context(
         print(f"Unknown skill: {skill_name}", file=sys.stderr)
         sys.exit(1)
     meta = skill_registry[skill_name]
-    instructions = load_skill_instructions(meta.path)
-    return [f"[Skill:{skill_name}]\n{instructions}"]
+    return [f"[Skill:{skill_name}]\n{_skill_instructions(meta.path)}"]
+
+
+def _skill_instructions(skill_dir: Path) -> str:
+    """
+    load_skill_instructions(skill_dir), reused across turns until SKILL.md's
+    mtime changes (so an edited skill is picked up on the next turn).
+    """
+    from .skills import SKILL_FILENAME, load_skill_instructions
+
+    try:
+        mtime_ns = (skill_dir / SKILL_FILENAME).stat().st_mtime_ns
+    except OSError:
+        return load_skill_instructions(skill_dir)  # raises the usual error
+    return _cached_skill_instructions(skill_dir, mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_skill_instructions(skill_dir: Path, mtime_ns: int) -> str:
+    """Cache behind _skill_instructions; mtime_ns is part of the key only."""
+    from .skills import load_skill_instructions
+
+    return load_skill_instructions(skill_dir)
+
+
+def _build_routing(
+    threshold: float, skill_registry: Dict[str, SkillMetadata]
+) -> Tuple[Router, List[RoutingTarget]]:
+    """
+    Router and merged tool + skill targets for --route. TOOL_REGISTRY and the
+    skill registry are fixed for the run, so both are built once.
+    """
+    from .router import RuleRouter, _MemoRouter, build_targets_from_registry
+    from .skills import build_targets_from_skill_registry
+    from .tools import TOOL_REGISTRY
+
+    return (
+        _MemoRouter(RuleRouter(confidence_threshold=threshold)),
+        build_targets_from_registry(TOOL_REGISTRY)
+        + build_targets_from_skill_registry(skill_registry),
+    )
 
 
 def _route_and_dispatch(
@@ -160,18 +283,16 @@ def _route_and_dispatch(
     gate: Gate,
     verbose: bool,
     skill_registry: Dict[str, SkillMetadata],
-    confidence_threshold: float = 0.5,
+    router: Router,
+    targets: List[RoutingTarget],
 ) -> Tuple[Optional[List[ToolResult]], Optional[List[str]], RoutingDecision]:
     """
     Run router on prompt (tool + skill targets merged); dispatch to the
     selected target. Returns (tool_results, skill_context, decision).
+    router and targets are built once per run (see _build_routing).
     All routing info is printed to stderr so stdout stays clean for JSON.
     """
-    targets = build_targets_from_registry(TOOL_REGISTRY)
-    targets += build_targets_from_skill_registry(skill_registry)
-    decision = RuleRouter(confidence_threshold=confidence_threshold).route(
-        prompt, targets
-    )
+    decision = router.route(prompt, targets)
     # Always print routing to stderr (visible, non-silent)
     if decision.target is None:
         print(
@@ -192,28 +313,18 @@ def _route_and_dispatch(
     # Dispatch based on target type
     if decision.target_type == "skill":
         meta = skill_registry[decision.target]
-        instructions = load_skill_instructions(meta.path)
+        instructions = _skill_instructions(meta.path)
         skill_ctx = [f"[Skill:{decision.target}]\n{instructions}"]
         return None, skill_ctx, decision
 
     # target_type == "tool"
+    from .tools import TOOL_REGISTRY
+
     tool = TOOL_REGISTRY[decision.target]
     args = tool.extract_args(prompt) or decision.args
-    decision = RoutingDecision(
-        target=decision.target,
-        target_type=decision.target_type,
-        confidence=decision.confidence,
-        args=args,
-        reasoning=decision.reasoning,
-        id=decision.id,
-        timestamp=decision.timestamp,
-    )
-    try:
-        result = gate.run(tool, args)
-        return [result], None, decision
-    except GateError as e:
-        print(str(e), file=sys.stderr)
-        sys.exit(1)
+    if args is not decision.args:
+        decision = dataclasses.replace(decision, args=args)
+    return _run_tool(tool, args, gate), None, decision
 
 
 def _print_json_response(
@@ -238,16 +349,116 @@ def _print_json_response(
             "id": routing.id,
             "timestamp": routing.timestamp,
         }
-    print(json.dumps(payload))
+    _write_stdout_bytes(_json_bytes(payload, newline=True))
+
+
+def _json_bytes(obj: Any, newline: bool = False) -> bytes:
+    """
+    Compact UTF-8 JSON for obj, plus a trailing newline if requested. Uses
+    orjson when installed (pip install ore[fast]), which appends the newline
+    while encoding. The stdlib fallback matches it except for floats in
+    exponent form (json: 1e-05, 1e+16; orjson: 1e-5, 1e16) and
+    non-finite floats (json: NaN, Infinity; orjson: null).
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        return (text + "\n" if newline else text).encode()
+    return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE if newline else None)
+
+
+def _json_loads(raw: str | bytes) -> Any:
+    """Parse JSON text or UTF-8 bytes; orjson when installed, else stdlib json."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+def _write_stdout_bytes(data: bytes) -> None:
+    """Write UTF-8 data to stdout's byte buffer in one call (text layer if it has none)."""
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(data.decode())
+        return
+    out.flush()  # keep ordering with anything already written as text
+    buffer.write(data)
 
 
 def _print_response(response: Response, verbose: bool = False) -> None:
-    """Print a single response to stdout (content + optional metadata)."""
-    print(f"\n[AYA]: {response.content}")
+    """Print a single response to stdout (content + optional metadata) in one write."""
+    parts = [f"\n[AYA]: {response.content}\n"]
     if verbose:
-        print(f"\n[Metadata]: ID {response.id} | Model {response.model_id}")
-        if response.metadata:
-            print(f"  Usage: {response.metadata}")
+        _append_metadata(parts, response)
+    sys.stdout.write("".join(parts))
+
+
+def _append_metadata(parts: List[str], response: Response) -> None:
+    """Append the --verbose metadata block (ID/model, optional usage) to parts."""
+    parts.append(f"\n[Metadata]: ID {response.id} | Model {response.model_id}\n")
+    if response.metadata:
+        parts.append(f"  Usage: {response.metadata}\n")
+
+
+def _is_exit_command(line: str) -> bool:
+    """True if line is quit or exit in any case."""
+    if len(line) != _REPL_EXIT_LEN:
+        return False
+    if line == "quit" or line == "exit":
+        return True  # usual spelling: no lower() copy
+    lo = line.lower()
+    return lo == "quit" or lo == "exit"
+
+
+def _read_stdin_text() -> str:
+    """
+    Read all of piped stdin as text. Reads the binary buffer in one call and
+    decodes once (stdin's own encoding/errors), skipping the text layer's
+    incremental decoder; falls back to read() for streams without a buffer.
+    """
+    stdin = sys.stdin
+    buffer = getattr(stdin, "buffer", None)
+    if buffer is None:
+        return stdin.read()
+    text = buffer.read().decode(stdin.encoding or "utf-8", stdin.errors or "strict")
+    # Match text-mode universal newlines
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_lines() -> Iterator[str]:
+    """Yield stripped REPL input lines until EOF.
+
+    On a TTY this uses input() (readline editing and history); when stdin is
+    piped it iterates sys.stdin directly, still echoing the "You: " prompt.
+    """
+    if sys.stdin.isatty():
+        while True:
+            try:
+                line = input("You: ")
+            except EOFError:
+                print()
+                return
+            yield line.strip()
+    out = sys.stdout
+    for line in sys.stdin:
+        out.write("You: ")
+        out.flush()
+        yield line.strip()
+    out.write("You: \n")
+
+
+def _chunks(gen: Generator[str, None, Response], result: List[Response]):
+    """Yield gen's chunks, then append its return value to result."""
+    result.append((yield from gen))
 
 
 def _stream_turn(
@@ -262,22 +473,145 @@ def _stream_turn(
     gen = engine.execute_stream(
         prompt, session=session, tool_results=tool_results, skill_context=skill_context
     )
-    print("[AYA]: ", end="", flush=True)
+    result: List[Response] = []
+    # Bound once: looked up per chunk otherwise
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    monotonic = time.monotonic
+    write("[AYA]: ")
+    flush()
+    last_flush = monotonic()
+    unflushed = 0
     try:
-        while True:
-            print(next(gen), end="", flush=True)
-    except StopIteration as exc:
-        response = exc.value
-    print()
+        for chunk in _chunks(gen, result):
+            write(chunk)
+            unflushed += 1
+            now = monotonic()
+            if (
+                "\n" in chunk
+                or unflushed >= _STREAM_FLUSH_CHUNKS
+                or now - last_flush >= _STREAM_FLUSH_INTERVAL_S
+            ):
+                flush()
+                last_flush = now
+                unflushed = 0
+    except BaseException:
+        flush()  # show what arrived before a backend error or Ctrl+C
+        raise
+    response = result[0]
+    parts = ["\n"]
     if verbose:
-        print(f"\n[Metadata]: ID {response.id} | Model {response.model_id}")
-        if response.metadata:
-            print(f"  Usage: {response.metadata}")
+        _append_metadata(parts, response)
+    write("".join(parts))
+    flush()
     return response
 
 
+def _resolve_turn_flags(
+    args: argparse.Namespace, skill_registry: Dict[str, SkillMetadata]
+) -> Tuple[Optional[List[str]], Optional[Tool], Dict[str, str]]:
+    """
+    (--skill context, --tool, parsed --tool-arg) for the run; exits 1 on an
+    unknown skill or tool.
+    """
+    return (
+        _get_skill_context(args.skill, skill_registry),
+        _resolve_tool(args.tool),
+        _parse_tool_args(args.tool_arg),
+    )
+
+
+def _turn_context(
+    prompt: str,
+    gate: Gate,
+    verbose: bool,
+    skill_registry: Dict[str, SkillMetadata],
+    routing: Optional[Tuple[Router, List[RoutingTarget]]],
+    skill_context: Optional[List[str]],
+    tool: Optional[Tool],
+    tool_args: Dict[str, str],
+) -> Tuple[Optional[List[ToolResult]], Optional[List[str]], Optional[RoutingDecision]]:
+    """
+    Pre-reasoning context for one turn, shared by single-turn and REPL modes:
+    route the prompt (when routing is set) or run the fixed --tool, and merge
+    any route-selected skill after the explicit --skill context.
+    Returns (tool_results, skill_context, routing decision or None).
+    """
+    if routing is None:
+        tool_results = _run_tool(tool, tool_args, gate) if tool is not None else None
+        return tool_results, skill_context, None
+    tool_results, route_skill_ctx, decision = _route_and_dispatch(
+        prompt, gate, verbose, skill_registry, *routing
+    )
+    if route_skill_ctx:
+        skill_context = (skill_context or []) + route_skill_ctx
+    return tool_results, skill_context, decision
+
+
+def _repl(
+    engine: ORE,
+    args: argparse.Namespace,
+    gate: Gate,
+    skill_registry: Dict[str, SkillMetadata],
+    session: Optional[Session] = None,
+    on_turn_end: Optional[Callable[[Session], None]] = None,
+    routing: Optional[Tuple[Router, List[RoutingTarget]]] = None,
+) -> None:
+    """
+    Shared REPL body for --interactive (session=None, stateless turns) and
+    --conversational (session threaded through every turn). on_turn_end is
+    called with the session after each turn; used for --save-session.
+    routing is the per-run (router, targets) pair when --route is set.
+    """
+    # Resolve --skill / --tool / --tool-arg (and fail on an unknown name)
+    # before the first prompt. --tool is fixed for the run; --skill is looked
+    # up again each turn (one stat), so an edited SKILL.md is picked up on
+    # the next turn.
+    _, tool, tool_args = _resolve_turn_flags(args, skill_registry)
+    for line in _read_lines():
+        if _is_exit_command(line):
+            break
+        tool_results, skill_context, _ = _turn_context(
+            line,
+            gate,
+            args.verbose,
+            skill_registry,
+            routing,
+            _get_skill_context(args.skill, skill_registry),
+            tool,
+            tool_args,
+        )
+        print("--- ORE: Reasoning ---")
+        if args.stream:
+            _stream_turn(
+                engine,
+                line,
+                session,
+                args.verbose,
+                tool_results=tool_results,
+                skill_context=skill_context,
+            )
+        else:
+            response = engine.execute(
+                line,
+                session=session,
+                tool_results=tool_results,
+                skill_context=skill_context,
+            )
+            _print_response(response, verbose=args.verbose)
+        if on_turn_end is not None and session is not None:
+            on_turn_end(session)
+        print()
+
+
+@functools.cache
 def _build_parser() -> argparse.ArgumentParser:
-    """Build the CLI argument parser. Exposed for invariant tests (frozen surface)."""
+    """
+    Build the CLI argument parser. Exposed for invariant tests (frozen surface).
+    Built once per process and reused; parse_args() does not mutate it.
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(description=f"ORE {__version__} CLI")
     parser.add_argument(
         "prompt",
@@ -296,7 +630,7 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--backend",
         type=str,
-        choices=["ollama", "deepseek"],
+        choices=list(_BACKEND_CHOICES),
         default="ollama",
         help="Reasoner backend: ollama (local) or deepseek (API); default ollama",
     )
@@ -431,89 +765,318 @@ def _build_parser() -> argparse.ArgumentParser:
         metavar="PROMPT",
         help="System prompt for the reasoner (default: none)",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse stored responses for identical requests (~/.ore/cache/responses.db)",
+    )
+    parser.add_argument(
+        "--refresh-models",
+        action="store_true",
+        help=(
+            "Re-query Ollama for the default model instead of using the model "
+            "list cached in ~/.ore/cache/models.json"
+        ),
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep the model loaded and answer --via-daemon prompts on ~/.ore/ore.sock",
+    )
+    parser.add_argument(
+        "--via-daemon",
+        action="store_true",
+        help="Send the prompt to a running --daemon instead of starting an engine",
+    )
+    parser.add_argument(
+        "--version",
+        "-V",
+        action="version",
+        version=f"ORE {__version__}",
+        help="Print the ORE version and exit",
+    )
     return parser
 
 
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse argv without argparse for the common case: known flags, single-value
+    options, and at most one positional prompt. Returns None whenever the input
+    needs argparse (help, errors, or any form not in _FAST_OPTIONS) so the
+    caller can fall back; the resulting namespace matches _build_parser().
+    """
+    ns = SimpleNamespace(
+        prompt=None,
+        model=None,
+        backend="ollama",
+        list_models=False,
+        interactive=False,
+        conversational=False,
+        save_session=None,
+        resume_session=None,
+        stream=False,
+        verbose=False,
+        json=False,
+        tool=None,
+        tool_arg=[],
+        list_tools=False,
+        grant=[],
+        route=False,
+        route_threshold=0.5,
+        skill=None,
+        list_skills=False,
+        artifact_out=None,
+        artifact_in=None,
+        system="",
+        cache=False,
+        daemon=False,
+        via_daemon=False,
+        refresh_models=False,
+    )
+    i, n = 0, len(argv)
+    while i < n:
+        token = argv[i]
+        i += 1
+        if not token.startswith("-"):
+            if ns.prompt is not None:
+                return None
+            ns.prompt = token
+            continue
+        spec = _FAST_OPTIONS.get(token)
+        if spec is None:
+            return None
+        dest, kind = spec
+        if kind == "flag":
+            setattr(ns, dest, True)
+            continue
+        if i == n:
+            return None
+        value = argv[i]
+        i += 1
+        if value.startswith("-") and value != "-":
+            return None
+        if kind == "append":
+            getattr(ns, dest).append(value)
+        elif kind == "float":
+            try:
+                ns.route_threshold = float(value)
+            except ValueError:
+                return None
+        elif dest == "backend" and value not in _BACKEND_CHOICES:
+            return None
+        else:
+            setattr(ns, dest, value)
+    return ns
+
+
+def _usage_error(message: str) -> NoReturn:
+    """Print usage + message and exit 2 (argparse contract); parser built only here."""
+    _build_parser().error(message)
+
+
+def _require_prompt(args: argparse.Namespace) -> None:
+    """Fill args.prompt from piped stdin if it was not given; usage error if none."""
+    if args.prompt is not None:
+        return
+    if sys.stdin.isatty():
+        _usage_error(
+            "prompt is required (or use --list-models, --list-tools, --interactive, or --conversational)"
+        )
+    piped = _read_stdin_text().strip()
+    if not piped:
+        _usage_error("stdin was empty; provide a prompt or pipe non-empty input")
+    args.prompt = piped
+
+
+def _is_missing_model(exc: BaseException) -> bool:
+    """True if exc is Ollama's "model not found" error (ResponseError, HTTP 404)."""
+    from ollama import ResponseError
+
+    return isinstance(exc, ResponseError) and exc.status_code == 404
+
+
+def _report_missing_default_model(model_id: str) -> None:
+    """
+    The auto-chosen model is gone from the server: re-query the model list
+    (rewriting ~/.ore/cache/models.json) and tell the user how to continue.
+    """
+    from .models import default_model
+
+    try:
+        replacement = default_model(cached=True, refresh=True)
+    except Exception:
+        replacement = None
+    hint = f"; the next run will use {replacement}" if replacement else ""
+    print(
+        f"Error: model '{model_id}' is not available on the Ollama server "
+        f"(the cached model list was out of date{hint}). Run again, or pass "
+        "--model NAME or --refresh-models.",
+        file=sys.stderr,
+    )
+
+
+def _run_via_daemon(args: argparse.Namespace) -> None:
+    """
+    --via-daemon: forward one prompt to the running daemon and print its reply
+    as a single turn would. No engine, model probe or skill scan in this process.
+    Exits 1 if no daemon is listening or the daemon reports an error.
+    """
+    from .daemon import DaemonError, request
+
+    _require_prompt(args)
+    try:
+        response = request(args.prompt)
+    except DaemonError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+    if args.json:
+        _print_json_response(response)
+    else:
+        _print_response(response, verbose=args.verbose)
+
+
 def run() -> None:
-    parser = _build_parser()
-    args = parser.parse_args()
+    # Fast path: no parser, no engine, no Ollama probe
+    argv = sys.argv[1:]
+    if not _VERSION_FLAGS.isdisjoint(argv):
+        print(f"ORE {__version__}")
+        return
+
+    args = _fast_parse(argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
 
     if args.route and args.tool:
-        parser.error("--route and --tool are mutually exclusive")
+        _usage_error("--route and --tool are mutually exclusive")
     if args.interactive and args.conversational:
-        parser.error("--interactive and --conversational are mutually exclusive")
+        _usage_error("--interactive and --conversational are mutually exclusive")
     if args.interactive and (args.save_session or args.resume_session):
-        parser.error(
+        _usage_error(
             "--interactive cannot be used with --save-session or --resume-session"
         )
 
     # v0.9 artifact validation
     if args.artifact_in is not None:
         if args.prompt is not None:
-            parser.error("--artifact-in and prompt are mutually exclusive")
+            _usage_error("--artifact-in and prompt are mutually exclusive")
         if (
             args.interactive
             or args.conversational
             or args.save_session
             or args.resume_session
         ):
-            parser.error(
+            _usage_error(
                 "--artifact-in is single-turn only; incompatible with REPL modes"
             )
         if args.tool or args.route or args.skill:
-            parser.error(
+            _usage_error(
                 "--artifact-in is mutually exclusive with --tool, --route, --skill"
             )
     if args.artifact_out is not None:
         if args.stream:
-            parser.error("--artifact-out and --stream are mutually exclusive")
+            _usage_error("--artifact-out and --stream are mutually exclusive")
         if (
             args.interactive
             or args.conversational
             or args.save_session
             or args.resume_session
         ):
-            parser.error(
+            _usage_error(
                 "--artifact-out is single-turn only; incompatible with REPL modes"
             )
         if args.json and (args.artifact_out == "-" or args.artifact_out is None):
-            parser.error(
+            _usage_error(
                 "--artifact-out to stdout and --json are mutually exclusive "
                 "(both write to stdout)"
             )
 
+    # Daemon mode: the server takes no prompt; the client only forwards one
+    if args.daemon:
+        if args.via_daemon:
+            _usage_error("--daemon and --via-daemon are mutually exclusive")
+        if args.prompt is not None or args.artifact_in or args.artifact_out:
+            _usage_error("--daemon takes no prompt or artifact")
+        if (
+            args.interactive
+            or args.conversational
+            or args.save_session
+            or args.resume_session
+            or args.json
+            or args.stream
+        ):
+            _usage_error(
+                "--daemon is incompatible with REPL modes, --json and --stream"
+            )
+        if args.tool or args.route or args.skill:
+            _usage_error("--daemon is mutually exclusive with --tool, --route, --skill")
+    if args.via_daemon:
+        if (
+            args.interactive
+            or args.conversational
+            or args.save_session
+            or args.resume_session
+            or args.stream
+            or args.artifact_in
+            or args.artifact_out
+        ):
+            _usage_error(
+                "--via-daemon is single-turn only; incompatible with REPL modes, "
+                "--stream and artifacts"
+            )
+        if args.tool or args.route or args.skill:
+            _usage_error(
+                "--via-daemon is mutually exclusive with --tool, --route, --skill"
+            )
+        if args.model or args.system or args.cache or args.backend != "ollama":
+            _usage_error(
+                "--via-daemon uses the daemon's --model, --backend, --system and "
+                "--cache; pass them to --daemon instead"
+            )
+        if args.grant or args.route_threshold != 0.5:
+            _usage_error(
+                "--grant and --route-threshold have no effect with --via-daemon "
+                "(the daemon runs no tools or routing)"
+            )
+
     if args.list_models:
         if args.backend == "deepseek":
             print(
                 "DeepSeek backend uses --model to specify the model (default: deepseek-chat)."
             )
             sys.exit(0)
-        models = fetch_models()
+        from .models import sorted_models
+
+        models = sorted_models()
         if not models:
             print("No Ollama models found. Install one with e.g. ollama pull llama3.2")
             sys.exit(1)
-        print("Available Ollama models:")
-        for name in sorted(models):
-            print(f"  {name}")
+        sys.stdout.write(
+            "Available Ollama models:\n" + "".join(f"  {name}\n" for name in models)
+        )
         sys.exit(0)
 
     if args.list_tools:
+        from .tools import tool_listing
+
         print("Available tools (use --tool NAME; grant permissions with --grant PERM):")
-        valid_perms = [p.value for p in Permission]
-        for name in sorted(TOOL_REGISTRY.keys()):
-            tool = TOOL_REGISTRY[name]
-            perms = ", ".join(
-                p.value
-                for p in sorted(tool.required_permissions, key=lambda x: x.value)
-            )
+        for name, description, perms in tool_listing():
             req = f" [requires: {perms}]" if perms else " [no permissions]"
             print(f"  {name}{req}")
-            print(f"    {tool.description}")
-        print("\nValid --grant values:", ", ".join(valid_perms))
+            print(f"    {description}")
+        print("\nValid --grant values:", ", ".join(_GRANT_CHOICES))
         sys.exit(0)
 
-    # Build skill registry once at startup (scans ~/.ore/skills/)
-    skill_registry = build_skill_registry()
+    if args.via_daemon:
+        _run_via_daemon(args)
+        return
+
+    # Scan ~/.ore/skills/ once, and only when a flag can use a skill; without
+    # --skill / --route nothing reads the registry, so an empty one stands in.
+    skill_registry: Dict[str, SkillMetadata] = {}
+    if args.skill or args.route or args.list_skills:
+        from .skills import build_skill_registry
+
+        skill_registry = build_skill_registry()
 
     if args.list_skills:
         if not skill_registry:
@@ -529,15 +1092,17 @@ def run() -> None:
         sys.exit(0)
 
     # Parse --grant into Permission set; default-deny
-    valid_perm_values = {p.value for p in Permission}
-    for g in args.grant:
-        if g not in valid_perm_values:
+    allowed: frozenset[Permission] = frozenset()
+    if args.grant:
+        try:
+            allowed = frozenset(_PERM_BY_VALUE[g] for g in args.grant)
+        except KeyError as e:
             print(
-                f"Unknown permission: {g}. Valid: {', '.join(sorted(valid_perm_values))}",
+                f"Unknown permission: {e.args[0]}. "
+                f"Valid: {', '.join(sorted(_GRANT_CHOICES))}",
                 file=sys.stderr,
             )
             sys.exit(1)
-    allowed = frozenset(Permission(g) for g in args.grant)
     gate = Gate(allowed)
 
     # Mode precedence: save/resume → conversational; -c → conversational; else stateless
@@ -545,9 +1110,9 @@ def run() -> None:
     _repl_mode = args.interactive or _conversational
 
     if args.json and args.stream:
-        parser.error("--json and --stream are mutually exclusive")
+        _usage_error("--json and --stream are mutually exclusive")
     if args.json and _repl_mode:
-        parser.error(
+        _usage_error(
             "--json is single-turn only; incompatible with --interactive and --conversational"
         )
 
@@ -555,221 +1120,259 @@ def run() -> None:
     if args.artifact_in is not None:
         _load_artifact_and_set_prompt(args)
 
-    # Single-turn mode requires a prompt; REPL modes do not
-    if not _repl_mode and args.prompt is None:
-        if not sys.stdin.isatty():
-            piped = sys.stdin.read().strip()
-            if not piped:
-                parser.error(
-                    "stdin was empty; provide a prompt or pipe non-empty input"
-                )
-            args.prompt = piped
-        else:
-            parser.error(
-                "prompt is required (or use --list-models, --list-tools, --interactive, or --conversational)"
-            )
+    # Single-turn mode requires a prompt; REPL modes and the daemon do not
+    if not _repl_mode and not args.daemon:
+        _require_prompt(args)
 
     if args.backend == "deepseek":
         model_id = args.model or "deepseek-chat"
     else:
         model_id = args.model
         if model_id is None:
-            model_id = default_model()
+            from .models import default_model
+
+            # Cached list; refreshed in the background once it is an hour old
+            model_id = default_model(cached=True, refresh=args.refresh_models)
             if not model_id:
                 print(
                     "No Ollama models found. Install one with e.g. ollama pull llama3.2"
                 )
                 sys.exit(1)
-    if not _repl_mode and not args.json and args.artifact_out != "-":
+    if (
+        not _repl_mode
+        and not args.daemon
+        and not args.json
+        and args.artifact_out != "-"
+    ):
         print(f"Using model: {model_id}\n")
 
     if args.backend == "deepseek":
+        from .reasoner_deepseek import DeepSeekReasoner
+
         try:
             reasoner = DeepSeekReasoner(model_id=model_id)
         except ValueError as e:
             print(str(e), file=sys.stderr)
             sys.exit(1)
     else:
+        from .reasoner import AyaReasoner
+
         reasoner = AyaReasoner(model_id=model_id)
+    cache = None
+    if args.cache:
+        from .cache import CachingReasoner, ResponseCache
+
+        cache = ResponseCache()
+        reasoner = CachingReasoner(reasoner, cache)
+    from .core import ORE
+
     engine = ORE(reasoner, system_prompt=args.system)
+    routing = (
+        _build_routing(args.route_threshold, skill_registry) if args.route else None
+    )
+
+    # A default model read from the on-disk cache may have been removed (or
+    # belong to another server); report that instead of a traceback
+    try:
+        if args.daemon:
+            from .daemon import DaemonError, bind, serve
 
-    if args.interactive:
-        print(f"ORE {__version__} interactive (model: {model_id})")
-        print("Each turn is stateless. Type quit or exit to leave.\n")
-        while True:
             try:
-                line = input("You: ").strip()
-            except EOFError:
-                print()
-                break
-            if line.lower() in _REPL_EXIT_COMMANDS:
-                break
-            skill_context = _get_skill_context(args.skill, skill_registry)
-            if args.route:
-                tool_results, route_skill_ctx, _ = _route_and_dispatch(
-                    line,
-                    gate,
-                    args.verbose,
-                    skill_registry,
-                    confidence_threshold=args.route_threshold,
-                )
-                # Merge: explicit --skill + route-selected skill
-                if route_skill_ctx:
-                    skill_context = (skill_context or []) + route_skill_ctx
+                sock = bind()
+            except DaemonError as e:
+                print(str(e), file=sys.stderr)
+                sys.exit(1)
+            print(f"ORE {__version__} daemon (model: {model_id})")
+            print(f"Listening on {sock.getsockname()}. Press Ctrl+C to stop.")
+            sys.stdout.flush()
+            serve(engine, sock)
+
+        elif args.interactive:
+            print(f"ORE {__version__} interactive (model: {model_id})")
+            print("Each turn is stateless. Type quit or exit to leave.\n")
+            _repl(engine, args, gate, skill_registry, routing=routing)
+
+        elif _conversational:
+            from .store import FileSessionStore
+
+            store = FileSessionStore()
+            if args.resume_session:
+                try:
+                    session = store.load(args.resume_session)
+                except FileNotFoundError as e:
+                    print(f"Error: {e}")
+                    sys.exit(1)
             else:
-                tool_results = _get_tool_results(args.tool, args.tool_arg or None, gate)
-            print("--- ORE: Reasoning ---")
-            if args.stream:
-                _stream_turn(
-                    engine,
-                    line,
-                    None,
-                    args.verbose,
-                    tool_results=tool_results,
-                    skill_context=skill_context,
+                session = Session()
+            save_name = args.save_session
+            print(
+                f"ORE {__version__} conversational (model: {model_id} | session: {session.id})"
+            )
+            if args.resume_session:
+                print(f"  Resumed: {args.resume_session}")
+            if save_name:
+                print(f"  Saving to: {save_name}")
+            print(
+                "Prior turns are visible to the reasoner. Type quit or exit to leave.\n"
+            )
+            if not save_name:
+                _repl(
+                    engine, args, gate, skill_registry, session=session, routing=routing
                 )
             else:
-                response = engine.execute(
-                    line, tool_results=tool_results, skill_context=skill_context
+                from concurrent.futures import Future, ThreadPoolExecutor
+
+                # Snapshot once; each turn then appends only its new messages.
+                # Appends and compactions run on one background worker (in order)
+                # so disk I/O overlaps with the user typing the next prompt.
+                store.save(session, save_name)
+                saved = compacted = len(session.messages)
+                writer = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="ore-session"
                 )
-                _print_response(response, verbose=args.verbose)
-            print()
+                pending_compaction: Optional[Future] = None
+
+                def _reporter(action: str) -> Callable[[Future], None]:
+                    # Done-callback for writer futures: runs on the writer as
+                    # soon as the job finishes, so a failed append or
+                    # compaction is reported before the user's next turn
+                    def report(f: Future) -> None:
+                        exc = None if f.cancelled() else f.exception()
+                        if exc is not None:
+                            print(
+                                f"Error: could not {action} session '{save_name}': {exc}",
+                                file=sys.stderr,
+                                flush=True,
+                            )
+
+                    return report
+
+                def _compact(s: Session) -> Future:
+                    # Snapshot exactly what has been journaled (a copy, so later
+                    # turns don't race the writer). A newer compaction supersedes
+                    # one still queued, so cancel it rather than write twice.
+                    nonlocal compacted, pending_compaction
+                    if pending_compaction is not None:
+                        pending_compaction.cancel()
+                    snapshot = Session(
+                        messages=s.messages[:saved], id=s.id, created_at=s.created_at
+                    )
+                    pending_compaction = writer.submit(store.save, snapshot, save_name)
+                    pending_compaction.add_done_callback(_reporter("compact"))
+                    compacted = saved
+                    return pending_compaction
+
+                def _append_turn(s: Session) -> None:
+                    nonlocal saved
+                    writer.submit(
+                        store.append, save_name, s.messages[saved:]
+                    ).add_done_callback(_reporter("save turn to"))
+                    saved = len(s.messages)
+                    if saved - compacted >= 2 * _SESSION_COMPACT_TURNS:
+                        _compact(s)  # bound journal replay after a crash
 
-    elif _conversational:
-        store = FileSessionStore()
-        if args.resume_session:
-            try:
-                session = store.load(args.resume_session)
-            except FileNotFoundError as e:
-                print(f"Error: {e}")
-                sys.exit(1)
-        else:
-            session = Session()
-        save_name = args.save_session
-        print(
-            f"ORE {__version__} conversational (model: {model_id} | session: {session.id})"
-        )
-        if args.resume_session:
-            print(f"  Resumed: {args.resume_session}")
-        if save_name:
-            print(f"  Saving to: {save_name}")
-        print("Prior turns are visible to the reasoner. Type quit or exit to leave.\n")
-        try:
-            while True:
                 try:
-                    line = input("You: ").strip()
-                except EOFError:
-                    print()
-                    break
-                if line.lower() in _REPL_EXIT_COMMANDS:
-                    break
-                skill_context = _get_skill_context(args.skill, skill_registry)
-                if args.route:
-                    tool_results, route_skill_ctx, _ = _route_and_dispatch(
-                        line,
+                    _repl(
+                        engine,
+                        args,
                         gate,
-                        args.verbose,
                         skill_registry,
-                        confidence_threshold=args.route_threshold,
-                    )
-                    if route_skill_ctx:
-                        skill_context = (skill_context or []) + route_skill_ctx
-                else:
-                    tool_results = _get_tool_results(
-                        args.tool, args.tool_arg or None, gate
-                    )
-                print("--- ORE: Reasoning ---")
-                if args.stream:
-                    _stream_turn(
-                        engine,
-                        line,
-                        session,
-                        args.verbose,
-                        tool_results=tool_results,
-                        skill_context=skill_context,
-                    )
-                else:
-                    response = engine.execute(
-                        line,
                         session=session,
-                        tool_results=tool_results,
-                        skill_context=skill_context,
+                        on_turn_end=_append_turn,
+                        routing=routing,
                     )
-                    _print_response(response, verbose=args.verbose)
-                if save_name:
-                    store.save(session, save_name)
-                print()
-        finally:
-            if save_name:
-                store.save(session, save_name)
+                finally:
+                    # Sessions are append-only, so a changed length means unsaved
+                    # turns: compact the journal back into <name>.json and fsync
+                    final = None
+                    if len(session.messages) != compacted:
+                        saved = len(session.messages)
+                        final = _compact(session)
+                    writer.shutdown(wait=True)
+                    # Already reported by its callback; a lost exit save is an
+                    # error unless another one is already propagating
+                    if (
+                        sys.exc_info()[0] is None
+                        and final is not None
+                        and not final.cancelled()
+                        and final.exception() is not None
+                    ):
+                        sys.exit(1)
 
-    else:
-        routing_decision: Optional[RoutingDecision] = None
-        skill_context = _get_skill_context(args.skill, skill_registry)
-        if args.route:
-            tool_results, route_skill_ctx, routing_decision = _route_and_dispatch(
+        else:
+            tool_results, skill_context, routing_decision = _turn_context(
                 args.prompt,
                 gate,
                 args.verbose,
                 skill_registry,
-                confidence_threshold=args.route_threshold,
-            )
-            if route_skill_ctx:
-                skill_context = (skill_context or []) + route_skill_ctx
-        else:
-            tool_results = _get_tool_results(args.tool, args.tool_arg or None, gate)
-        if not args.json and args.artifact_out != "-":
-            print(f"--- ORE {__version__}: Reasoning ---")
-        if args.stream:
-            _stream_turn(
-                engine,
-                args.prompt,
-                None,
-                args.verbose,
-                tool_results=tool_results,
-                skill_context=skill_context,
+                routing,
+                *_resolve_turn_flags(args, skill_registry),
             )
-        else:
-            response = engine.execute(
-                args.prompt,
-                tool_results=tool_results,
-                skill_context=skill_context,
-            )
-            # v0.9: when artifact goes to stdout, skip human/json response (stdout is artifact only)
-            if args.artifact_out == "-":
-                pass  # Will print artifact below
-            elif args.json:
-                _print_json_response(response, routing=routing_decision)
+            if not args.json and args.artifact_out != "-":
+                print(f"--- ORE {__version__}: Reasoning ---")
+            if args.stream:
+                _stream_turn(
+                    engine,
+                    args.prompt,
+                    None,
+                    args.verbose,
+                    tool_results=tool_results,
+                    skill_context=skill_context,
+                )
             else:
-                _print_response(response, verbose=args.verbose)
-            # v0.9: emit artifact if requested
-            if args.artifact_out is not None:
-                tool_names = [r.tool_name for r in (tool_results or [])]
-                skill_names: List[str] = []
-                if args.skill:
-                    skill_names.append(args.skill)
-                if (
-                    routing_decision
-                    and routing_decision.target_type == "skill"
-                    and routing_decision.target
-                ):
-                    skill_names.append(routing_decision.target)
-                skill_names = list(dict.fromkeys(skill_names))
-                artifact = ExecutionArtifact.from_response(
-                    response=response,
-                    prompt=args.prompt,
-                    model_id=model_id,
-                    routing=routing_decision,
-                    tools=tool_names if tool_names else None,
-                    skills=skill_names if skill_names else None,
+                response = engine.execute(
+                    args.prompt,
+                    tool_results=tool_results,
+                    skill_context=skill_context,
                 )
-                artifact_json = json.dumps(artifact.to_dict())
+                # v0.9: when artifact goes to stdout, skip human/json response (stdout is artifact only)
                 if args.artifact_out == "-":
-                    print(artifact_json)
+                    pass  # Will print artifact below
+                elif args.json:
+                    _print_json_response(response, routing=routing_decision)
                 else:
-                    try:
-                        out_path = _validate_output_path(args.artifact_out)
-                        out_path.write_text(artifact_json, encoding="utf-8")
-                    except ValueError as e:
-                        print(str(e), file=sys.stderr)
-                        sys.exit(1)
+                    _print_response(response, verbose=args.verbose)
+                # v0.9: emit artifact if requested
+                if args.artifact_out is not None:
+                    tool_names = [r.tool_name for r in (tool_results or [])]
+                    skill_names: List[str] = []
+                    if args.skill:
+                        skill_names.append(args.skill)
+                    if (
+                        routing_decision
+                        and routing_decision.target_type == "skill"
+                        and routing_decision.target
+                        and routing_decision.target != args.skill
+                    ):
+                        skill_names.append(routing_decision.target)
+                    artifact = ExecutionArtifact.from_response(
+                        response=response,
+                        prompt=args.prompt,
+                        model_id=model_id,
+                        routing=routing_decision,
+                        tools=tool_names if tool_names else None,
+                        skills=skill_names if skill_names else None,
+                    )
+                    if args.artifact_out == "-":
+                        _write_stdout_bytes(
+                            _json_bytes(artifact.to_dict(), newline=True)
+                        )
+                    else:
+                        try:
+                            out_path = _validate_output_path(args.artifact_out)
+                            out_path.write_bytes(_json_bytes(artifact.to_dict()))
+                        except ValueError as e:
+                            print(str(e), file=sys.stderr)
+                            sys.exit(1)
+    except Exception as e:
+        if (
+            args.backend != "ollama"
+            or args.model is not None
+            or not _is_missing_model(e)
+        ):
+            raise
+        _report_missing_default_model(model_id)
+        sys.exit(1)
+
+    if cache is not None and args.verbose:
+        print(f"[Cache]: {cache.hits} hit(s), {cache.misses} miss(es)", file=sys.stderr)
@@ -18,6 +18,38 @@ class ORE:
         self.reasoner = reasoner
         self.system_prompt = system_prompt
 
+    @property
+    def system_prompt(self) -> str:
+        return self._system_message.content
+
+    @system_prompt.setter
+    def system_prompt(self, value: str) -> None:
+        # The system message is the same every turn; build it once (and again
+        # only if the prompt is reassigned). Never stored in a session.
+        self._system_message = Message(role="system", content=value)
+
+    def _build_messages(
+        self,
+        user_msg: Message,
+        session: Optional[Session],
+        tool_results: Optional[List[ToolResult]],
+        skill_context: Optional[List[str]],
+    ) -> List[Message]:
+        """
+        Message list for one turn, built in a single expression:
+        [system] + [skill_context as system] + [tool_results as user]
+        + session.messages + [user].
+        """
+        if session is None and not skill_context and not tool_results:
+            return [self._system_message, user_msg]  # plain one-shot turn
+        return [
+            self._system_message,
+            *[Message(role="system", content=i) for i in skill_context or ()],
+            *[Message(role="user", content=r.rendered) for r in tool_results or ()],
+            *(session.messages if session is not None else ()),
+            user_msg,
+        ]
+
     def execute(
         self,
         user_prompt: str,
@@ -41,22 +73,7 @@ class ORE:
         The session is an explicit argument — there is no hidden state.
         """
         user_msg = Message(role="user", content=user_prompt)
-
-        messages = [Message(role="system", content=self.system_prompt)]
-        if skill_context:
-            for instruction in skill_context:
-                messages.append(Message(role="system", content=instruction))
-        if tool_results:
-            for r in tool_results:
-                messages.append(
-                    Message(
-                        role="user",
-                        content=f"[Tool:{r.tool_name}]\n{r.output}",
-                    )
-                )
-        if session is not None:
-            messages += session.messages
-        messages.append(user_msg)
+        messages = self._build_messages(user_msg, session, tool_results, skill_context)
 
         response = self.reasoner.reason(messages)
 
@@ -78,22 +95,7 @@ class ORE:
         Skill context and tool results injected same as execute().
         """
         user_msg = Message(role="user", content=user_prompt)
-
-        messages = [Message(role="system", content=self.system_prompt)]
-        if skill_context:
-            for instruction in skill_context:
-                messages.append(Message(role="system", content=instruction))
-        if tool_results:
-            for r in tool_results:
-                messages.append(
-                    Message(
-                        role="user",
-                        content=f"[Tool:{r.tool_name}]\n{r.output}",
-                    )
-                )
-        if session is not None:
-            messages += session.messages
-        messages.append(user_msg)
+        messages = self._build_messages(user_msg, session, tool_results, skill_context)
 
         response = yield from self.reasoner.stream_reason(messages)
 
@@ -0,0 +1,184 @@
+"""
+Daemon mode (--daemon / --via-daemon).
+One long-lived process keeps the reasoner client and engine warm and answers
+prompts over a Unix socket, so scripts that call ORE repeatedly skip the
+interpreter start-up and client set-up on every call.
+
+Protocol: one connection per prompt. The client sends a single JSON line
+{"prompt": "..."}; the daemon replies with a single JSON line holding the
+--json payload keys (id, model_id, content, timestamp, metadata), or
+{"error": "..."} if the turn failed. The engine is unaware of the daemon.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from .types import Response
+
+if TYPE_CHECKING:
+    from .core import ORE
+
+# Upper bound on one request/response line
+_MAX_LINE_BYTES = 16 * 1024 * 1024
+
+# Seconds a connected client may stall reading or writing before the daemon
+# drops it and moves on to the next connection (the turn itself is not timed)
+_CONNECTION_TIMEOUT_S = 30.0
+
+
+class DaemonError(Exception):
+    """No daemon is listening, or it returned an error instead of a response."""
+
+
+def default_socket_path() -> Path:
+    return Path.home() / ".ore" / "ore.sock"
+
+
+def _read_line(conn: socket.socket) -> bytes:
+    """Read bytes up to the first newline (or EOF); newline not included."""
+    buf = bytearray()
+    while b"\n" not in buf:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        buf += chunk
+        if len(buf) > _MAX_LINE_BYTES:
+            raise ValueError("request too large")
+    return bytes(buf.split(b"\n", 1)[0])
+
+
+def _response_to_dict(response: Response) -> dict:
+    return {
+        "id": response.id,
+        "model_id": response.model_id,
+        "content": response.content,
+        "timestamp": response.timestamp,
+        "metadata": response.metadata,
+    }
+
+
+def _unix_socket() -> socket.socket:
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonError("Daemon mode requires Unix domain sockets")
+    return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+
+def bind(path: Path | None = None) -> socket.socket:
+    """
+    Create the listening socket at path (default ~/.ore/ore.sock), readable
+    only by the current user. A leftover socket file from a daemon that is no
+    longer running is replaced. Raises DaemonError if one is still listening
+    or the socket cannot be created (path too long, no permission).
+    """
+    path = path or default_socket_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        raise DaemonError(f"Cannot create {path.parent}: {e}") from None
+    if path.exists():
+        probe = _unix_socket()
+        try:
+            probe.connect(str(path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            path.unlink(missing_ok=True)  # stale
+        except OSError as e:
+            raise DaemonError(f"Cannot probe existing socket at {path}: {e}") from None
+        else:
+            raise DaemonError(f"An ORE daemon is already listening at {path}")
+        finally:
+            probe.close()
+    sock = _unix_socket()
+    old_umask = os.umask(0o177)
+    try:
+        sock.bind(str(path))
+        sock.listen()
+    except OSError as e:
+        sock.close()
+        raise DaemonError(f"Cannot listen on {path}: {e}") from None
+    finally:
+        os.umask(old_umask)
+    return sock
+
+
+def serve(
+    engine: ORE,
+    sock: socket.socket,
+    max_requests: Optional[int] = None,
+    timeout: float = _CONNECTION_TIMEOUT_S,
+) -> None:
+    """
+    Answer prompts on sock one connection at a time until interrupted (or
+    after max_requests connections). Each prompt is a stateless single turn.
+    A client that sends or reads nothing for timeout seconds is dropped, so
+    one stalled connection cannot block the rest. The socket is closed and
+    its file removed on return.
+    """
+    path = sock.getsockname()
+    handled = 0
+    try:
+        while max_requests is None or handled < max_requests:
+            conn, _ = sock.accept()
+            with conn:
+                conn.settimeout(timeout)
+                try:
+                    request = json.loads(_read_line(conn))
+                    response = engine.execute(request["prompt"])
+                    reply = _response_to_dict(response)
+                except Exception as e:  # report to the client, keep serving
+                    reply = {"error": f"{type(e).__name__}: {e}"}
+                try:
+                    conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+                except OSError:
+                    pass  # client went away
+            handled += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sock.close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def request(prompt: str, path: Path | None = None) -> Response:
+    """
+    Send prompt to the daemon at path (default ~/.ore/ore.sock) and return its
+    Response. Raises DaemonError if no daemon is listening or the turn failed.
+    """
+    path = path or default_socket_path()
+    try:
+        with _unix_socket() as conn:
+            conn.connect(str(path))
+            conn.sendall(json.dumps({"prompt": prompt}).encode("utf-8") + b"\n")
+            raw = _read_line(conn)
+    except (FileNotFoundError, ConnectionRefusedError):
+        raise DaemonError(
+            f"No ORE daemon listening at {path}; start one with --daemon"
+        ) from None
+    except PermissionError:
+        raise DaemonError(
+            f"Permission denied connecting to ORE daemon at {path}"
+        ) from None
+    except ValueError:  # _read_line
+        raise DaemonError("ORE daemon reply too large") from None
+    except OSError as e:
+        raise DaemonError(f"ORE daemon connection failed: {e}") from None
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        raise DaemonError("ORE daemon closed the connection without a reply") from None
+    if "error" in data:
+        raise DaemonError(f"ORE daemon error: {data['error']}")
+    return Response(
+        content=data["content"],
+        model_id=data["model_id"],
+        id=data["id"],
+        timestamp=data["timestamp"],
+        metadata=data["metadata"],
+    )
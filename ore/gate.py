@@ -24,13 +24,25 @@ class Permission(str, Enum):
     NETWORK = "network"
 
 
+# One bit per Permission; a permission set becomes an int for the gate check
+_BIT = {p: 1 << i for i, p in enumerate(Permission)}
+
+
+def permission_mask(permissions: frozenset[Permission]) -> int:
+    """Bitmask of permissions (see Gate.check)."""
+    mask = 0
+    for p in permissions:
+        mask |= _BIT[p]
+    return mask
+
+
 class GateError(Exception):
     """Raised when a tool is denied by the gate (missing permissions)."""
 
     def __init__(self, tool_name: str, missing: frozenset[Permission]) -> None:
         self.tool_name = tool_name
         self.missing = missing
-        names = ", ".join(p.value for p in sorted(missing, key=lambda x: x.value))
+        names = ", ".join(sorted(p.value for p in missing))
         super().__init__(f"Tool '{tool_name}' denied: missing permissions: {names}")
 
 
@@ -42,15 +54,16 @@ class Gate:
 
     def __init__(self, allowed_permissions: frozenset[Permission]) -> None:
         self._allowed = allowed_permissions
+        self._allowed_mask = permission_mask(allowed_permissions)
 
     def check(self, tool: "Tool") -> None:
         """
         Raise GateError if tool requires any permission not in allowed set.
-        Tools with empty required_permissions always pass.
+        Tools with empty required_permissions always pass. Compares cached
+        bitmasks; the missing set is only built when denying.
         """
-        missing = tool.required_permissions - self._allowed
-        if missing:
-            raise GateError(tool.name, missing)
+        if tool.required_mask & ~self._allowed_mask:
+            raise GateError(tool.name, tool.required_permissions - self._allowed)
 
     def run(self, tool: "Tool", args: Dict[str, str]) -> ToolResult:
         """
@@ -58,13 +71,12 @@ class Gate:
         execution_time_ms and checked_permissions.
         """
         self.check(tool)
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         result = tool.run(args)
-        elapsed_ms = (time.perf_counter() - start) * 1000.0
-        result.metadata.setdefault("execution_time_ms", elapsed_ms)
+        elapsed_ns = time.perf_counter_ns() - start
+        result.metadata.setdefault("execution_time_ms", elapsed_ns / 1_000_000)
         result.metadata.setdefault(
-            "checked_permissions",
-            [p.value for p in sorted(tool.required_permissions, key=lambda x: x.value)],
+            "checked_permissions", list(tool.sorted_permission_values)
         )
         return result
 
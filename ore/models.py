@@ -2,44 +2,169 @@
 Ollama model discovery: fetch available models from the local (or configured) server.
 """
 
-from typing import List
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 from ollama import Client
 
 # Preferred base names (no tag) in order when auto-choosing a default
 PREFERRED_MODELS = ("llama3.2", "llama3.1", "llama3", "mistral", "llama2", "qwen2.5")
 
+# cached_models(): on-disk model lists older than this are refreshed in the
+# background (the stale list is still returned)
+MODELS_CACHE_TTL_S = 3600.0
+
+# ollama.Client's server when neither host nor $OLLAMA_HOST is given
+_DEFAULT_OLLAMA_HOST = "http://127.0.0.1:11434"
+
+# fetch_models(): the in-process list is re-queried after this long, so a
+# long-running process (e.g. --daemon) eventually sees newly pulled models
+FETCH_CACHE_TTL_S = 60.0
+
 
 def fetch_models(host: str | None = None) -> List[str]:
     """
     Return full list of available Ollama model names as returned by the server
     (e.g. ['llama3.2:latest', 'mistral:latest']). Use these for --model and chat().
+
+    The server is queried at most once per host per FETCH_CACHE_TTL_S window;
+    later calls return a fresh copy of the cached list. Call
+    clear_model_cache() to re-query now.
+    """
+    window = int(time.monotonic() // FETCH_CACHE_TTL_S)
+    return list(_list_model_names(host, window))
+
+
+def sorted_models(host: str | None = None) -> List[str]:
+    """fetch_models() in sorted order (as shown by --list-models)."""
+    return sorted(fetch_models(host))
+
+
+def cached_models(host: str | None = None, refresh: bool = False) -> List[str]:
+    """
+    Model names from ~/.ore/cache/models.json (stale-while-revalidate), so the
+    CLI can pick a default model without waiting on the server. A list older
+    than MODELS_CACHE_TTL_S is returned as is while a background thread
+    re-queries the server. With refresh=True, or when nothing usable is
+    cached, the server is queried now (fetch_models) and the file rewritten.
+    Empty lists are never cached.
+    """
+    if not refresh:
+        entry = _read_models_cache(host)
+        if entry is not None:
+            names, fetched_at = entry
+            if time.time() - fetched_at > MODELS_CACHE_TTL_S:
+                threading.Thread(
+                    target=_refresh_models_cache, args=(host,), daemon=True
+                ).start()
+            return names
+    names = fetch_models(host)
+    if names:
+        _write_models_cache(host, names)
+    return names
+
+
+def _models_cache_path() -> Path:
+    return Path.home() / ".ore" / "cache" / "models.json"
+
+
+def _models_cache_key(host: str | None) -> str:
+    """
+    The server a Client(host) talks to, so each server keeps its own cached
+    list: host, else $OLLAMA_HOST (read by ollama.Client), else the default.
     """
-    client = Client(host=host) if host else Client()
-    resp = client.list()
+    return host or os.environ.get("OLLAMA_HOST") or _DEFAULT_OLLAMA_HOST
+
+
+def _read_models_cache(host: str | None) -> Optional[Tuple[List[str], float]]:
+    """(names, fetched_at) cached for host, or None if missing or unreadable."""
+    try:
+        data = json.loads(_models_cache_path().read_text(encoding="utf-8"))
+        entry = data[_models_cache_key(host)]
+        names = [n for n in entry["models"] if isinstance(n, str)]
+        fetched_at = float(entry["fetched_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return (names, fetched_at) if names else None
+
+
+def _write_models_cache(host: str | None, names: List[str]) -> None:
+    """Record names for host; written to a temp file and renamed into place."""
+    path = _models_cache_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            data = {}
+    except (OSError, ValueError):
+        data = {}
+    data[_models_cache_key(host)] = {"fetched_at": time.time(), "models": list(names)}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # cache is best-effort
+
+
+def _refresh_models_cache(host: str | None) -> None:
+    """Background re-query for cached_models(); keeps the stale file on failure."""
+    try:
+        names = list(_list_model_names.__wrapped__(host, 0))
+    except Exception:
+        return
+    if names:
+        _write_models_cache(host, names)
+
+
+def clear_model_cache() -> None:
+    """Drop cached model lists and clients; the next fetch_models() re-queries."""
+    _list_model_names.cache_clear()
+    _client.cache_clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _client(host: str | None) -> Client:
+    """One Ollama client per host, reused across re-queries."""
+    return Client(host=host) if host else Client()
+
+
+@functools.lru_cache(maxsize=8)
+def _list_model_names(host: str | None, window: int) -> Tuple[str, ...]:
+    """
+    Query the Ollama server for model names (cached; see fetch_models).
+    window is the TTL bucket: a new value misses the cache and re-queries.
+    """
+    resp = _client(host).list()
     models = getattr(resp, "models", None) or []
     names = []
     for m in models:
         raw = getattr(m, "model", None)
         if raw and isinstance(raw, str):
             names.append(raw)
-    return names
+    return tuple(names)
 
 
-def default_model(host: str | None = None) -> str | None:
+def default_model(
+    host: str | None = None, cached: bool = False, refresh: bool = False
+) -> str | None:
     """
     Pick a default model: first from PREFERRED_MODELS that is available, else first available.
     Returns the full model name (e.g. llama3.2:latest) for use with chat(). None if none installed.
+    cached=True reads the list through cached_models() (refresh forces a re-query).
     """
-    available = fetch_models(host)
+    available = cached_models(host, refresh) if cached else fetch_models(host)
     if not available:
         return None
     # Build base name -> first full name (e.g. "llama3.2" -> "llama3.2:latest")
     base_to_full: dict[str, str] = {}
     for full in available:
-        base = full.split(":")[0] if ":" in full else full
-        if base not in base_to_full:
-            base_to_full[base] = full
+        base_to_full.setdefault(full.partition(":")[0], full)
     for preferred in PREFERRED_MODELS:
         if preferred in base_to_full:
             return base_to_full[preferred]
@@ -8,6 +8,45 @@ from typing import Generator, List
 
 from .types import Message, Response
 
+# Streaming: with flush_bytes > 0, coalesce backend chunks until that much
+# text is buffered or this long has passed since the last yield (checked as
+# each chunk arrives). The default, 0, yields every chunk as it arrives;
+# the CLI batches its own terminal flushes.
+STREAM_FLUSH_BYTES = 0
+STREAM_FLUSH_INTERVAL_S = 0.01
+
+
+class _ChunkBuffer:
+    """Coalesces streamed text so consumers see fewer, larger chunks."""
+
+    def __init__(self, flush_bytes: int) -> None:
+        self._flush_bytes = flush_bytes
+        self._parts: list[str] = []
+        self._size = 0
+        self._last = time.monotonic()
+
+    def add(self, text: str) -> str:
+        """Buffer text; return the coalesced chunk when one is due, else ""."""
+        if self._flush_bytes <= 0:
+            return text  # pass-through
+        self._parts.append(text)
+        self._size += len(text)
+        now = time.monotonic()
+        if (
+            self._size >= self._flush_bytes
+            or now - self._last >= STREAM_FLUSH_INTERVAL_S
+        ):
+            self._last = now
+            return self.drain()
+        return ""
+
+    def drain(self) -> str:
+        """Return and clear whatever is buffered."""
+        out = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        return out
+
 
 class Reasoner(ABC):
     """Abstract interface for a reasoning backend; v0.1 uses AyaReasoner (Ollama)."""
@@ -24,47 +63,60 @@ class Reasoner(ABC):
         return response
 
 
+def _add_eval_stats(metadata: dict, raw: object) -> None:
+    """Copy Ollama's eval counters/durations from a (chunk) response, if present."""
+    if (val := getattr(raw, "eval_count", None)) is not None:
+        metadata["eval_count"] = val
+    if (val := getattr(raw, "prompt_eval_count", None)) is not None:
+        metadata["prompt_eval_count"] = val
+    if (val := getattr(raw, "eval_duration", None)) is not None:
+        metadata["eval_duration"] = val
+    if (val := getattr(raw, "prompt_eval_duration", None)) is not None:
+        metadata["prompt_eval_duration"] = val
+
+
+def _add_token_totals(metadata: dict) -> None:
+    """Normalized token keys for AIA (same shape as DeepSeek/OpenAI usage)."""
+    if "prompt_eval_count" in metadata:
+        metadata["prompt_tokens"] = metadata["prompt_eval_count"]
+    if "eval_count" in metadata:
+        metadata["completion_tokens"] = metadata["eval_count"]
+    if "prompt_tokens" in metadata and "completion_tokens" in metadata:
+        metadata["total_tokens"] = (
+            metadata["prompt_tokens"] + metadata["completion_tokens"]
+        )
+
+
 class AyaReasoner(Reasoner):
     """Default reasoner: wraps Ollama chat for the ORE loop. No persona here—consumers provide it (e.g. CLI via `--system`)."""
 
-    def __init__(self, model_id: str = "llama2") -> None:
-        from ollama import Client
+    def __init__(
+        self,
+        model_id: str = "llama2",
+        flush_bytes: int = STREAM_FLUSH_BYTES,
+        host: str | None = None,
+    ) -> None:
+        # Same per-host client (and connection pool) models.py lists with;
+        # imported here so `import ore.reasoner` stays free of ollama
+        from .models import _client
 
-        self._client = Client()
+        self._client = _client(host)
         self.model_id = model_id
+        self.flush_bytes = flush_bytes
 
     def reason(self, messages: List[Message]) -> Response:
-        # Convert ORE Message objects to Ollama API format (role + content only)
-        payload = [{"role": m.role, "content": m.content} for m in messages]
+        # Ollama API format (role + content only); cached per Message
+        payload = [m.wire for m in messages]
 
         start = time.perf_counter()
         raw = self._client.chat(model=self.model_id, messages=payload)
         duration_ms = int((time.perf_counter() - start) * 1000)
 
         # Ollama ChatResponse: message.content; optional eval_count, prompt_eval_count, eval_duration
-        msg = getattr(raw, "message", None)
-        content = (
-            msg.content if hasattr(msg, "content") else (msg or {}).get("content", "")
-        ) or ""
+        content = getattr(getattr(raw, "message", None), "content", "") or ""
         metadata: dict = {}
-        for key in (
-            "eval_count",
-            "prompt_eval_count",
-            "eval_duration",
-            "prompt_eval_duration",
-        ):
-            val = getattr(raw, key, None)
-            if val is not None:
-                metadata[key] = val
-        # Normalized token keys for AIA (same shape as DeepSeek/OpenAI usage)
-        if "prompt_eval_count" in metadata:
-            metadata["prompt_tokens"] = metadata["prompt_eval_count"]
-        if "eval_count" in metadata:
-            metadata["completion_tokens"] = metadata["eval_count"]
-        if "prompt_tokens" in metadata and "completion_tokens" in metadata:
-            metadata["total_tokens"] = (
-                metadata["prompt_tokens"] + metadata["completion_tokens"]
-            )
+        _add_eval_stats(metadata, raw)
+        _add_token_totals(metadata)
 
         return Response(
             content=content,
@@ -74,10 +126,12 @@ class AyaReasoner(Reasoner):
         )
 
     def stream_reason(self, messages: List[Message]) -> Generator[str, None, Response]:
-        payload = [{"role": m.role, "content": m.content} for m in messages]
+        payload = [m.wire for m in messages]
         full_content: list[str] = []
         metadata: dict = {}
+        buf = _ChunkBuffer(self.flush_bytes)
         start = time.perf_counter()
+        chunk = None
         for chunk in self._client.chat(
             model=self.model_id, messages=payload, stream=True
         ):
@@ -85,25 +139,16 @@ class AyaReasoner(Reasoner):
             text = (getattr(msg, "content", None) or "") if msg else ""
             if text:
                 full_content.append(text)
-                yield text
-            for key in (
-                "eval_count",
-                "prompt_eval_count",
-                "eval_duration",
-                "prompt_eval_duration",
-            ):
-                val = getattr(chunk, key, None)
-                if val is not None:
-                    metadata[key] = val
-        # Normalized token keys for AIA (same shape as DeepSeek/OpenAI usage)
-        if "prompt_eval_count" in metadata:
-            metadata["prompt_tokens"] = metadata["prompt_eval_count"]
-        if "eval_count" in metadata:
-            metadata["completion_tokens"] = metadata["eval_count"]
-        if "prompt_tokens" in metadata and "completion_tokens" in metadata:
-            metadata["total_tokens"] = (
-                metadata["prompt_tokens"] + metadata["completion_tokens"]
-            )
+                out = buf.add(text)
+                if out:
+                    yield out
+        tail = buf.drain()
+        if tail:
+            yield tail
+        # Ollama reports eval stats only on the final (done) chunk
+        if chunk is not None:
+            _add_eval_stats(metadata, chunk)
+        _add_token_totals(metadata)
         duration_ms = int((time.perf_counter() - start) * 1000)
         return Response(
             content="".join(full_content),
@@ -3,15 +3,17 @@ DeepSeek reasoner: OpenAI-compatible API at api.deepseek.com.
 Uses DEEPSEEK_API_KEY env var; fails with a clear error if missing.
 """
 
+import functools
 import os
 import time
-from typing import Generator, List
+from typing import TYPE_CHECKING, Generator, List
 
-from openai import OpenAI
-
-from .reasoner import Reasoner
+from .reasoner import STREAM_FLUSH_BYTES, Reasoner, _ChunkBuffer
 from .types import Message, Response
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 
 def _get_api_key() -> str:
     """Read API key from DEEPSEEK_API_KEY; raise if missing."""
@@ -23,6 +25,27 @@ def _get_api_key() -> str:
     return key
 
 
+def _add_usage(metadata: dict, raw: object) -> None:
+    """Copy token counts from a completion (or final chunk) usage, if present."""
+    usage = getattr(raw, "usage", None)
+    if usage is None:
+        return
+    if getattr(usage, "prompt_tokens", None) is not None:
+        metadata["prompt_tokens"] = usage.prompt_tokens
+    if getattr(usage, "completion_tokens", None) is not None:
+        metadata["completion_tokens"] = usage.completion_tokens
+    if getattr(usage, "total_tokens", None) is not None:
+        metadata["total_tokens"] = usage.total_tokens
+
+
+@functools.lru_cache(maxsize=8)
+def _openai_client(api_key: str, base_url: str) -> "OpenAI":
+    """One client (and connection pool) per key and endpoint, shared by reasoners."""
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
 class DeepSeekReasoner(Reasoner):
     """
     Reasoner implementation using the DeepSeek API (OpenAI-compatible).
@@ -34,16 +57,17 @@ class DeepSeekReasoner(Reasoner):
         model_id: str = "deepseek-chat",
         api_key: str | None = None,
         base_url: str = "https://api.deepseek.com",
+        flush_bytes: int = STREAM_FLUSH_BYTES,
     ) -> None:
         self.model_id = model_id
-        self._client = OpenAI(
-            api_key=api_key if api_key is not None else _get_api_key(),
-            base_url=base_url,
+        self.flush_bytes = flush_bytes
+        self._client = _openai_client(
+            api_key if api_key is not None else _get_api_key(), base_url
         )
 
     def reason(self, messages: List[Message]) -> Response:
         """Produce a single response from the given message list."""
-        payload = [{"role": m.role, "content": m.content} for m in messages]
+        payload = [m.wire for m in messages]
         start = time.perf_counter()
         completion = self._client.chat.completions.create(
             model=self.model_id,
@@ -53,14 +77,7 @@ class DeepSeekReasoner(Reasoner):
         choice = completion.choices[0] if completion.choices else None
         content = (choice.message.content or "") if choice and choice.message else ""
         metadata: dict = {}
-        if getattr(completion, "usage", None) is not None:
-            usage = completion.usage
-            if getattr(usage, "prompt_tokens", None) is not None:
-                metadata["prompt_tokens"] = usage.prompt_tokens
-            if getattr(usage, "completion_tokens", None) is not None:
-                metadata["completion_tokens"] = usage.completion_tokens
-            if getattr(usage, "total_tokens", None) is not None:
-                metadata["total_tokens"] = usage.total_tokens
+        _add_usage(metadata, completion)
         return Response(
             content=content,
             model_id=self.model_id,
@@ -70,7 +87,7 @@ class DeepSeekReasoner(Reasoner):
 
     def stream_reason(self, messages: List[Message]) -> Generator[str, None, Response]:
         """Stream response chunks, then return the full Response."""
-        payload = [{"role": m.role, "content": m.content} for m in messages]
+        payload = [m.wire for m in messages]
         start = time.perf_counter()
         stream = self._client.chat.completions.create(
             model=self.model_id,
@@ -79,20 +96,21 @@ class DeepSeekReasoner(Reasoner):
         )
         full_content: list[str] = []
         metadata: dict = {}
+        buf = _ChunkBuffer(self.flush_bytes)
+        chunk = None
         for chunk in stream:
             if chunk.choices and chunk.choices[0].delta.content is not None:
                 text = chunk.choices[0].delta.content
                 full_content.append(text)
-                yield text
-            # Last chunk may carry usage in some implementations
-            if getattr(chunk, "usage", None) is not None:
-                usage = chunk.usage
-                if getattr(usage, "prompt_tokens", None) is not None:
-                    metadata["prompt_tokens"] = usage.prompt_tokens
-                if getattr(usage, "completion_tokens", None) is not None:
-                    metadata["completion_tokens"] = usage.completion_tokens
-                if getattr(usage, "total_tokens", None) is not None:
-                    metadata["total_tokens"] = usage.total_tokens
+                out = buf.add(text)
+                if out:
+                    yield out
+        tail = buf.drain()
+        if tail:
+            yield tail
+        # Only the last chunk may carry usage (some implementations)
+        if chunk is not None:
+            _add_usage(metadata, chunk)
         duration_ms = int((time.perf_counter() - start) * 1000)
         return Response(
             content="".join(full_content),
@@ -5,8 +5,10 @@ Router selects a target (tool or skill) from user prompt via rules/keywords.
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Dict, List, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Dict, List, Tuple, TYPE_CHECKING
 
 from .types import RoutingDecision, RoutingTarget
 
@@ -19,6 +21,9 @@ if TYPE_CHECKING:
 # Tie-break: among equal confidence, sort by target name (asc) and pick first.
 DEFAULT_CONFIDENCE_THRESHOLD = 0.5
 
+# CLI --route: distinct prompts whose routing decision is kept for the run
+_ROUTE_MEMO_SIZE = 128
+
 # Test-only routing target: high-confidence hint for deterministic tests.
 # name must match a key in TOOL_REGISTRY (e.g. "echo"). Use in tests by
 # passing [TEST_ROUTING_TARGET] or merging with build_targets_from_registry().
@@ -49,6 +54,38 @@ def build_targets_from_registry(registry: Dict[str, "Tool"]) -> List[RoutingTarg
     return targets
 
 
+# One target's hints for matching: (name, ((hint_lower, len(hint), hint), ...))
+# with hints longest first, so the first hit is the target's best match
+_HintTable = Tuple[Tuple[str, Tuple[Tuple[str, int, str], ...]], ...]
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_hints(
+    key: Tuple[Tuple[str, Tuple[str, ...]], ...],
+) -> Tuple[int, int, _HintTable]:
+    """
+    Preprocess (name, hints) pairs once per target set: lowercase each hint,
+    order hints longest first, and find the longest hint length (at least 1)
+    and shortest non-empty lowercased length (0 = none).
+    """
+    max_hint_len = 1
+    min_hint_len = 0
+    table = []
+    for name, hints in key:
+        entries = []
+        for h in hints:
+            hint_lower = h.lower()
+            if len(h) > max_hint_len:
+                max_hint_len = len(h)
+            n = len(hint_lower)
+            if n and (not min_hint_len or n < min_hint_len):
+                min_hint_len = n
+            entries.append((hint_lower, len(h), h))
+        entries.sort(key=lambda e: e[1], reverse=True)  # stable: ties keep order
+        table.append((name, tuple(entries)))
+    return max_hint_len, min_hint_len, tuple(table)
+
+
 class Router(ABC):
     """Abstract router: prompt + targets -> RoutingDecision. No LLM."""
 
@@ -101,22 +138,29 @@ class RuleRouter(Router):
                 reasoning="Empty prompt.",
             )
 
-        # Compute best match length per target (read-only over targets)
-        max_hint_len = 1
-        for t in targets:
-            for h in t.hints:
-                if len(h) > max_hint_len:
-                    max_hint_len = len(h)
-
-        best: List[tuple[float, str, int]] = []  # (confidence, name, match_len)
-        for t in targets:
-            best_len = 0
-            for h in t.hints:
-                if h.lower() in prompt_lower and len(h) > best_len:
-                    best_len = len(h)
-            if best_len > 0:
-                confidence = min(1.0, best_len / max_hint_len)
-                best.append((confidence, t.name, best_len))
+        # Hints lowercased and ordered once per target set (targets are only read)
+        max_hint_len, min_hint_len, table = _compile_hints(
+            tuple((t.name, tuple(t.hints)) for t in targets)
+        )
+
+        # No hint fits in a shorter prompt: skip the substring scan
+        if not min_hint_len or len(prompt_lower) < min_hint_len:
+            return RoutingDecision(
+                target=None,
+                target_type="fallback",
+                confidence=0.0,
+                args={},
+                reasoning="No hint matched the prompt.",
+            )
+
+        # (confidence, name, target, matched hint): the winner needs no re-scan
+        best: List[tuple[float, str, RoutingTarget, str]] = []
+        for t, (name, hints) in zip(targets, table):
+            for hint_lower, hint_len, hint in hints:
+                if hint_len and hint_lower in prompt_lower:
+                    confidence = min(1.0, hint_len / max_hint_len)
+                    best.append((confidence, name, t, hint))
+                    break
 
         if not best:
             return RoutingDecision(
@@ -129,7 +173,7 @@ class RuleRouter(Router):
 
         # Deterministic tie-break: sort by confidence desc, then name asc
         best.sort(key=lambda x: (-x[0], x[1]))
-        top_confidence, top_name, top_len = best[0]
+        top_confidence, top_name, chosen, matched_hint = best[0]
         if top_confidence < self.confidence_threshold:
             return RoutingDecision(
                 target=None,
@@ -140,11 +184,6 @@ class RuleRouter(Router):
                 f"({top_confidence:.2f} < {self.confidence_threshold}).",
             )
 
-        # Find the target to get reasoning (by name)
-        chosen = next(t for t in targets if t.name == top_name)
-        matched_hint = next(
-            h for h in chosen.hints if h.lower() in prompt_lower and len(h) == top_len
-        )
         return RoutingDecision(
             target=top_name,
             target_type=chosen.target_type,
@@ -152,3 +191,32 @@ class RuleRouter(Router):
             args={},  # CLI will call tool.extract_args(prompt) for the chosen tool
             reasoning=f"Matched hint \"{matched_hint}\" for {chosen.target_type} '{top_name}'.",
         )
+
+
+class _MemoRouter(Router):
+    """
+    Per-run CLI Router wrapper that memoizes route() by prompt (LRU, _ROUTE_MEMO_SIZE).
+    Valid because the threshold and targets are fixed for a run. Each call
+    returns a new RoutingDecision, so ids and timestamps stay per-turn.
+    """
+
+    def __init__(self, router: Router) -> None:
+        self._router = router
+        self._memo: OrderedDict[str, RoutingDecision] = OrderedDict()
+
+    def route(self, prompt: str, targets: List[RoutingTarget]) -> RoutingDecision:
+        decision = self._memo.get(prompt)
+        if decision is None:
+            decision = self._router.route(prompt, targets)
+            self._memo[prompt] = decision
+            if len(self._memo) > _ROUTE_MEMO_SIZE:
+                self._memo.popitem(last=False)
+        else:
+            self._memo.move_to_end(prompt)
+        return RoutingDecision(
+            target=decision.target,
+            target_type=decision.target_type,
+            confidence=decision.confidence,
+            args=dict(decision.args),
+            reasoning=decision.reasoning,
+        )
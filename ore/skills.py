@@ -6,10 +6,11 @@ Skills are filesystem-based instruction modules: YAML frontmatter (metadata)
 
 from __future__ import annotations
 
+import json
+import os
+import stat
 from pathlib import Path
-from typing import Dict, List
-
-import yaml
+from typing import Dict, List, Optional
 
 from .types import RoutingTarget, SkillMetadata
 
@@ -107,18 +108,48 @@ def build_skill_registry(root: Path | None = None) -> Dict[str, SkillMetadata]:
     if not skills_root.is_dir():
         return registry
 
-    for child in sorted(skills_root.iterdir()):
-        if not child.is_dir():
+    root_key = str(skills_root.resolve())
+    cached = _read_skills_cache(root_key)
+    fresh: Dict[str, dict] = {}
+    # scandir: is_dir() comes from the directory entry, not a stat per child
+    with os.scandir(skills_root) as it:
+        dirs = sorted(e.name for e in it if e.is_dir())
+    for name in dirs:
+        child = skills_root / name
+        try:
+            st = os.stat(child / SKILL_FILENAME)  # one stat: existence, type, mtime
+        except OSError:
             continue
-        skill_file = child / SKILL_FILENAME
-        if not skill_file.is_file():
+        if not stat.S_ISREG(st.st_mode):
             continue
+        entry = cached.get(name)
+        if (
+            entry is not None
+            and entry.get("mtime_ns") == st.st_mtime_ns
+            and entry.get("size") == st.st_size
+        ):
+            meta = _meta_from_entry(entry)
+            if meta is not None:
+                registry[meta.name] = meta
+                fresh[name] = entry
+                continue
         try:
             meta = load_skill_metadata(child)
             registry[meta.name] = meta
         except (ValueError, FileNotFoundError) as exc:
             print(f"Skipping skill in {child}: {exc}", file=sys.stderr)
-
+            continue
+        fresh[name] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "name": meta.name,
+            "description": meta.description,
+            "hints": meta.hints,
+            "path": str(meta.path),
+        }
+
+    if fresh != cached:
+        _write_skills_cache(root_key, fresh)
     return registry
 
 
@@ -147,6 +178,59 @@ def build_targets_from_skill_registry(
 # ---------------------------------------------------------------------------
 
 
+def _skills_cache_path() -> Path:
+    return Path.home() / ".ore" / "cache" / "skills.json"
+
+
+def _read_skills_cache(root_key: str) -> Dict[str, dict]:
+    """{skill dir name: entry} cached for a skills root; {} if missing or unreadable."""
+    try:
+        data = json.loads(_skills_cache_path().read_text(encoding="utf-8"))
+        entries = data[root_key]
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_skills_cache(root_key: str, entries: Dict[str, dict]) -> None:
+    """Replace root's entries; written to a temp file and renamed into place."""
+    path = _skills_cache_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            data = {}
+    except (OSError, ValueError):
+        data = {}
+    data[root_key] = entries
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # cache is best-effort
+
+
+def _meta_from_entry(entry: dict) -> Optional[SkillMetadata]:
+    """SkillMetadata from a cache entry, or None if the entry is malformed."""
+    try:
+        name, description = entry["name"], entry["description"]
+        hints, path = entry["hints"], entry["path"]
+    except (KeyError, TypeError):
+        return None
+    if not (
+        isinstance(name, str)
+        and isinstance(description, str)
+        and isinstance(hints, list)
+        and all(isinstance(h, str) for h in hints)
+        and isinstance(path, str)
+    ):
+        return None
+    return SkillMetadata(
+        name=name, description=description, hints=hints, path=Path(path)
+    )
+
+
 def _parse_frontmatter(text: str, source: Path) -> dict:
     """Extract and parse YAML frontmatter between --- delimiters."""
     stripped = text.lstrip("\n")
@@ -159,8 +243,12 @@ def _parse_frontmatter(text: str, source: Path) -> dict:
     if close_idx == -1:
         raise ValueError(f"Unclosed YAML frontmatter in {source}")
 
+    import yaml  # deferred: warm registry builds never parse YAML
+
     yaml_text = after_open[:close_idx]
-    parsed = yaml.safe_load(yaml_text)
+    # libyaml's C loader when PyYAML was built with it; same safe subset
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    parsed = yaml.load(yaml_text, Loader=loader)
     if not isinstance(parsed, dict):
         raise ValueError(f"YAML frontmatter is not a mapping in {source}")
     return parsed
@@ -4,13 +4,19 @@ Filesystem-backed store; ORE core is unaware of persistence.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import asdict
 import json
+import os
+import sys
 from pathlib import Path
-from typing import List
+from typing import Any, Iterable, List
 
 from .types import Message, Session
 
+try:  # optional: pip install ore[fast]
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class SessionStore(ABC):
     """Minimal interface for session persistence. No extra methods."""
@@ -31,26 +37,32 @@ class SessionStore(ABC):
         ...
 
 
+def _message_to_dict(m: Message) -> dict:
+    """Serialize one Message: its four fields, without a deep copy."""
+    return {"role": m.role, "content": m.content, "id": m.id, "timestamp": m.timestamp}
+
+
 def _session_to_dict(session: Session) -> dict:
     """Serialize Session to a JSON-serializable dict (messages as list of dicts)."""
     return {
         "id": session.id,
         "created_at": session.created_at,
-        "messages": [asdict(m) for m in session.messages],
+        "messages": [_message_to_dict(m) for m in session.messages],
     }
 
 
+def _dict_to_message(m: dict) -> Message:
+    """Deserialize one message dict (roles interned, like new messages)."""
+    role = sys.intern(m["role"])
+    try:  # current schema: every key present
+        return Message(role, m["content"], m["id"], m["timestamp"])
+    except KeyError:  # older files may lack id/timestamp
+        return Message(role, m["content"], m.get("id", ""), m.get("timestamp", 0.0))
+
+
 def _dict_to_session(data: dict) -> Session:
     """Deserialize dict to Session (reconstruct Message objects)."""
-    messages = [
-        Message(
-            role=m["role"],
-            content=m["content"],
-            id=m.get("id", ""),
-            timestamp=m.get("timestamp", 0.0),
-        )
-        for m in data.get("messages", [])
-    ]
+    messages = list(map(_dict_to_message, data.get("messages", ())))
     return Session(
         messages=messages,
         id=data.get("id", ""),
@@ -58,6 +70,24 @@ def _dict_to_session(data: dict) -> Session:
     )
 
 
+def _dumps_snapshot(obj: Any) -> bytes:
+    """Indented UTF-8 JSON for a session snapshot; orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Compact UTF-8 JSON plus newline for one journal record."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + "\n").encode()
+
+
+def _loads(raw: str | bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def _validate_session_name(name: str, root: Path) -> None:
     """
     Validate session name to prevent path traversal. Rejects names that would
@@ -82,18 +112,42 @@ class FileSessionStore(SessionStore):
     Filesystem-backed session store.
     Default root: ~/.ore/sessions/
     One JSON file per session: <name>.json
+
+    append() records new messages in a <name>.jsonl journal next to the
+    snapshot (one message per line), so a per-turn save costs O(turn) rather
+    than rewriting the whole session. load() replays the journal; save()
+    writes a fresh snapshot (temp file, fsync, rename) and removes the journal.
     """
 
     def __init__(self, root: Path | None = None) -> None:
         self._root = root or Path.home() / ".ore" / "sessions"
 
     def save(self, session: Session, name: str) -> None:
-        """Write session to <root>/<name>.json. Creates directory if missing."""
+        """Write session to <root>/<name>.json atomically. Creates directory if missing."""
         _validate_session_name(name, self._root)
         self._root.mkdir(parents=True, exist_ok=True)
         path = self._root / f"{name}.json"
-        with path.open("w") as f:
-            json.dump(_session_to_dict(session), f, indent=2)
+        # Write a temp file and rename it into place, so a crash or a full
+        # disk mid-write leaves the previous snapshot (and its journal) intact
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp.open("wb") as f:
+                f.write(_dumps_snapshot(_session_to_dict(session)))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        (self._root / f"{name}.jsonl").unlink(missing_ok=True)
+
+    def append(self, name: str, messages: Iterable[Message]) -> None:
+        """Append messages to the <root>/<name>.jsonl journal (no fsync)."""
+        _validate_session_name(name, self._root)
+        self._root.mkdir(parents=True, exist_ok=True)
+        path = self._root / f"{name}.jsonl"
+        with path.open("ab") as f:
+            f.writelines(_dumps_line(_message_to_dict(m)) for m in messages)
 
     def load(self, name: str) -> Session:
         """Read session from <root>/<name>.json. Raises FileNotFoundError if missing."""
@@ -101,9 +155,23 @@ class FileSessionStore(SessionStore):
         path = self._root / f"{name}.json"
         if not path.exists():
             raise FileNotFoundError(f"Session '{name}' not found at {path}")
-        with path.open() as f:
-            data = json.load(f)
-        return _dict_to_session(data)
+        data = _loads(path.read_bytes())
+        session = _dict_to_session(data)
+        journal = self._root / f"{name}.jsonl"
+        if journal.exists():
+            # Skip ids already in the snapshot (journal left by an interrupted save)
+            seen = {m.id for m in session.messages}
+            with journal.open("rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        msg = _dict_to_message(_loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        break  # torn or non-object line from an interrupted append
+                    if msg.id not in seen:
+                        session.messages.append(msg)
+        return session
 
     def list(self) -> List[str]:
         """Return sorted session names (stripped of .json suffix)."""
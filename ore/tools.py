@@ -6,13 +6,14 @@ v0.7 adds optional routing_hints and extract_args for intent-based routing.
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
-from .gate import Permission
+from .gate import Permission, permission_mask
 from .types import ToolResult
 
 
@@ -42,6 +43,16 @@ class Tool(ABC):
         """Execute the tool. Args are key=value from --tool-arg. Return ToolResult."""
         ...
 
+    @functools.cached_property
+    def sorted_permission_values(self) -> Tuple[str, ...]:
+        """required_permissions as sorted value strings; computed once per tool."""
+        return tuple(sorted(p.value for p in self.required_permissions))
+
+    @functools.cached_property
+    def required_mask(self) -> int:
+        """required_permissions as a bitmask for Gate.check; computed once per tool."""
+        return permission_mask(self.required_permissions)
+
     def routing_hints(self) -> List[str]:
         """Keywords/phrases for the router to match (v0.7). Override in subclasses."""
         return []
@@ -219,3 +230,14 @@ TOOL_REGISTRY: Dict[str, Tool] = {
     EchoTool().name: EchoTool(),
     ReadFileTool().name: ReadFileTool(),
 }
+
+
+def tool_listing() -> Tuple[Tuple[str, str, str], ...]:
+    """
+    (name, description, comma-joined permission values) per registered tool,
+    sorted by name, as shown by --list-tools.
+    """
+    return tuple(
+        (name, tool.description, ", ".join(tool.sorted_permission_values))
+        for name, tool in sorted(TOOL_REGISTRY.items(), key=lambda item: item[0])
+    )
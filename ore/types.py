@@ -20,8 +20,26 @@ class Message:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     timestamp: float = field(default_factory=time.time)
 
+    @property
+    def wire(self) -> Dict[str, str]:
+        """
+        Role + content dict sent to backends. Cached on the instance and
+        rebuilt only when role or content has been reassigned since.
+        """
+        cached = self.__dict__.get("_wire")
+        if (
+            cached is None
+            or cached["role"] is not self.role
+            or cached["content"] is not self.content
+        ):
+            cached = self.__dict__["_wire"] = {
+                "role": self.role,
+                "content": self.content,
+            }
+        return cached
 
-@dataclass
+
+@dataclass(slots=True)
 class Response:
     """
     Reasoner output for a single turn.
@@ -48,7 +66,7 @@ class Response:
     duration_ms: int = 0  # v1.3: wall-clock time of API call in ms; 0 if not set
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """
     An ordered, mutable history of messages for a single conversational context.
@@ -70,7 +88,7 @@ class Session:
     created_at: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """
     Result of a single tool execution (v0.6).
@@ -90,8 +108,13 @@ class ToolResult:
     timestamp: float = field(default_factory=time.time)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def rendered(self) -> str:
+        """Text the engine injects for this result: a [Tool:name] line, then output."""
+        return f"[Tool:{self.tool_name}]\n{self.output}"
 
-@dataclass
+
+@dataclass(slots=True)
 class SkillMetadata:
     """
     Level 1 skill metadata (v0.8) — always loaded, low token cost.
@@ -107,7 +130,7 @@ class SkillMetadata:
     path: Path  # Absolute path to the skill directory
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingTarget:
     """
     A routable target (tool or skill) for the router (v0.7).
@@ -121,7 +144,7 @@ class RoutingTarget:
     hints: List[str]  # Keywords/phrases for rule-based matching
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingDecision:
     """
     Result of routing: which target (if any) was selected and why.
@@ -153,7 +176,7 @@ Non-goals for the artifact (v0.9):
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionArtifactInput:
     """
     Input context that produced an execution. Captured for reconstructability.
@@ -170,7 +193,7 @@ class ExecutionArtifactInput:
     skills: Optional[List[str]] = None  # Skill names activated this turn
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionArtifactOutput:
     """Reasoner output; matches Response shape for JSON compatibility."""
 
@@ -181,7 +204,7 @@ class ExecutionArtifactOutput:
     metadata: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionArtifactContinuation:
     """
     Declared signal only. Never inferred.
@@ -194,7 +217,7 @@ class ExecutionArtifactContinuation:
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionArtifact:
     """
     v0.9 self-describing execution artifact.
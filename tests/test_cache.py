@@ -0,0 +1,95 @@
+"""Tests for ore/cache.py — opt-in response cache (--cache)."""
+
+from unittest.mock import patch
+
+import pytest
+
+from ore.cache import CachingReasoner, ResponseCache
+from ore.core import ORE
+from ore.types import Message, Response
+
+from .conftest import FakeReasoner
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ResponseCache(path=tmp_path / "responses.db")
+    yield c
+    c.close()
+
+
+class TestResponseCache:
+    def test_miss_then_hit(self, cache):
+        key = ResponseCache.key("Fake", "m", [Message(role="user", content="hi")])
+        assert cache.get(key) is None
+        cache.put(key, Response(content="yo", model_id="m", metadata={"n": 1}))
+        hit = cache.get(key)
+        assert hit.content == "yo"
+        assert hit.model_id == "m"
+        assert hit.metadata == {"n": 1}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_ignores_message_ids(self):
+        a = [Message(role="user", content="hi")]
+        b = [Message(role="user", content="hi")]
+        assert ResponseCache.key("F", "m", a) == ResponseCache.key("F", "m", b)
+
+    def test_key_depends_on_model_and_namespace(self):
+        msgs = [Message(role="user", content="hi")]
+        base = ResponseCache.key("F", "m", msgs)
+        assert ResponseCache.key("F", "other", msgs) != base
+        assert ResponseCache.key("G", "m", msgs) != base
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "db" / "responses.db"
+        first = ResponseCache(path=path)
+        first.put("k", Response(content="saved", model_id="m"))
+        first.close()
+        second = ResponseCache(path=path)
+        assert second.get("k").content == "saved"
+        second.close()
+
+
+class TestCachingReasoner:
+    def test_second_identical_call_skips_backend(self, cache):
+        inner = FakeReasoner(canned="answer")
+        engine = ORE(CachingReasoner(inner, cache))
+        first = engine.execute("same")
+        second = engine.execute("same")
+        assert inner.reason_call_count == 1
+        assert second.content == first.content == "answer"
+        assert second.id != first.id
+
+    def test_different_prompt_misses(self, cache):
+        inner = FakeReasoner()
+        engine = ORE(CachingReasoner(inner, cache))
+        engine.execute("one")
+        engine.execute("two")
+        assert inner.reason_call_count == 2
+
+    def test_stream_hit_yields_cached_content(self, cache):
+        inner = FakeReasoner(canned="a b c")
+        engine = ORE(CachingReasoner(inner, cache))
+        assert "".join(engine.execute_stream("p")) == "a b c"
+        assert list(engine.execute_stream("p")) == ["a b c"]
+        assert inner.stream_reason_call_count == 1
+
+
+class TestCacheCli:
+    def test_cache_flag_reuses_response(self, tmp_path, capsys):
+        inner = FakeReasoner(canned="cached answer")
+        argv = ["ore", "same prompt", "--cache", "--verbose"]
+        with patch("ore.cache.Path.home", return_value=tmp_path):
+            with patch("ore.reasoner.AyaReasoner", return_value=inner):
+                with patch("ore.models.default_model", return_value="fake-model"):
+                    from ore.cli import run
+
+                    for _ in range(2):
+                        with patch("sys.argv", argv):
+                            run()
+        captured = capsys.readouterr()
+        assert inner.reason_call_count == 1
+        assert captured.out.count("cached answer") == 2
+        assert "[Cache]: 0 hit(s), 1 miss(es)" in captured.err
+        assert "[Cache]: 1 hit(s), 0 miss(es)" in captured.err
+        assert (tmp_path / ".ore" / "cache" / "responses.db").exists()
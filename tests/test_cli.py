@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import io
 import json
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -64,6 +65,17 @@ class TestCliFrozenSurface:
 
 
 class TestArgParsing:
+    def test_parser_built_once(self):
+        from ore.cli import _build_parser
+
+        assert _build_parser() is _build_parser()
+
+    def test_cached_parser_does_not_leak_append_values(self):
+        first = _parse(["x", "--grant", "network"])
+        second = _parse(["x"])
+        assert first.grant == ["network"]
+        assert second.grant == []
+
     def test_single_turn_prompt(self):
         ns = _parse(["hello world"])
         assert ns.prompt == "hello world"
@@ -113,13 +125,68 @@ class TestArgParsing:
         assert ns.system == ""
 
 
+class TestFastParse:
+    """The argparse-free fast path must agree with _build_parser() or defer to it."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["hello world"],
+            ["-v", "hello"],
+            ["--model", "x", "hello", "-s"],
+            ["hi", "--grant", "shell", "--grant", "network"],
+            ["hi", "--tool", "echo", "--tool-arg", "msg=a", "--tool-arg", "b"],
+            ["-c", "--save-session", "demo", "--system", ""],
+            ["--artifact-in", "-", "--backend", "deepseek"],
+            ["hi", "--route", "--route-threshold", "0.25", "--skill", "s"],
+            ["--list-models"],
+            ["--list-tools"],
+            ["--list-skills", "-j", "-i"],
+        ],
+    )
+    def test_matches_argparse(self, argv):
+        from ore.cli import _build_parser, _fast_parse
+
+        fast = _fast_parse(argv)
+        assert fast is not None
+        assert vars(fast) == vars(_build_parser().parse_args(argv))
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["-h"],
+            ["hi", "--artifact-out"],
+            ["-vs", "hi"],
+            ["--mod", "x", "hi"],
+            ["--model=x", "hi"],
+            ["a", "b"],
+            ["--backend", "bogus"],
+            ["--route-threshold", "high"],
+            ["--model"],
+            ["--model", "-x"],
+            ["--", "-x"],
+        ],
+    )
+    def test_defers_to_argparse(self, argv):
+        from ore.cli import _fast_parse
+
+        assert _fast_parse(argv) is None
+
+    def test_fresh_lists_per_parse(self):
+        from ore.cli import _fast_parse
+
+        _fast_parse(["--grant", "shell"])
+        assert _fast_parse([]).grant == []
+
+
 class TestModeValidation:
     """Test the mutual-exclusivity rules enforced by cli.run()."""
 
     @pytest.mark.invariant
     def test_interactive_and_conversational_rejected(self, capsys):
         """run() should exit when both -i and -c are given."""
-        with patch("ore.cli.argparse._sys.argv", ["ore", "-i", "-c"]):
+        with patch("sys.argv", ["ore", "-i", "-c"]):
             with pytest.raises(SystemExit):
                 from ore.cli import run
 
@@ -129,7 +196,7 @@ class TestModeValidation:
 
     @pytest.mark.invariant
     def test_interactive_with_save_session_rejected(self, capsys):
-        with patch("ore.cli.argparse._sys.argv", ["ore", "-i", "--save-session", "x"]):
+        with patch("sys.argv", ["ore", "-i", "--save-session", "x"]):
             with pytest.raises(SystemExit):
                 from ore.cli import run
 
@@ -139,9 +206,7 @@ class TestModeValidation:
 
     @pytest.mark.invariant
     def test_interactive_with_resume_session_rejected(self, capsys):
-        with patch(
-            "ore.cli.argparse._sys.argv", ["ore", "-i", "--resume-session", "x"]
-        ):
+        with patch("sys.argv", ["ore", "-i", "--resume-session", "x"]):
             with pytest.raises(SystemExit):
                 from ore.cli import run
 
@@ -151,7 +216,7 @@ class TestModeValidation:
 
     def test_no_prompt_no_mode_rejected(self, capsys):
         # TTY with no prompt → parser.error; avoid stdin read path
-        with patch("ore.cli.argparse._sys.argv", ["ore"]):
+        with patch("sys.argv", ["ore"]):
             with patch("ore.cli.sys.stdin.isatty", return_value=True):
                 with pytest.raises(SystemExit):
                     from ore.cli import run
@@ -162,9 +227,7 @@ class TestModeValidation:
 
     @pytest.mark.invariant
     def test_json_and_stream_rejected(self, capsys):
-        with patch(
-            "ore.cli.argparse._sys.argv", ["ore", "hello", "--json", "--stream"]
-        ):
+        with patch("sys.argv", ["ore", "hello", "--json", "--stream"]):
             with pytest.raises(SystemExit):
                 from ore.cli import run
 
@@ -174,7 +237,7 @@ class TestModeValidation:
 
     @pytest.mark.invariant
     def test_json_and_interactive_rejected(self, capsys):
-        with patch("ore.cli.argparse._sys.argv", ["ore", "-i", "--json"]):
+        with patch("sys.argv", ["ore", "-i", "--json"]):
             with pytest.raises(SystemExit):
                 from ore.cli import run
 
@@ -184,7 +247,7 @@ class TestModeValidation:
 
     @pytest.mark.invariant
     def test_json_and_conversational_rejected(self, capsys):
-        with patch("ore.cli.argparse._sys.argv", ["ore", "-c", "--json"]):
+        with patch("sys.argv", ["ore", "-c", "--json"]):
             with pytest.raises(SystemExit):
                 from ore.cli import run
 
@@ -196,7 +259,7 @@ class TestModeValidation:
     def test_route_and_tool_rejected(self, capsys):
         """--route and --tool are mutually exclusive."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hi", "--route", "--tool", "echo"],
         ):
             with pytest.raises(SystemExit):
@@ -220,9 +283,9 @@ class TestJsonOutput:
     @pytest.mark.invariant
     def test_json_output_exact_base_keys(self, capsys):
         """Invariant: single-turn --json has exactly the 5 base keys (no extras)."""
-        with patch("ore.cli.argparse._sys.argv", ["ore", "hello", "--json"]):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+        with patch("sys.argv", ["ore", "hello", "--json"]):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -234,9 +297,9 @@ class TestJsonOutput:
 
     def test_json_output_keys(self, capsys):
         """Single-turn with --json produces valid JSON with required keys."""
-        with patch("ore.cli.argparse._sys.argv", ["ore", "hello", "--json"]):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+        with patch("sys.argv", ["ore", "hello", "--json"]):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -244,14 +307,77 @@ class TestJsonOutput:
         data = json.loads(out)
         assert _JSON_BASE_KEYS <= set(data.keys())
 
+    def test_json_bytes_same_with_and_without_orjson(self):
+        import sys
+
+        from ore.cli import _json_bytes
+
+        payload = {"content": "caf\u00e9 \u2603", "n": [1, 2.5, None], "ok": True}
+        with patch.dict(sys.modules, {"orjson": None}):
+            fallback = _json_bytes(payload)
+        assert (
+            fallback
+            == '{"content":"caf\u00e9 \u2603","n":[1,2.5,null],"ok":true}'.encode()
+        )
+        with patch.dict(sys.modules, {"orjson": None}):
+            assert _json_bytes(payload, newline=True) == fallback + b"\n"
+        pytest.importorskip("orjson")
+        assert _json_bytes(payload) == fallback
+        assert _json_bytes(payload, newline=True) == fallback + b"\n"
+
+    def test_json_bytes_exponent_floats_differ_as_documented(self):
+        import sys
+
+        from ore.cli import _json_bytes
+
+        with patch.dict(sys.modules, {"orjson": None}):
+            assert _json_bytes([1e-07, 1e16]) == b"[1e-07,1e+16]"
+        pytest.importorskip("orjson")
+        assert _json_bytes([1e-07, 1e16]) == b"[1e-7,1e16]"
+
+    def test_json_line_written_without_byte_buffer(self):
+        from ore.cli import _write_stdout_bytes
+
+        out = io.StringIO()
+        with patch("sys.stdout", out):
+            _write_stdout_bytes(b'{"a":1}\n')
+        assert out.getvalue() == '{"a":1}\n'
+
+    def test_json_line_is_one_buffer_write(self):
+        from ore.cli import _print_json_response
+        from ore.types import Response
+
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding="utf-8")
+        with patch("sys.stdout", out):
+            with patch.object(raw, "write", wraps=raw.write) as write:
+                _print_json_response(Response(content="hi", model_id="m"))
+        assert write.call_count == 1
+        assert raw.getvalue().endswith(b"}\n")
+
+    def test_piped_stdin_read_from_binary_buffer(self, capsys):
+        """Piped prompt is read from stdin.buffer and decoded once."""
+        raw = io.BytesIO("  caf\u00e9 prompt\r\nline two\n".encode("utf-8"))
+        fake_stdin = io.TextIOWrapper(raw, encoding="utf-8")
+        fake_stdin.isatty = lambda: False
+        reasoner = FakeReasoner()
+        with patch("sys.argv", ["ore"]):
+            with patch("ore.cli.sys.stdin", fake_stdin):
+                with patch("ore.reasoner.AyaReasoner", return_value=reasoner):
+                    with patch("ore.models.default_model", return_value="fake-model"):
+                        from ore.cli import run
+
+                        run()
+        assert reasoner.last_messages[-1].content == "caf\u00e9 prompt\nline two"
+
     def test_piped_stdin_single_turn(self, capsys):
         """When stdin is non-TTY and no prompt arg, read prompt from stdin."""
         fake_stdin = io.StringIO("piped prompt")
         fake_stdin.isatty = lambda: False
-        with patch("ore.cli.argparse._sys.argv", ["ore", "--json"]):
+        with patch("sys.argv", ["ore", "--json"]):
             with patch("ore.cli.sys.stdin", fake_stdin):
-                with patch("ore.cli.AyaReasoner", FakeReasoner):
-                    with patch("ore.cli.default_model", return_value="fake-model"):
+                with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                    with patch("ore.models.default_model", return_value="fake-model"):
                         from ore.cli import run
 
                         run()
@@ -260,24 +386,416 @@ class TestJsonOutput:
         assert data["content"] == "fake response"
 
 
+class _CountingStdout(io.StringIO):
+    """StringIO that counts flush() calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+class TestStreamOutput:
+    """--stream writes every chunk but coalesces flushes."""
+
+    def test_stream_turn_output_and_flushes(self):
+        from ore.cli import _stream_turn
+        from ore.core import ORE
+
+        engine = ORE(FakeReasoner(canned="one two three four five six"))
+        out = _CountingStdout()
+        with patch("sys.stdout", out):
+            response = _stream_turn(engine, "hi", None, verbose=False)
+        assert out.getvalue() == "[AYA]: one two three four five six\n"
+        assert response.content == "one two three four five six"
+        # Prompt label + final newline are flushed; six fast chunks are not each flushed
+        assert out.flushes < 6
+
+    def test_stream_flushes_at_newline(self):
+        from ore.cli import _stream_turn
+        from ore.core import ORE
+
+        engine = ORE(FakeReasoner(canned="line\n next"))
+        out = _CountingStdout()
+        with patch("sys.stdout", out):
+            _stream_turn(engine, "hi", None, verbose=False)
+        assert out.getvalue() == "[AYA]: line\n next\n"
+        assert out.flushes == 3
+
+    def test_stream_flushes_every_n_chunks(self):
+        from ore import cli
+        from ore.core import ORE
+
+        engine = ORE(FakeReasoner(canned=" ".join(["w"] * 20)))
+        out = _CountingStdout()
+        with patch("sys.stdout", out):
+            with patch.object(cli, "_STREAM_FLUSH_INTERVAL_S", 3600.0):
+                cli._stream_turn(engine, "hi", None, verbose=False)
+        # label + 20 // 8 chunk-count flushes + final newline
+        assert out.flushes == 1 + 2 + 1
+
+    def test_stream_flushes_partial_output_on_error(self):
+        from ore import cli
+        from ore.core import ORE
+
+        class Failing(FakeReasoner):
+            def stream_reason(self, messages):
+                yield "partial"
+                raise RuntimeError("backend down")
+
+        out = _CountingStdout()
+        with patch("sys.stdout", out):
+            with patch.object(cli, "_STREAM_FLUSH_INTERVAL_S", 3600.0):
+                with pytest.raises(RuntimeError):
+                    cli._stream_turn(ORE(Failing()), "hi", None, verbose=False)
+        assert out.getvalue() == "[AYA]: partial"
+        assert out.flushes == 2
+
+    def test_stream_verbose_metadata_single_write(self):
+        from ore.cli import _stream_turn
+        from ore.core import ORE
+
+        engine = ORE(FakeReasoner(canned="hi"))
+        out = _CountingStdout()
+        writes = []
+        real_write = out.write
+        out.write = lambda text: writes.append(text) or real_write(text)
+        with patch("sys.stdout", out):
+            response = _stream_turn(engine, "q", None, verbose=True)
+        assert writes[-1] == (
+            f"\n\n[Metadata]: ID {response.id} | Model {response.model_id}\n"
+        )
+        assert out.flushes == 2
+
+    def test_chunks_captures_generator_return(self):
+        from ore.cli import _chunks
+
+        def gen():
+            yield "a"
+            yield "b"
+            return "done"
+
+        result = []
+        assert list(_chunks(gen(), result)) == ["a", "b"]
+        assert result == ["done"]
+
+    def test_single_turn_stream_cli(self, capsys):
+        with patch("sys.argv", ["ore", "hello", "-s"]):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
+                    from ore.cli import run
+
+                    run()
+        assert "[AYA]: fake response\n" in capsys.readouterr().out
+
+
+class TestPrintResponse:
+    """_print_response output is unchanged by the single-write path."""
+
+    def test_plain(self, capsys):
+        from ore.cli import _print_response
+        from ore.types import Response
+
+        _print_response(Response(content="hi", model_id="m"))
+        assert capsys.readouterr().out == "\n[AYA]: hi\n"
+
+    def test_verbose_with_usage(self, capsys):
+        from ore.cli import _print_response
+        from ore.types import Response
+
+        r = Response(content="hi", model_id="m", id="abc", metadata={"eval_count": 3})
+        _print_response(r, verbose=True)
+        assert capsys.readouterr().out == (
+            "\n[AYA]: hi\n"
+            "\n[Metadata]: ID abc | Model m\n"
+            "  Usage: {'eval_count': 3}\n"
+        )
+
+
+class TestReplInput:
+    """REPL modes read piped stdin line by line without input()."""
+
+    def _run_piped(
+        self, argv: list[str], text: str, reasoner: FakeReasoner | None = None
+    ) -> None:
+        fake_stdin = io.StringIO(text)
+        fake_stdin.isatty = lambda: False
+        factory = FakeReasoner if reasoner is None else (lambda **_: reasoner)
+        with patch("sys.argv", argv):
+            with patch("ore.cli.sys.stdin", fake_stdin):
+                with patch("ore.reasoner.AyaReasoner", factory):
+                    with patch("ore.models.default_model", return_value="fake-model"):
+                        with patch("builtins.input", side_effect=AssertionError):
+                            from ore.cli import run
+
+                            run()
+
+    def test_interactive_piped_turns(self, capsys):
+        self._run_piped(["ore", "-i"], "hello\n  second  \nquit\nignored\n")
+        out = capsys.readouterr().out
+        assert out.count("--- ORE: Reasoning ---") == 2
+        assert out.count("You: ") == 3
+
+    def test_repl_tool_resolved_once(self, capsys):
+        from ore import cli
+
+        with patch.object(cli, "_resolve_tool", wraps=cli._resolve_tool) as resolve:
+            self._run_piped(
+                ["ore", "-i", "--tool", "echo", "--tool-arg", "msg=hi"], "a\nb\n"
+            )
+        assert resolve.call_count == 1
+        assert capsys.readouterr().out.count("--- ORE: Reasoning ---") == 2
+
+    def test_repl_unknown_tool_exits_before_first_turn(self, capsys):
+        with pytest.raises(SystemExit) as exc_info:
+            self._run_piped(["ore", "-i", "--tool", "nope"], "a\n")
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert "Unknown tool: nope" in captured.err
+        assert "You: " not in captured.out
+
+    @pytest.mark.parametrize(
+        "line,expected",
+        [
+            ("quit", True),
+            ("EXIT", True),
+            ("Quit", True),
+            ("exit", True),
+            ("quiz", False),
+            ("exit now", False),
+            ("quits", False),
+            ("", False),
+        ],
+    )
+    def test_is_exit_command(self, line, expected):
+        from ore.cli import _is_exit_command
+
+        assert _is_exit_command(line) is expected
+
+    def test_conversational_save_session_compacts(self, tmp_path, capsys):
+        from ore.store import FileSessionStore
+
+        with patch("ore.store.Path.home", return_value=tmp_path):
+            self._run_piped(["ore", "--save-session", "s1"], "one\ntwo\nexit\n")
+            root = tmp_path / ".ore" / "sessions"
+            assert not (root / "s1.jsonl").exists()
+            loaded = FileSessionStore().load("s1")
+        assert [m.role for m in loaded.messages] == [
+            "user",
+            "assistant",
+            "user",
+            "assistant",
+        ]
+
+    def test_conversational_threads_session_interactive_does_not(self, capsys):
+        for argv, expected in ((["ore", "-c"], 4), (["ore", "-i"], 2)):
+            reasoner = FakeReasoner()
+            self._run_piped(argv, "one\ntwo\n", reasoner)
+            # system + (prior user/assistant) + user on the second turn
+            assert len(reasoner.last_messages) == expected
+
+    def test_save_session_appends_off_main_thread(self, tmp_path, capsys):
+        import threading
+
+        from ore.store import FileSessionStore
+
+        threads = []
+        real_append = FileSessionStore.append
+
+        def recording_append(self, name, messages):
+            threads.append(threading.current_thread().name)
+            real_append(self, name, messages)
+
+        with patch("ore.store.Path.home", return_value=tmp_path):
+            with patch.object(FileSessionStore, "append", recording_append):
+                self._run_piped(["ore", "--save-session", "bg"], "one\ntwo\n")
+            loaded = FileSessionStore().load("bg")
+        assert len(threads) == 2
+        assert all(name.startswith("ore-session") for name in threads)
+        assert len(loaded.messages) == 4
+
+    def test_save_session_compacts_every_n_turns(self, tmp_path, capsys):
+        from ore import cli
+        from ore.store import FileSessionStore
+
+        saves = []
+        real_save = FileSessionStore.save
+
+        def recording_save(self, session, name):
+            saves.append(len(session.messages))
+            real_save(self, session, name)
+
+        with patch("ore.store.Path.home", return_value=tmp_path):
+            with patch.object(FileSessionStore, "save", recording_save):
+                with patch.object(cli, "_SESSION_COMPACT_TURNS", 2):
+                    self._run_piped(["ore", "--save-session", "k"], "1\n2\n3\n4\n5\n")
+            loaded = FileSessionStore().load("k")
+        # Start snapshot, compactions after turns 2 and 4 (either may be
+        # superseded while still queued), final compaction after turn 5
+        assert saves[0] == 0 and saves[-1] == 10
+        assert saves == sorted(saves) and set(saves[1:-1]) <= {4, 8}
+        assert not (tmp_path / ".ore" / "sessions" / "k.jsonl").exists()
+        assert len(loaded.messages) == 10
+
+    def test_save_session_append_failure_reported(self, tmp_path, capsys):
+        from ore.store import FileSessionStore
+
+        with patch("ore.store.Path.home", return_value=tmp_path):
+            with patch.object(
+                FileSessionStore, "append", side_effect=OSError("No space left")
+            ):
+                self._run_piped(["ore", "--save-session", "full"], "one\n")
+            loaded = FileSessionStore().load("full")
+        err = capsys.readouterr().err
+        assert "could not save turn to session 'full': No space left" in err
+        # The exit compaction still writes the whole session from memory
+        assert len(loaded.messages) == 2
+
+    def test_save_session_compaction_failure_reported(self, tmp_path, capsys):
+        from ore import cli
+        from ore.store import FileSessionStore
+
+        real_save = FileSessionStore.save
+
+        def failing_save(self, session, name):
+            if session.messages:  # let the start snapshot through
+                raise OSError("disk full")
+            real_save(self, session, name)
+
+        with patch("ore.store.Path.home", return_value=tmp_path):
+            with patch.object(FileSessionStore, "save", failing_save):
+                # Quit right after a mid-session compaction: no exit compaction
+                with patch.object(cli, "_SESSION_COMPACT_TURNS", 1):
+                    self._run_piped(["ore", "--save-session", "m"], "1\n")
+                assert "could not compact session 'm': disk full" in (
+                    capsys.readouterr().err
+                )
+                # A failed exit compaction is reported and exits 1
+                with pytest.raises(SystemExit) as exc_info:
+                    self._run_piped(["ore", "--save-session", "e"], "1\n")
+        assert exc_info.value.code == 1
+        assert "could not compact session 'e': disk full" in capsys.readouterr().err
+
+    def test_save_session_without_turns_saves_once(self, tmp_path, capsys):
+        from ore.store import FileSessionStore
+
+        with patch("ore.store.Path.home", return_value=tmp_path):
+            with patch.object(FileSessionStore, "save", autospec=True) as save:
+                self._run_piped(["ore", "--save-session", "idle"], "quit\n")
+        assert save.call_count == 1
+
+    def test_tool_args_parsed_once_per_repl(self, capsys):
+        from ore import cli
+
+        reasoner = FakeReasoner()
+        with patch.object(cli, "_parse_tool_args", wraps=cli._parse_tool_args) as parse:
+            self._run_piped(
+                ["ore", "-i", "--tool", "echo", "--tool-arg", "msg=hi"],
+                "one\ntwo\n",
+                reasoner,
+            )
+        assert parse.call_count == 1
+        assert "msg=hi" in reasoner.last_messages[1].content
+
+    def test_parse_tool_args(self):
+        from ore.cli import _parse_tool_args
+
+        parsed = _parse_tool_args(["msg=hi", " k = v=w ", "flag", "empty="])
+        assert parsed == {"msg": "hi", "k": "v=w", "flag": "", "empty": ""}
+        assert _parse_tool_args(None) == {}
+
+    def test_conversational_piped_eof(self, capsys):
+        self._run_piped(["ore", "-c"], "hello\n")
+        out = capsys.readouterr().out
+        assert out.count("--- ORE: Reasoning ---") == 1
+        assert out.rstrip().endswith("You:")
+
+
 class TestExitCodes:
     """Invariant tests: CLI exit code contract (0=success, 1=app error, 2=usage)."""
 
     @pytest.mark.invariant
     def test_list_tools_exits_0(self, capsys):
         """Invariant: --list-tools exits 0."""
-        with patch("ore.cli.argparse._sys.argv", ["ore", "--list-tools"]):
+        with patch("sys.argv", ["ore", "--list-tools"]):
             with pytest.raises(SystemExit) as exc_info:
                 from ore.cli import run
 
                 run()
         assert exc_info.value.code == 0
 
+    @pytest.mark.invariant
+    def test_list_models_exits_0(self, capsys):
+        """Invariant: --list-models exits 0 and prints one sorted name per line."""
+        with patch("sys.argv", ["ore", "--list-models"]):
+            with patch("ore.models.fetch_models", return_value=["b:1", "a:1"]):
+                with pytest.raises(SystemExit) as exc_info:
+                    from ore.cli import run
+
+                    run()
+        assert exc_info.value.code == 0
+        out = capsys.readouterr().out
+        assert out == "Available Ollama models:\n  a:1\n  b:1\n"
+
+    @pytest.mark.parametrize(
+        "flag,refresh", [([], False), (["--refresh-models"], True)]
+    )
+    def test_default_model_uses_cached_list(self, flag, refresh, capsys):
+        with patch("sys.argv", ["ore", "hi", *flag]):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch(
+                    "ore.models.default_model", return_value="fake-model"
+                ) as pick:
+                    from ore.cli import run
+
+                    run()
+        pick.assert_called_once_with(cached=True, refresh=refresh)
+
+    def test_missing_default_model_exits_1_and_refreshes(self, capsys):
+        from ollama import ResponseError
+
+        class Missing(FakeReasoner):
+            def reason(self, messages):
+                raise ResponseError("model 'gone:latest' not found", 404)
+
+        with patch("sys.argv", ["ore", "hi"]):
+            with patch("ore.reasoner.AyaReasoner", Missing):
+                with patch(
+                    "ore.models.default_model",
+                    side_effect=["gone:latest", "new:latest"],
+                ) as pick:
+                    from ore.cli import run
+
+                    with pytest.raises(SystemExit) as exc_info:
+                        run()
+        assert exc_info.value.code == 1
+        pick.assert_called_with(cached=True, refresh=True)
+        err = capsys.readouterr().err
+        assert "'gone:latest' is not available" in err
+        assert "new:latest" in err and "--refresh-models" in err
+
+    def test_missing_explicit_model_not_caught(self):
+        from ollama import ResponseError
+
+        class Missing(FakeReasoner):
+            def reason(self, messages):
+                raise ResponseError("model 'x' not found", 404)
+
+        with patch("sys.argv", ["ore", "hi", "--model", "x"]):
+            with patch("ore.reasoner.AyaReasoner", Missing):
+                from ore.cli import run
+
+                with pytest.raises(ResponseError):
+                    run()
+
     @pytest.mark.invariant
     def test_list_skills_exits_0_when_empty(self, capsys):
         """Invariant: --list-skills with no skills exits 0."""
-        with patch("ore.cli.argparse._sys.argv", ["ore", "--list-skills"]):
-            with patch("ore.cli.build_skill_registry", return_value={}):
+        with patch("sys.argv", ["ore", "--list-skills"]):
+            with patch("ore.skills.build_skill_registry", return_value={}):
                 with pytest.raises(SystemExit) as exc_info:
                     from ore.cli import run
 
@@ -288,10 +806,10 @@ class TestExitCodes:
     def test_unknown_tool_exits_1(self, capsys):
         """Invariant: unknown --tool name exits 1."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hi", "--tool", "nonexistent-tool"],
         ):
-            with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.models.default_model", return_value="fake-model"):
                 with pytest.raises(SystemExit) as exc_info:
                     from ore.cli import run
 
@@ -302,15 +820,45 @@ class TestExitCodes:
     def test_unknown_grant_exits_1(self, capsys):
         """Invariant: unknown --grant value exits 1."""
         with patch(
-            "ore.cli.argparse._sys.argv",
-            ["ore", "hi", "--grant", "invalid-perm"],
+            "sys.argv",
+            ["ore", "hi", "--grant", "shell", "--grant", "invalid-perm"],
         ):
-            with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.models.default_model", return_value="fake-model"):
                 with pytest.raises(SystemExit) as exc_info:
                     from ore.cli import run
 
                     run()
         assert exc_info.value.code == 1
+        err = capsys.readouterr().err
+        assert "Unknown permission: invalid-perm." in err
+        assert "filesystem-read, filesystem-write, network, shell" in err
+
+
+class TestVersionFlag:
+    """--version / -V short-circuits before the parser and engine are built."""
+
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_version_prints_and_skips_engine(self, flag, capsys):
+        from ore import __version__
+
+        with patch("sys.argv", ["ore", flag]):
+            with patch("ore.models.default_model") as dm:
+                with patch("ore.reasoner.AyaReasoner") as reasoner:
+                    from ore.cli import run
+
+                    run()
+        assert capsys.readouterr().out.strip() == f"ORE {__version__}"
+        dm.assert_not_called()
+        reasoner.assert_not_called()
+
+    def test_parser_version_action_matches_fast_path(self, capsys):
+        from ore import __version__
+        from ore.cli import _build_parser
+
+        with pytest.raises(SystemExit) as exc_info:
+            _build_parser().parse_args(["--version"])
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out.strip() == f"ORE {__version__}"
 
 
 class TestToolCli:
@@ -318,7 +866,7 @@ class TestToolCli:
 
     def test_list_tools_flag(self, capsys):
         """--list-tools prints tool names and exits 0."""
-        with patch("ore.cli.argparse._sys.argv", ["ore", "--list-tools"]):
+        with patch("sys.argv", ["ore", "--list-tools"]):
             with pytest.raises(SystemExit) as exc_info:
                 from ore.cli import run
 
@@ -332,10 +880,10 @@ class TestToolCli:
     def test_tool_gate_denied_exits_cleanly(self, capsys):
         """--tool read-file without --grant exits 1 with stderr message."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--tool", "read-file", "--tool-arg", "path=/tmp/x"],
         ):
-            with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.models.default_model", return_value="fake-model"):
                 with pytest.raises(SystemExit) as exc_info:
                     from ore.cli import run
 
@@ -348,11 +896,11 @@ class TestToolCli:
     def test_tool_with_json_output(self, capsys):
         """--tool echo with --json produces valid JSON (tool runs, then reasoner)."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "summarize", "--tool", "echo", "--tool-arg", "msg=hello", "--json"],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -366,12 +914,12 @@ class TestToolCli:
         fake_stdin = io.StringIO("piped prompt")
         fake_stdin.isatty = lambda: False
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "--tool", "echo", "--tool-arg", "x=y", "--json"],
         ):
             with patch("ore.cli.sys.stdin", fake_stdin):
-                with patch("ore.cli.AyaReasoner", FakeReasoner):
-                    with patch("ore.cli.default_model", return_value="fake-model"):
+                with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                    with patch("ore.models.default_model", return_value="fake-model"):
                         from ore.cli import run
 
                         run()
@@ -386,11 +934,11 @@ class TestRouteCli:
     def test_route_with_matching_prompt_runs_tool(self, capsys):
         """--route with prompt that matches echo: routing on stderr, response on stdout."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "say back hello world", "--route"],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -403,11 +951,11 @@ class TestRouteCli:
     def test_route_with_non_matching_prompt_fallback(self, capsys):
         """--route with no match: fallback message on stderr, reasoner only."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "what is the capital of France", "--route"],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -419,15 +967,89 @@ class TestRouteCli:
             or "fallback" in captured.err.lower()
         )
 
+    def test_route_repl_builds_tool_targets_once(self, capsys):
+        """--route in a REPL builds the router and tool + skill targets once per run."""
+        from ore.router import build_targets_from_registry
+        from ore.skills import build_targets_from_skill_registry
+
+        fake_stdin = io.StringIO("say back one\nsay back two\n")
+        fake_stdin.isatty = lambda: False
+        with patch("sys.argv", ["ore", "-i", "--route"]):
+            with patch("ore.cli.sys.stdin", fake_stdin):
+                with patch(
+                    "ore.router.build_targets_from_registry",
+                    wraps=build_targets_from_registry,
+                ) as build:
+                    with patch(
+                        "ore.skills.build_targets_from_skill_registry",
+                        wraps=build_targets_from_skill_registry,
+                    ) as build_skills:
+                        with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                            with patch(
+                                "ore.models.default_model", return_value="fake-model"
+                            ):
+                                from ore.cli import run
+
+                                run()
+        assert build.call_count == 1
+        assert build_skills.call_count == 1
+        assert capsys.readouterr().err.count("[Route]: echo") == 2
+
+    def test_memo_router_reuses_decision_with_fresh_id(self):
+        from unittest.mock import MagicMock
+
+        from ore.router import RuleRouter, _MemoRouter, build_targets_from_registry
+        from ore.tools import TOOL_REGISTRY
+
+        inner = RuleRouter()
+        inner.route = MagicMock(wraps=inner.route)
+        router = _MemoRouter(inner)
+        targets = build_targets_from_registry(TOOL_REGISTRY)
+        first = router.route("say back hi", targets)
+        first.args["junk"] = "x"
+        second = router.route("say back hi", targets)
+        router.route("something else", targets)
+        assert inner.route.call_count == 2
+        assert second.target == first.target == "echo"
+        assert second.id != first.id
+        assert "junk" not in second.args
+
+    def test_dispatch_keeps_decision_identity_when_args_extracted(self, capsys):
+        from ore.cli import _build_routing, _route_and_dispatch
+        from ore.gate import Gate
+
+        router, tool_targets = _build_routing(0.5, {})
+        original = router.route("say back hi", tool_targets)
+        router.route = lambda prompt, targets: original
+        _, _, decision = _route_and_dispatch(
+            "say back hi", Gate(frozenset()), False, {}, router, tool_targets
+        )
+        assert decision.args == {"msg": "say back hi"}
+        assert (decision.id, decision.timestamp) == (original.id, original.timestamp)
+        assert decision.reasoning == original.reasoning
+
+    def test_memo_router_evicts_oldest(self):
+        from unittest.mock import MagicMock
+
+        from ore import router as router_mod
+
+        inner = router_mod.RuleRouter()
+        inner.route = MagicMock(wraps=inner.route)
+        router = router_mod._MemoRouter(inner)
+        with patch.object(router_mod, "_ROUTE_MEMO_SIZE", 2):
+            for prompt in ("a", "b", "c", "a"):
+                router.route(prompt, [])
+        assert inner.route.call_count == 4
+
     @pytest.mark.invariant
     def test_route_with_json_routing_object_exact_keys(self, capsys):
         """Invariant: --route with --json: routing object has exact keys."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "say back hi", "--route", "--json"],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -442,11 +1064,11 @@ class TestRouteCli:
     def test_route_with_json_includes_routing_key(self, capsys):
         """--route with --json: stdout is valid JSON with 'routing' key."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "say back hi", "--route", "--json"],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -486,9 +1108,9 @@ class TestSkillCli:
 
     def test_list_skills_flag(self, capsys):
         """--list-skills prints discovered skills and exits 0."""
-        with patch("ore.cli.argparse._sys.argv", ["ore", "--list-skills"]):
+        with patch("sys.argv", ["ore", "--list-skills"]):
             with patch(
-                "ore.cli.build_skill_registry", return_value=self._skill_registry
+                "ore.skills.build_skill_registry", return_value=self._skill_registry
             ):
                 with pytest.raises(SystemExit) as exc_info:
                     from ore.cli import run
@@ -499,10 +1121,22 @@ class TestSkillCli:
         assert "test-skill" in out
         assert "A test skill" in out
 
+    def test_registry_not_scanned_without_skill_flags(self, capsys):
+        """Plain prompts never scan ~/.ore/skills/."""
+        with patch("sys.argv", ["ore", "hello"]):
+            with patch("ore.skills.build_skill_registry") as build:
+                with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                    with patch("ore.models.default_model", return_value="fake-model"):
+                        from ore.cli import run
+
+                        run()
+        build.assert_not_called()
+        assert "fake response" in capsys.readouterr().out
+
     def test_list_skills_empty(self, capsys):
         """--list-skills with no skills prints message and exits 0."""
-        with patch("ore.cli.argparse._sys.argv", ["ore", "--list-skills"]):
-            with patch("ore.cli.build_skill_registry", return_value={}):
+        with patch("sys.argv", ["ore", "--list-skills"]):
+            with patch("ore.skills.build_skill_registry", return_value={}):
                 with pytest.raises(SystemExit) as exc_info:
                     from ore.cli import run
 
@@ -514,13 +1148,13 @@ class TestSkillCli:
     def test_skill_flag_loads_and_injects(self, capsys):
         """--skill NAME loads instructions and passes skill_context to engine."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--skill", "test-skill", "--json"],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     with patch(
-                        "ore.cli.build_skill_registry",
+                        "ore.skills.build_skill_registry",
                         return_value=self._skill_registry,
                     ):
                         from ore.cli import run
@@ -533,7 +1167,7 @@ class TestSkillCli:
     def test_skill_and_tool_coexist(self, capsys):
         """--skill and --tool can be used together."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             [
                 "ore",
                 "hello",
@@ -546,10 +1180,10 @@ class TestSkillCli:
                 "--json",
             ],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     with patch(
-                        "ore.cli.build_skill_registry",
+                        "ore.skills.build_skill_registry",
                         return_value=self._skill_registry,
                     ):
                         from ore.cli import run
@@ -562,11 +1196,11 @@ class TestSkillCli:
     def test_unknown_skill_exits(self, capsys):
         """--skill with unknown name prints error and exits 1."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--skill", "nonexistent"],
         ):
-            with patch("ore.cli.default_model", return_value="fake-model"):
-                with patch("ore.cli.build_skill_registry", return_value={}):
+            with patch("ore.models.default_model", return_value="fake-model"):
+                with patch("ore.skills.build_skill_registry", return_value={}):
                     with pytest.raises(SystemExit) as exc_info:
                         from ore.cli import run
 
@@ -578,13 +1212,13 @@ class TestSkillCli:
     def test_route_selects_skill(self, capsys):
         """--route with a skill-matching prompt dispatches correctly."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "activate test please", "--route", "--json"],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     with patch(
-                        "ore.cli.build_skill_registry",
+                        "ore.skills.build_skill_registry",
                         return_value=self._skill_registry,
                     ):
                         from ore.cli import run
@@ -597,6 +1231,98 @@ class TestSkillCli:
         assert data["routing"]["target"] == "test-skill"
         assert data["routing"]["target_type"] == "skill"
 
+    def test_artifact_lists_explicit_and_routed_skill_once(self, tmp_path, capsys):
+        out_path = tmp_path / "artifact.json"
+        argv = ["ore", "activate test", "--route", "--skill", "test-skill"]
+        with patch("sys.argv", argv + ["--artifact-out", str(out_path)]):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
+                    with patch(
+                        "ore.skills.build_skill_registry",
+                        return_value=self._skill_registry,
+                    ):
+                        from ore.cli import run
+
+                        run()
+        data = json.loads(out_path.read_text())
+        assert data["input"]["skills"] == ["test-skill"]
+
+    def test_skill_instructions_cached_until_edited(self):
+        import os
+
+        from ore.cli import _skill_instructions
+
+        skill_dir = self._skill_registry["test-skill"].path
+        skill_file = skill_dir / "SKILL.md"
+        with patch(
+            "ore.skills.load_skill_instructions",
+            wraps=__import__("ore.skills", fromlist=["x"]).load_skill_instructions,
+        ) as load:
+            assert _skill_instructions(skill_dir) == "Be concise and factual."
+            assert _skill_instructions(skill_dir) == "Be concise and factual."
+            assert load.call_count == 1
+            skill_file.write_text(
+                "---\nname: test-skill\ndescription: d\n---\nBe brief.\n",
+                encoding="utf-8",
+            )
+            st = skill_file.stat()
+            os.utime(skill_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            assert _skill_instructions(skill_dir) == "Be brief."
+            assert load.call_count == 2
+
+    def test_repl_picks_up_edited_skill(self):
+        """--skill in a REPL: SKILL.md edited mid-session applies to the next turn."""
+        import os
+
+        skill_file = self._skill_registry["test-skill"].path / "SKILL.md"
+        seen = []
+
+        class EditingReasoner(FakeReasoner):
+            def reason(self, messages):
+                seen.append([m.content for m in messages if "[Skill:" in m.content])
+                skill_file.write_text(
+                    "---\nname: test-skill\ndescription: d\n---\nBe brief.\n",
+                    encoding="utf-8",
+                )
+                st = skill_file.stat()
+                os.utime(skill_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+                return super().reason(messages)
+
+        fake_stdin = io.StringIO("one\ntwo\n")
+        fake_stdin.isatty = lambda: False
+        with patch("sys.argv", ["ore", "-i", "--skill", "test-skill"]):
+            with patch("ore.cli.sys.stdin", fake_stdin):
+                with patch("ore.reasoner.AyaReasoner", return_value=EditingReasoner()):
+                    with patch("ore.models.default_model", return_value="fake-model"):
+                        with patch(
+                            "ore.skills.build_skill_registry",
+                            return_value=self._skill_registry,
+                        ):
+                            from ore.cli import run
+
+                            run()
+        assert "Be concise and factual." in seen[0][0]
+        assert "Be brief." in seen[1][0]
+
+    def test_repl_skill_context_does_not_accumulate(self):
+        """--skill + --route in a REPL: each turn sees the skill once."""
+        reasoner = FakeReasoner()
+        fake_stdin = io.StringIO("activate test one\nactivate test two\n")
+        fake_stdin.isatty = lambda: False
+        with patch("sys.argv", ["ore", "-i", "--route", "--skill", "test-skill"]):
+            with patch("ore.cli.sys.stdin", fake_stdin):
+                with patch("ore.reasoner.AyaReasoner", return_value=reasoner):
+                    with patch("ore.models.default_model", return_value="fake-model"):
+                        with patch(
+                            "ore.skills.build_skill_registry",
+                            return_value=self._skill_registry,
+                        ):
+                            from ore.cli import run
+
+                            run()
+        skills = [m for m in reasoner.last_messages if "[Skill:" in m.content]
+        assert len(skills) == 2  # explicit --skill + route-selected skill
+
 
 class TestArtifactCli:
     """Tests for v0.9 --artifact-out / --artifact-in."""
@@ -605,11 +1331,11 @@ class TestArtifactCli:
         """--artifact-out produces valid JSON with artifact_version and required keys."""
         out_path = tmp_path / "artifact.json"
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-out", str(out_path)],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -631,11 +1357,11 @@ class TestArtifactCli:
     def test_artifact_out_to_stdout(self, capsys):
         """--artifact-out - writes artifact JSON to stdout."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-out", "-"],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -648,11 +1374,11 @@ class TestArtifactCli:
     def test_artifact_out_stdout_always_allowed(self, capsys):
         """--artifact-out - (stdout) is always allowed; no path validation."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-out", "-"],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -664,11 +1390,11 @@ class TestArtifactCli:
         """--artifact-out to a path under cwd is allowed."""
         out_path = tmp_path / "artifact.json"
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-out", str(out_path)],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -679,11 +1405,11 @@ class TestArtifactCli:
     def test_artifact_out_dotdot_path_rejected(self, capsys):
         """--artifact-out with .. in path is rejected (exit 1)."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-out", "../../etc/artifact.json"],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     with pytest.raises(SystemExit) as exc_info:
                         from ore.cli import run
 
@@ -692,6 +1418,40 @@ class TestArtifactCli:
         err = capsys.readouterr().err
         assert ".." in err or "Artifact" in err
 
+    def test_validate_relative_output_path_skips_resolve(self, tmp_path, capsys):
+        import os
+
+        from ore.cli import _validate_output_path
+
+        with patch("ore.cli.Path.resolve", side_effect=AssertionError):
+            out = _validate_output_path("sub/artifact.json")
+        assert out == Path(os.getcwd()) / "sub" / "artifact.json"
+        assert capsys.readouterr().err == ""
+
+    def test_validate_relative_output_path_through_symlink_warns(
+        self, tmp_path, capsys, monkeypatch
+    ):
+        from ore.cli import _validate_output_path
+
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        cwd = tmp_path / "work"
+        cwd.mkdir()
+        (cwd / "link").symlink_to(outside)
+        monkeypatch.chdir(cwd)
+        out = _validate_output_path("link/a.json")
+        assert out == (outside / "a.json").resolve()
+        assert "outside working directory" in capsys.readouterr().err
+
+    def test_validate_absolute_output_path_outside_cwd_warns(self, tmp_path, capsys):
+        from ore.cli import _validate_output_path
+
+        target = tmp_path / "artifact.json"
+        with patch("ore.cli.os.getcwd", return_value=str(tmp_path / "elsewhere")):
+            out = _validate_output_path(str(target))
+        assert out == target.resolve()
+        assert "outside working directory" in capsys.readouterr().err
+
     def test_artifact_in_reproduces_prompt(self, tmp_path, capsys):
         """--artifact-in runs single-turn with artifact's input.prompt."""
         artifact_path = tmp_path / "prev.json"
@@ -718,11 +1478,11 @@ class TestArtifactCli:
             )
         )
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "--artifact-in", str(artifact_path)],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -753,10 +1513,10 @@ class TestArtifactCli:
             }
         )
         fake_stdin = io.StringIO(artifact_json)
-        with patch("ore.cli.argparse._sys.argv", ["ore", "--artifact-in", "-"]):
+        with patch("sys.argv", ["ore", "--artifact-in", "-"]):
             with patch("ore.cli.sys.stdin", fake_stdin):
-                with patch("ore.cli.AyaReasoner", FakeReasoner):
-                    with patch("ore.cli.default_model", return_value="fake-model"):
+                with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                    with patch("ore.models.default_model", return_value="fake-model"):
                         from ore.cli import run
 
                         run()
@@ -767,11 +1527,11 @@ class TestArtifactCli:
         """--artifact-out FILE --json: JSON on stdout, artifact in file."""
         out_path = tmp_path / "artifact.json"
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-out", str(out_path), "--json"],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -812,11 +1572,11 @@ class TestArtifactCli:
             )
         )
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "--artifact-in", str(in_path), "--artifact-out", str(out_path)],
         ):
-            with patch("ore.cli.AyaReasoner", FakeReasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
@@ -830,9 +1590,9 @@ class TestArtifactCli:
     def test_artifact_in_malformed_json_exits_1(self, capsys):
         """--artifact-in - with malformed JSON on stdin exits 1."""
         fake_stdin = io.StringIO("not json at all")
-        with patch("ore.cli.argparse._sys.argv", ["ore", "--artifact-in", "-"]):
+        with patch("sys.argv", ["ore", "--artifact-in", "-"]):
             with patch("ore.cli.sys.stdin", fake_stdin):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     with pytest.raises(SystemExit) as exc_info:
                         from ore.cli import run
 
@@ -841,14 +1601,43 @@ class TestArtifactCli:
         err = capsys.readouterr().err
         assert "invalid" in err.lower() or "json" in err.lower()
 
+    def test_artifact_in_non_utf8_file_exits_1(self, tmp_path, capsys):
+        """--artifact-in file that is not UTF-8 exits 1 like malformed JSON."""
+        bad = tmp_path / "bad.json"
+        bad.write_bytes(b'{"artifact_version": "\xff"}')
+        with patch("sys.argv", ["ore", "--artifact-in", str(bad)]):
+            with patch("ore.models.default_model", return_value="fake-model"):
+                with pytest.raises(SystemExit) as exc_info:
+                    from ore.cli import run
+
+                    run()
+        assert exc_info.value.code == 1
+        assert "Invalid artifact JSON" in capsys.readouterr().err
+
+    def test_json_loads_same_with_and_without_orjson(self):
+        import sys
+
+        from ore.cli import _json_loads
+
+        raw = '{"content":"caf\u00e9","n":[1,2.5,null]}'
+        with patch.dict(sys.modules, {"orjson": None}):
+            fallback = _json_loads(raw.encode())
+            with pytest.raises(ValueError):
+                _json_loads("not json")
+        assert fallback == {"content": "caf\u00e9", "n": [1, 2.5, None]}
+        pytest.importorskip("orjson")
+        assert _json_loads(raw) == _json_loads(raw.encode()) == fallback
+        with pytest.raises(ValueError):
+            _json_loads("not json")
+
     def test_invalid_artifact_exits_1(self, capsys):
         """Invalid artifact (missing version) exits 1 with stderr message."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "--artifact-in", "-"],
         ):
             with patch("ore.cli.sys.stdin", io.StringIO('{"input":{},"output":{}}')):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     with pytest.raises(SystemExit) as exc_info:
                         from ore.cli import run
 
@@ -861,7 +1650,7 @@ class TestArtifactCli:
     def test_artifact_in_with_prompt_rejected(self, capsys):
         """--artifact-in and prompt are mutually exclusive."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-in", "/dev/null"],
         ):
             with pytest.raises(SystemExit):
@@ -875,7 +1664,7 @@ class TestArtifactCli:
     def test_artifact_out_with_stream_rejected(self, capsys):
         """--artifact-out and --stream are mutually exclusive."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-out", "-", "--stream"],
         ):
             with pytest.raises(SystemExit):
@@ -889,7 +1678,7 @@ class TestArtifactCli:
     def test_artifact_out_with_json_to_stdout_rejected(self, capsys):
         """--artifact-out - and --json are mutually exclusive (both stdout)."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-out", "-", "--json"],
         ):
             with pytest.raises(SystemExit):
@@ -903,7 +1692,7 @@ class TestArtifactCli:
     def test_artifact_in_with_interactive_rejected(self, capsys):
         """--artifact-in with -i is rejected (single-turn only)."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "--artifact-in", "/dev/null", "-i"],
         ):
             with pytest.raises(SystemExit):
@@ -919,7 +1708,7 @@ class TestArtifactCli:
     def test_artifact_in_with_conversational_rejected(self, capsys):
         """--artifact-in with -c is rejected (single-turn only)."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "--artifact-in", "/dev/null", "-c"],
         ):
             with pytest.raises(SystemExit):
@@ -935,7 +1724,7 @@ class TestArtifactCli:
     def test_artifact_in_with_tool_rejected(self, capsys):
         """--artifact-in with --tool is rejected (mutually exclusive)."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "--artifact-in", "/dev/null", "--tool", "echo"],
         ):
             with pytest.raises(SystemExit):
@@ -949,7 +1738,7 @@ class TestArtifactCli:
     def test_artifact_in_with_route_rejected(self, capsys):
         """--artifact-in with --route is rejected (mutually exclusive)."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "--artifact-in", "/dev/null", "--route"],
         ):
             with pytest.raises(SystemExit):
@@ -963,7 +1752,7 @@ class TestArtifactCli:
     def test_artifact_in_with_skill_rejected(self, capsys):
         """--artifact-in with --skill is rejected (mutually exclusive)."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "--artifact-in", "/dev/null", "--skill", "foo"],
         ):
             with pytest.raises(SystemExit):
@@ -977,7 +1766,7 @@ class TestArtifactCli:
     def test_artifact_out_with_interactive_rejected(self, capsys):
         """--artifact-out with -i is rejected (single-turn only)."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-out", "-", "-i"],
         ):
             with pytest.raises(SystemExit):
@@ -993,7 +1782,7 @@ class TestArtifactCli:
     def test_artifact_out_with_conversational_rejected(self, capsys):
         """--artifact-out with -c is rejected (single-turn only)."""
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-out", "-", "-c"],
         ):
             with pytest.raises(SystemExit):
@@ -1017,11 +1806,11 @@ class TestArtifactCli:
             return inst
 
         with patch(
-            "ore.cli.argparse._sys.argv",
+            "sys.argv",
             ["ore", "hello", "--artifact-out", str(out_path)],
         ):
-            with patch("ore.cli.AyaReasoner", side_effect=capture_reasoner):
-                with patch("ore.cli.default_model", return_value="fake-model"):
+            with patch("ore.reasoner.AyaReasoner", side_effect=capture_reasoner):
+                with patch("ore.models.default_model", return_value="fake-model"):
                     from ore.cli import run
 
                     run()
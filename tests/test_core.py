@@ -143,6 +143,20 @@ class TestOREExecute:
         engine.execute("hi", tool_results=[tr])
         assert fake_reasoner.reason_call_count == 1
 
+    def test_system_message_built_once(self, fake_reasoner: FakeReasoner):
+        engine = ORE(fake_reasoner, system_prompt=_TEST_SYSTEM_PROMPT)
+        engine.execute("one")
+        first = fake_reasoner.last_messages[0]
+        engine.execute("two")
+        assert fake_reasoner.last_messages[0] is first
+
+    def test_reassigned_system_prompt_is_used(self, fake_reasoner: FakeReasoner):
+        engine = ORE(fake_reasoner, system_prompt=_TEST_SYSTEM_PROMPT)
+        engine.system_prompt = "Other."
+        engine.execute("hi")
+        assert engine.system_prompt == "Other."
+        assert fake_reasoner.last_messages[0].content == "Other."
+
 
 class TestOREExecuteStream:
     def test_stream_yields_chunks(self, fake_reasoner: FakeReasoner):
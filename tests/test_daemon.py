@@ -0,0 +1,192 @@
+"""Tests for ore/daemon.py — Unix-socket daemon (--daemon / --via-daemon)."""
+
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ore.core import ORE
+from ore.daemon import DaemonError, bind, request, serve
+
+from .conftest import FakeReasoner
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets"
+)
+
+
+@pytest.fixture
+def sock_path():
+    # Short directory: Unix socket paths are limited to ~100 bytes
+    with tempfile.TemporaryDirectory(prefix="ore") as d:
+        yield Path(d) / "ore.sock"
+
+
+def _start(engine, path, max_requests):
+    sock = bind(path)
+    thread = threading.Thread(target=serve, args=(engine, sock, max_requests))
+    thread.start()
+    return thread
+
+
+class TestDaemon:
+    def test_request_round_trip(self, sock_path):
+        inner = FakeReasoner(canned="from daemon")
+        thread = _start(ORE(inner), sock_path, 2)
+        first = request("one", sock_path)
+        second = request("two", sock_path)
+        thread.join(5)
+        assert first.content == second.content == "from daemon"
+        assert first.model_id == "fake-model"
+        assert first.id != second.id
+        assert inner.reason_call_count == 2
+        assert inner.last_messages[-1].content == "two"
+        assert not sock_path.exists()
+
+    def test_socket_is_private(self, sock_path):
+        sock = bind(sock_path)
+        try:
+            assert sock_path.stat().st_mode & 0o077 == 0
+        finally:
+            sock.close()
+
+    def test_no_daemon_raises(self, sock_path):
+        with pytest.raises(DaemonError, match="No ORE daemon listening"):
+            request("hi", sock_path)
+
+    def test_stale_socket_replaced(self, sock_path):
+        bind(sock_path).close()  # leaves the socket file behind
+        assert sock_path.exists()
+        thread = _start(ORE(FakeReasoner()), sock_path, 1)
+        assert request("hi", sock_path).content == "fake response"
+        thread.join(5)
+
+    def test_second_daemon_refused(self, sock_path):
+        sock = bind(sock_path)
+        try:
+            with pytest.raises(DaemonError, match="already listening"):
+                bind(sock_path)
+        finally:
+            sock.close()
+
+    def test_bind_error_raises_daemon_error(self, sock_path):
+        too_long = sock_path.parent / ("x" * 200) / "ore.sock"
+        with pytest.raises(DaemonError, match="Cannot"):
+            bind(too_long)
+
+    def test_probe_permission_error_keeps_socket_file(self, sock_path):
+        bind(sock_path).close()
+        with patch("socket.socket.connect", side_effect=PermissionError(13, "denied")):
+            with pytest.raises(DaemonError, match="Cannot probe"):
+                bind(sock_path)
+        assert sock_path.exists()
+
+    def test_turn_error_reported_to_client(self, sock_path):
+        class Failing(FakeReasoner):
+            def reason(self, messages):
+                raise RuntimeError("backend down")
+
+        thread = _start(ORE(Failing()), sock_path, 1)
+        with pytest.raises(DaemonError, match="backend down"):
+            request("hi", sock_path)
+        thread.join(5)
+
+    def test_stalled_client_does_not_block_others(self, sock_path):
+        sock = bind(sock_path)
+        thread = threading.Thread(
+            target=serve, args=(ORE(FakeReasoner()), sock, 2), kwargs={"timeout": 0.2}
+        )
+        thread.start()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled:
+            stalled.connect(str(sock_path))  # never sends a line
+            assert request("hi", sock_path).content == "fake response"
+            assert b"timed out" in stalled.recv(4096)
+        thread.join(5)
+        assert not thread.is_alive()
+
+    def test_permission_denied_raises_daemon_error(self, sock_path):
+        with patch("socket.socket.connect", side_effect=PermissionError(13, "denied")):
+            with pytest.raises(DaemonError, match="Permission denied"):
+                request("hi", sock_path)
+
+    def test_oversized_reply_raises_daemon_error(self, sock_path):
+        server = bind(sock_path)
+
+        def flood():
+            conn, _ = server.accept()
+            with conn:
+                conn.recv(4096)
+                conn.sendall(b"x" * 64)
+
+        thread = threading.Thread(target=flood)
+        thread.start()
+        try:
+            with patch("ore.daemon._MAX_LINE_BYTES", 8):
+                with pytest.raises(DaemonError, match="too large"):
+                    request("hi", sock_path)
+        finally:
+            thread.join(5)
+            server.close()
+
+
+class TestDaemonCli:
+    def test_via_daemon_prints_reply(self, sock_path, capsys):
+        thread = _start(ORE(FakeReasoner(canned="warm answer")), sock_path, 1)
+        with patch("ore.daemon.default_socket_path", return_value=sock_path):
+            with patch("sys.argv", ["ore", "hello", "--via-daemon"]):
+                from ore.cli import run
+
+                run()
+        thread.join(5)
+        out = capsys.readouterr().out
+        assert "[AYA]: warm answer" in out
+        assert "Using model" not in out
+
+    def test_via_daemon_without_daemon_exits_1(self, sock_path, capsys):
+        with patch("ore.daemon.default_socket_path", return_value=sock_path):
+            with patch("sys.argv", ["ore", "hello", "--via-daemon"]):
+                from ore.cli import run
+
+                with pytest.raises(SystemExit) as exc:
+                    run()
+        assert exc.value.code == 1
+        assert "--daemon" in capsys.readouterr().err
+
+    def test_daemon_bind_error_exits_1(self, sock_path, capsys):
+        too_long = sock_path.parent / ("x" * 200) / "ore.sock"
+        with patch("ore.daemon.default_socket_path", return_value=too_long):
+            with patch("sys.argv", ["ore", "--daemon"]):
+                with patch("ore.reasoner.AyaReasoner", FakeReasoner):
+                    with patch("ore.models.default_model", return_value="fake-model"):
+                        from ore.cli import run
+
+                        with pytest.raises(SystemExit) as exc:
+                            run()
+        assert exc.value.code == 1
+        assert "Cannot" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["ore", "--daemon", "prompt"],
+            ["ore", "--daemon", "--via-daemon"],
+            ["ore", "--daemon", "-i"],
+            ["ore", "--daemon", "--route"],
+            ["ore", "p", "--via-daemon", "--stream"],
+            ["ore", "p", "--via-daemon", "--tool", "echo"],
+            ["ore", "p", "--via-daemon", "--model", "m"],
+            ["ore", "p", "--via-daemon", "--backend", "deepseek"],
+            ["ore", "p", "--via-daemon", "--grant", "shell"],
+            ["ore", "p", "--via-daemon", "--route-threshold", "0.9"],
+        ],
+    )
+    def test_invalid_combinations_exit_2(self, argv):
+        with patch("sys.argv", argv):
+            from ore.cli import run
+
+            with pytest.raises(SystemExit) as exc:
+                run()
+        assert exc.value.code == 2
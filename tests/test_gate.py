@@ -71,6 +71,29 @@ class TestGate:
         assert "checked_permissions" in result.metadata
         assert "filesystem-read" in result.metadata["checked_permissions"]
 
+    def test_partial_grant_denied_with_missing_only(self):
+        class Multi(EchoTool):
+            @property
+            def required_permissions(self):
+                return frozenset({Permission.SHELL, Permission.NETWORK})
+
+        gate = Gate(frozenset({Permission.SHELL, Permission.FILESYSTEM_READ}))
+        with pytest.raises(GateError) as exc_info:
+            gate.check(Multi())
+        assert exc_info.value.missing == frozenset({Permission.NETWORK})
+        Gate(frozenset({Permission.SHELL, Permission.NETWORK})).check(Multi())
+
+    def test_permissions_reported_sorted(self):
+        class Multi(EchoTool):
+            @property
+            def required_permissions(self):
+                return frozenset({Permission.SHELL, Permission.NETWORK})
+
+        result = Gate.permissive().run(Multi(), {})
+        assert result.metadata["checked_permissions"] == ["network", "shell"]
+        with pytest.raises(GateError, match="missing permissions: network, shell"):
+            Gate(frozenset()).run(Multi(), {})
+
 
 # Permission enum exact values (interface lock). No removals; additions allowed.
 PERMISSION_VALUES = frozenset(
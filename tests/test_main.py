@@ -0,0 +1,47 @@
+"""Tests for main.py — entry point startup behaviour."""
+
+from unittest.mock import patch
+
+import main
+
+
+class TestFindEnvFile:
+    def test_finds_env_in_ancestor(self, tmp_path):
+        (tmp_path / ".env").write_text("X=1\n")
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        with patch.object(main, "__file__", str(nested / "main.py")):
+            assert main._find_env_file() == tmp_path / ".env"
+
+    def test_nearest_env_wins(self, tmp_path):
+        (tmp_path / ".env").write_text("X=1\n")
+        inner = tmp_path / "inner"
+        inner.mkdir()
+        (inner / ".env").write_text("X=2\n")
+        with patch.object(main, "__file__", str(inner / "main.py")):
+            assert main._find_env_file() == inner / ".env"
+
+    def test_directory_named_env_ignored(self, tmp_path):
+        (tmp_path / ".env").mkdir()
+        with patch.object(main, "__file__", str(tmp_path / "main.py")):
+            found = main._find_env_file()
+        assert found != tmp_path / ".env"
+
+
+class TestMainDotenv:
+    def test_skips_dotenv_without_env_file(self):
+        with patch.object(main, "_find_env_file", return_value=None):
+            with patch("dotenv.load_dotenv") as load:
+                with patch("sys.argv", ["main.py", "prompt"]):
+                    with patch("ore.cli.run"):
+                        main.main()
+        load.assert_not_called()
+
+    def test_loads_found_env_file(self, tmp_path):
+        env = tmp_path / ".env"
+        with patch.object(main, "_find_env_file", return_value=env):
+            with patch("dotenv.load_dotenv") as load:
+                with patch("sys.argv", ["main.py", "prompt"]):
+                    with patch("ore.cli.run"):
+                        main.main()
+        load.assert_called_once_with(env)
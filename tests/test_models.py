@@ -5,7 +5,27 @@ from __future__ import annotations
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from ore.models import PREFERRED_MODELS, default_model, fetch_models
+import pytest
+
+from ore import models
+from ore.models import (
+    PREFERRED_MODELS,
+    cached_models,
+    clear_model_cache,
+    default_model,
+    fetch_models,
+    sorted_models,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_model_cache(tmp_path, monkeypatch):
+    """fetch_models() caches per process; isolate each test (and the disk cache)."""
+    monkeypatch.delenv("OLLAMA_HOST", raising=False)
+    clear_model_cache()
+    with patch("ore.models.Path.home", return_value=tmp_path):
+        yield
+    clear_model_cache()
 
 
 def _fake_client(model_names: list[str]) -> MagicMock:
@@ -29,6 +49,64 @@ class TestFetchModels:
             assert fetch_models() == []
 
 
+class TestModelCache:
+    def test_server_queried_once(self):
+        client = _fake_client(["llama3.2:latest"])
+        with patch("ore.models.Client", return_value=client):
+            fetch_models()
+            default_model()
+            assert fetch_models() == ["llama3.2:latest"]
+        client.list.assert_called_once()
+
+    def test_returns_independent_copies(self):
+        client = _fake_client(["llama3.2:latest"])
+        with patch("ore.models.Client", return_value=client):
+            fetch_models().append("junk")
+            assert fetch_models() == ["llama3.2:latest"]
+
+    def test_clear_forces_requery(self):
+        with patch("ore.models.Client", return_value=_fake_client(["a:latest"])):
+            assert fetch_models() == ["a:latest"]
+        clear_model_cache()
+        with patch("ore.models.Client", return_value=_fake_client(["b:latest"])):
+            assert fetch_models() == ["b:latest"]
+
+    def test_requeries_after_ttl(self):
+        client = _fake_client(["a:latest"])
+        with patch("ore.models.Client", return_value=client) as ctor:
+            with patch("ore.models.time.monotonic", return_value=0.0):
+                fetch_models()
+                fetch_models()
+            assert client.list.call_count == 1
+            with patch(
+                "ore.models.time.monotonic", return_value=models.FETCH_CACHE_TTL_S
+            ):
+                fetch_models()
+        assert client.list.call_count == 2
+        assert ctor.call_count == 1  # client reused across re-queries
+
+    def test_hosts_cached_separately(self):
+        client = _fake_client(["a:latest"])
+        with patch("ore.models.Client", return_value=client):
+            fetch_models("http://one:11434")
+            fetch_models("http://two:11434")
+            fetch_models("http://one:11434")
+        assert client.list.call_count == 2
+
+
+class TestSortedModels:
+    def test_sorted_order(self):
+        client = _fake_client(["mistral:latest", "llama3.2:latest"])
+        with patch("ore.models.Client", return_value=client):
+            assert sorted_models() == ["llama3.2:latest", "mistral:latest"]
+
+    def test_returns_fresh_list(self):
+        client = _fake_client(["b:latest", "a:latest"])
+        with patch("ore.models.Client", return_value=client):
+            sorted_models().append("junk")
+            assert sorted_models() == ["a:latest", "b:latest"]
+
+
 class TestDefaultModel:
     def test_picks_preferred(self):
         client = _fake_client(["mistral:latest", "llama3.2:latest"])
@@ -55,3 +133,94 @@ class TestDefaultModel:
         with patch("ore.models.Client", return_value=client):
             result = default_model()
         assert result == f"{PREFERRED_MODELS[0]}:latest"
+
+
+class _InlineThread:
+    """threading.Thread stand-in that runs its target on start()."""
+
+    def __init__(self, target, args=(), daemon=None):
+        self._target, self._args = target, args
+
+    def start(self):
+        self._target(*self._args)
+
+
+class TestCachedModels:
+    def test_first_call_queries_and_writes_cache(self, tmp_path):
+        client = _fake_client(["llama3.2:latest"])
+        with patch("ore.models.Client", return_value=client):
+            assert cached_models() == ["llama3.2:latest"]
+        assert (tmp_path / ".ore" / "cache" / "models.json").exists()
+
+    def test_fresh_cache_skips_server(self):
+        with patch("ore.models.Client", return_value=_fake_client(["a:latest"])):
+            cached_models()
+        clear_model_cache()
+        client = _fake_client(["b:latest"])
+        with patch("ore.models.Client", return_value=client):
+            assert cached_models() == ["a:latest"]
+            assert default_model(cached=True) == "a:latest"
+        client.list.assert_not_called()
+
+    def test_stale_cache_returned_then_refreshed(self):
+        with patch("ore.models.Client", return_value=_fake_client(["a:latest"])):
+            cached_models()
+        clear_model_cache()
+        client = _fake_client(["b:latest"])
+        with patch("ore.models.Client", return_value=client):
+            with patch.object(models, "MODELS_CACHE_TTL_S", -1.0):
+                with patch("ore.models.threading.Thread", _InlineThread):
+                    assert cached_models() == ["a:latest"]
+            client.list.assert_called_once()
+            with patch.object(models, "MODELS_CACHE_TTL_S", 3600.0):
+                assert cached_models() == ["b:latest"]
+
+    def test_failed_refresh_keeps_stale_list(self):
+        with patch("ore.models.Client", return_value=_fake_client(["a:latest"])):
+            cached_models()
+        broken = MagicMock()
+        broken.list.side_effect = ConnectionError("server down")
+        with patch("ore.models.Client", return_value=broken):
+            with patch.object(models, "MODELS_CACHE_TTL_S", -1.0):
+                with patch("ore.models.threading.Thread", _InlineThread):
+                    assert cached_models() == ["a:latest"]
+                    assert cached_models() == ["a:latest"]
+
+    def test_refresh_requeries(self):
+        with patch("ore.models.Client", return_value=_fake_client(["a:latest"])):
+            cached_models()
+        clear_model_cache()
+        with patch("ore.models.Client", return_value=_fake_client(["b:latest"])):
+            assert cached_models(refresh=True) == ["b:latest"]
+            assert cached_models() == ["b:latest"]
+
+    def test_empty_list_not_cached(self, tmp_path):
+        with patch("ore.models.Client", return_value=_fake_client([])):
+            assert cached_models() == []
+        assert not (tmp_path / ".ore" / "cache" / "models.json").exists()
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        path = tmp_path / ".ore" / "cache" / "models.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json", encoding="utf-8")
+        with patch("ore.models.Client", return_value=_fake_client(["a:latest"])):
+            assert cached_models() == ["a:latest"]
+        assert cached_models() == ["a:latest"]
+
+    def test_cache_is_per_host(self):
+        with patch("ore.models.Client", return_value=_fake_client(["a:latest"])):
+            cached_models()
+        with patch("ore.models.Client", return_value=_fake_client(["b:latest"])):
+            assert cached_models("http://other:11434") == ["b:latest"]
+        assert cached_models() == ["a:latest"]
+
+    def test_cache_follows_ollama_host_env(self, monkeypatch):
+        monkeypatch.setenv("OLLAMA_HOST", "http://first:11434")
+        with patch("ore.models.Client", return_value=_fake_client(["a:latest"])):
+            cached_models()
+        clear_model_cache()
+        monkeypatch.setenv("OLLAMA_HOST", "http://second:11434")
+        with patch("ore.models.Client", return_value=_fake_client(["b:latest"])):
+            assert cached_models() == ["b:latest"]
+        monkeypatch.setenv("OLLAMA_HOST", "http://first:11434")
+        assert cached_models() == ["a:latest"]
@@ -9,10 +9,19 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from ore.models import clear_model_cache
 from ore.reasoner import AyaReasoner, Reasoner
 from ore.types import Message, Response
 
 
+@pytest.fixture(autouse=True)
+def _fresh_clients():
+    """Clients are shared per process; each test patches in its own fake."""
+    clear_model_cache()
+    yield
+    clear_model_cache()
+
+
 @pytest.mark.invariant
 def test_reasoner_abc_has_required_members():
     """Invariant: Reasoner ABC defines reason() and stream_reason()."""
@@ -60,11 +69,29 @@ def _make_ollama_response(
 
 
 class TestAyaReasoner:
+    def test_client_shared_per_host(self):
+        with patch("ore.models.Client", side_effect=lambda **kw: MagicMock()) as ctor:
+            a = AyaReasoner(model_id="a")
+            b = AyaReasoner(model_id="b")
+            remote = AyaReasoner(model_id="a", host="http://gpu:11434")
+        assert a._client is b._client
+        assert remote._client is not a._client
+        assert ctor.call_count == 2
+
+    def test_client_shared_with_models_and_cleared_with_it(self):
+        from ore.models import _client
+
+        with patch("ore.models.Client", side_effect=lambda **kw: MagicMock()):
+            first = AyaReasoner()
+            assert first._client is _client(None)
+            clear_model_cache()
+            assert AyaReasoner()._client is not first._client
+
     def test_reason_converts_messages(self):
         fake_client = MagicMock()
         fake_client.chat.return_value = _make_ollama_response("hello back")
 
-        with patch("ollama.Client", return_value=fake_client):
+        with patch("ore.models.Client", return_value=fake_client):
             reasoner = AyaReasoner(model_id="test-model")
 
         msgs = [
@@ -82,6 +109,18 @@ class TestAyaReasoner:
         ]
         assert resp.content == "hello back"
         assert resp.model_id == "test-model"
+        assert payload[1] is msgs[1].wire  # reused across turns, not rebuilt
+
+    def test_reason_without_message_gives_empty_content(self):
+        fake_client = MagicMock()
+        fake_client.chat.return_value = SimpleNamespace(message=None)
+
+        with patch("ore.models.Client", return_value=fake_client):
+            reasoner = AyaReasoner(model_id="m")
+
+        resp = reasoner.reason([Message(role="user", content="x")])
+        assert resp.content == ""
+        assert resp.metadata == {}
 
     def test_reason_extracts_metadata(self):
         fake_client = MagicMock()
@@ -92,7 +131,7 @@ class TestAyaReasoner:
             prompt_eval_duration=100,
         )
 
-        with patch("ollama.Client", return_value=fake_client):
+        with patch("ore.models.Client", return_value=fake_client):
             reasoner = AyaReasoner(model_id="m")
 
         resp = reasoner.reason([Message(role="user", content="x")])
@@ -112,7 +151,7 @@ class TestAyaReasoner:
             prompt_eval_duration=0,
         )
 
-        with patch("ollama.Client", return_value=fake_client):
+        with patch("ore.models.Client", return_value=fake_client):
             reasoner = AyaReasoner(model_id="m")
 
         resp = reasoner.reason([Message(role="user", content="x")])
@@ -133,7 +172,7 @@ class TestAyaReasoner:
 
         fake_client.chat.side_effect = chat_slow
 
-        with patch("ollama.Client", return_value=fake_client):
+        with patch("ore.models.Client", return_value=fake_client):
             reasoner = AyaReasoner(model_id="m")
 
         resp = reasoner.reason([Message(role="user", content="x")])
@@ -165,7 +204,7 @@ class TestAyaReasoner:
 
         fake_client.chat.side_effect = chat_stream
 
-        with patch("ollama.Client", return_value=fake_client):
+        with patch("ore.models.Client", return_value=fake_client):
             reasoner = AyaReasoner(model_id="m")
 
         gen = reasoner.stream_reason([Message(role="user", content="hi")])
@@ -197,8 +236,8 @@ class TestAyaReasoner:
         fake_client = MagicMock()
         fake_client.chat.return_value = iter(chunks)
 
-        with patch("ollama.Client", return_value=fake_client):
-            reasoner = AyaReasoner(model_id="m")
+        with patch("ore.models.Client", return_value=fake_client):
+            reasoner = AyaReasoner(model_id="m", flush_bytes=0)
 
         gen = reasoner.stream_reason([Message(role="user", content="hi")])
         collected = []
@@ -214,3 +253,40 @@ class TestAyaReasoner:
         assert resp.metadata["prompt_tokens"] == 5
         assert resp.metadata["completion_tokens"] == 10
         assert resp.metadata["total_tokens"] == 15
+
+    def test_stream_reason_default_yields_every_chunk(self):
+        chunks = [
+            SimpleNamespace(message=SimpleNamespace(content=t)) for t in ("a", "b")
+        ]
+        fake_client = MagicMock()
+        fake_client.chat.return_value = iter(chunks)
+
+        with patch("ore.models.Client", return_value=fake_client):
+            reasoner = AyaReasoner(model_id="m")
+
+        with patch("ore.reasoner.STREAM_FLUSH_INTERVAL_S", 60.0):
+            gen = reasoner.stream_reason([Message(role="user", content="hi")])
+            assert list(gen) == ["a", "b"]
+
+    def test_stream_reason_coalesces_small_chunks(self):
+        chunks = [
+            SimpleNamespace(message=SimpleNamespace(content=t))
+            for t in ("a", "b", "c", "d")
+        ]
+        fake_client = MagicMock()
+        fake_client.chat.return_value = iter(chunks)
+
+        with patch("ore.models.Client", return_value=fake_client):
+            reasoner = AyaReasoner(model_id="m", flush_bytes=2)
+
+        with patch("ore.reasoner.STREAM_FLUSH_INTERVAL_S", 60.0):
+            gen = reasoner.stream_reason([Message(role="user", content="hi")])
+            collected = []
+            try:
+                while True:
+                    collected.append(next(gen))
+            except StopIteration as exc:
+                resp = exc.value
+
+        assert collected == ["ab", "cd"]
+        assert resp.content == "abcd"
@@ -8,10 +8,18 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from ore.reasoner_deepseek import DeepSeekReasoner
+from ore.reasoner_deepseek import DeepSeekReasoner, _openai_client
 from ore.types import Message, Response
 
 
+@pytest.fixture(autouse=True)
+def _fresh_clients():
+    """Clients are shared per process; each test patches in its own fake."""
+    _openai_client.cache_clear()
+    yield
+    _openai_client.cache_clear()
+
+
 def test_missing_api_key_raises():
     """DeepSeekReasoner raises ValueError when DEEPSEEK_API_KEY is not set."""
     with patch.dict("os.environ", {}, clear=False):
@@ -22,6 +30,17 @@ def test_missing_api_key_raises():
     assert "DEEPSEEK_API_KEY" in str(excinfo.value)
 
 
+def test_client_shared_per_key_and_endpoint():
+    """Reasoners with the same key and base_url reuse one OpenAI client."""
+    with patch("openai.OpenAI", side_effect=lambda **kw: MagicMock()) as ctor:
+        a = DeepSeekReasoner(api_key="k")
+        b = DeepSeekReasoner(model_id="deepseek-reasoner", api_key="k")
+        other = DeepSeekReasoner(api_key="k2")
+    assert a._client is b._client
+    assert other._client is not a._client
+    assert ctor.call_count == 2
+
+
 def test_reason_converts_messages():
     """reason() sends correct payload and returns Response with content and metadata."""
     fake_completion = MagicMock()
@@ -34,7 +53,7 @@ def test_reason_converts_messages():
     fake_client = MagicMock()
     fake_client.chat.completions.create.return_value = fake_completion
 
-    with patch("ore.reasoner_deepseek.OpenAI", return_value=fake_client):
+    with patch("openai.OpenAI", return_value=fake_client):
         reasoner = DeepSeekReasoner(model_id="deepseek-chat", api_key="test-key")
 
     msgs = [
@@ -71,7 +90,7 @@ def test_reason_sets_duration_ms():
 
     fake_client.chat.completions.create.side_effect = create_slow
 
-    with patch("ore.reasoner_deepseek.OpenAI", return_value=fake_client):
+    with patch("openai.OpenAI", return_value=fake_client):
         reasoner = DeepSeekReasoner(model_id="deepseek-chat", api_key="test-key")
 
     resp = reasoner.reason([Message(role="user", content="x")])
@@ -86,7 +105,7 @@ def test_reason_no_usage_metadata():
     fake_client = MagicMock()
     fake_client.chat.completions.create.return_value = fake_completion
 
-    with patch("ore.reasoner_deepseek.OpenAI", return_value=fake_client):
+    with patch("openai.OpenAI", return_value=fake_client):
         reasoner = DeepSeekReasoner(model_id="deepseek-chat", api_key="test-key")
 
     resp = reasoner.reason([Message(role="user", content="x")])
@@ -112,8 +131,10 @@ def test_stream_reason_yields_chunks_and_returns_response():
     fake_client = MagicMock()
     fake_client.chat.completions.create.return_value = iter([chunk1, chunk2, chunk3])
 
-    with patch("ore.reasoner_deepseek.OpenAI", return_value=fake_client):
-        reasoner = DeepSeekReasoner(model_id="deepseek-chat", api_key="test-key")
+    with patch("openai.OpenAI", return_value=fake_client):
+        reasoner = DeepSeekReasoner(
+            model_id="deepseek-chat", api_key="test-key", flush_bytes=0
+        )
 
     gen = reasoner.stream_reason([Message(role="user", content="hi")])
     collected = []
@@ -147,7 +168,7 @@ def test_stream_reason_sets_duration_ms():
 
     fake_client.chat.completions.create.side_effect = create_stream
 
-    with patch("ore.reasoner_deepseek.OpenAI", return_value=fake_client):
+    with patch("openai.OpenAI", return_value=fake_client):
         reasoner = DeepSeekReasoner(model_id="deepseek-chat", api_key="test-key")
 
     gen = reasoner.stream_reason([Message(role="user", content="hi")])
@@ -157,3 +178,23 @@ def test_stream_reason_sets_duration_ms():
     except StopIteration as exc:
         resp = exc.value
     assert resp.duration_ms > 0
+
+
+def test_stream_reason_coalesces_and_flushes_tail():
+    """With a coalescing buffer, quick small chunks arrive as one piece."""
+    chunks = [
+        SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=t))], usage=None
+        )
+        for t in ("hel", "lo", "!")
+    ]
+    fake_client = MagicMock()
+    fake_client.chat.completions.create.return_value = iter(chunks)
+
+    with patch("openai.OpenAI", return_value=fake_client):
+        reasoner = DeepSeekReasoner(api_key="test-key", flush_bytes=64)
+
+    with patch("ore.reasoner.STREAM_FLUSH_INTERVAL_S", 60.0):
+        collected = list(reasoner.stream_reason([Message(role="user", content="hi")]))
+
+    assert collected == ["hello!"]
@@ -55,6 +55,61 @@ class TestRuleRouter:
         assert decision.target is None
         assert decision.target_type == "fallback"
 
+    def test_prompt_shorter_than_every_hint_skips_scan(self):
+        lowered = []
+
+        class Hint(str):
+            def lower(self):
+                lowered.append(str(self))
+                return super().lower()
+
+        target = RoutingTarget(
+            name="t", target_type="tool", description="", hints=[Hint("abcdefghij")]
+        )
+        decision = RuleRouter().route("hi", [target])
+        assert decision.target is None
+        assert decision.reasoning == "No hint matched the prompt."
+        # Only the length prefilter lowered the hint; no substring test ran
+        assert lowered == ["abcdefghij"]
+
+    def test_hints_lowered_once_per_target_set(self):
+        lowered = []
+
+        class Hint(str):
+            def lower(self):
+                lowered.append(str(self))
+                return super().lower()
+
+        target = RoutingTarget(
+            name="t", target_type="tool", description="", hints=[Hint("Lower Once")]
+        )
+        router = RuleRouter()
+        for prompt in ("please lower once", "lower once again", "nothing"):
+            router.route(prompt, [target])
+        assert lowered == ["Lower Once"]
+
+    def test_reports_longest_matching_hint(self):
+        target = RoutingTarget(
+            name="t",
+            target_type="tool",
+            description="",
+            hints=["read", "read the file", "file"],
+        )
+        decision = RuleRouter().route("please read the file now", [target])
+        assert decision.target == "t"
+        assert decision.confidence == 1.0
+        assert '"read the file"' in decision.reasoning
+
+    def test_short_prompt_equal_to_hint_still_matches(self):
+        target = RoutingTarget(
+            name="t", target_type="tool", description="", hints=["go"]
+        )
+        assert RuleRouter().route("go", [target]).target == "t"
+
+    def test_empty_hints_never_match(self):
+        target = RoutingTarget(name="t", target_type="tool", description="", hints=[""])
+        assert RuleRouter().route("anything", [target]).target is None
+
     def test_matches_echo_prompt(self):
         targets = build_targets_from_registry(TOOL_REGISTRY)
         # Use lower threshold so short hint "echo" (vs long "read the file") passes
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -70,6 +72,14 @@ def valid_skill_dir(tmp_path: Path) -> Path:
     return skill_dir
 
 
+@pytest.fixture(autouse=True)
+def _isolated_skills_cache(tmp_path: Path):
+    """Keep build_skill_registry's ~/.ore/cache/skills.json inside tmp_path."""
+    home = tmp_path / "home"
+    with patch("ore.skills.Path.home", return_value=home):
+        yield home
+
+
 @pytest.fixture
 def skills_root(tmp_path: Path) -> Path:
     """Root dir with two valid skills and one malformed."""
@@ -216,6 +226,53 @@ class TestBuildSkillRegistry:
         captured = capsys.readouterr()
         assert "Skipping skill" in captured.err
 
+    def test_symlinked_skill_dir_and_stray_files(self, tmp_path: Path) -> None:
+        outside = tmp_path / "elsewhere"
+        outside.mkdir()
+        (outside / "SKILL.md").write_text(VALID_SKILL_MD, encoding="utf-8")
+        root = tmp_path / "linked-skills"
+        root.mkdir()
+        (root / "linked").symlink_to(outside)
+        (root / "README.md").write_text("not a skill", encoding="utf-8")
+        (root / "empty").mkdir()  # directory without SKILL.md
+        registry = build_skill_registry(root)
+        assert list(registry) == ["test-skill"]
+        assert registry["test-skill"].path == outside.resolve()
+
+    def test_pure_python_yaml_fallback(self, skills_root: Path, monkeypatch) -> None:
+        """PyYAML built without libyaml has no CSafeLoader."""
+        monkeypatch.delattr("yaml.CSafeLoader", raising=False)
+        meta = load_skill_metadata(skills_root / "alpha")
+        assert meta.hints == ["test keyword", "another hint"]
+
+    def test_warm_build_skips_parsing(self, skills_root: Path, capsys) -> None:
+        cold = build_skill_registry(skills_root)
+        with patch("ore.skills._parse_frontmatter") as parse:
+            warm = build_skill_registry(skills_root)
+        # Only the malformed skill (never cached) is parsed again
+        assert parse.call_count == 1
+        assert warm == cold
+
+    def test_changed_skill_reparsed(self, skills_root: Path) -> None:
+        build_skill_registry(skills_root)
+        skill_md = skills_root / "alpha" / "SKILL.md"
+        skill_md.write_text(
+            VALID_SKILL_MD.replace("A test skill", "An edited skill"), encoding="utf-8"
+        )
+        st = skill_md.stat()
+        os.utime(skill_md, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        registry = build_skill_registry(skills_root)
+        assert registry["test-skill"].description.startswith("An edited skill")
+
+    def test_corrupt_cache_ignored(
+        self, skills_root: Path, _isolated_skills_cache: Path
+    ) -> None:
+        cache = _isolated_skills_cache / ".ore" / "cache" / "skills.json"
+        cache.parent.mkdir(parents=True)
+        cache.write_text("{not json", encoding="utf-8")
+        assert len(build_skill_registry(skills_root)) == 2
+        assert len(build_skill_registry(skills_root)) == 2
+
 
 # ---------------------------------------------------------------------------
 # build_targets_from_skill_registry
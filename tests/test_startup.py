@@ -0,0 +1,126 @@
+"""
+Startup regression gate: `python -X importtime` on ORE entry points.
+
+Thresholds are deliberately generous (CI runners vary); the module-absence
+checks are the precise part. On failure the assertion message lists the ten
+slowest imports. For a local visual breakdown:
+    python -X importtime -c "import ore.cli" 2> import.log && tuna import.log
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S+)")
+
+# Microseconds
+MAX_SINGLE_SELF_US = 200_000
+MAX_TOTAL_SELF_US = 500_000
+
+# Heavy third-party packages that must stay off each import path
+HEAVY_FOR_ORE = ("ollama", "openai", "yaml", "httpx", "dotenv")
+HEAVY_FOR_CLI = ("ollama", "openai", "yaml", "httpx", "sqlite3")
+# ORE submodules that only specific CLI branches need
+LAZY_FOR_CLI = (
+    "ore.core",
+    "ore.reasoner",
+    "ore.reasoner_deepseek",
+    "ore.skills",
+    "ore.router",
+    "ore.tools",
+    "ore.store",
+    "ore.daemon",
+)
+
+
+def _importtime(code: str) -> Dict[str, Tuple[int, int]]:
+    """Run code under -X importtime; return {module: (self_us, cumulative_us)}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=_ROOT,
+    )
+    times: Dict[str, Tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            times[m.group(3)] = (int(m.group(1)), int(m.group(2)))
+    return times
+
+
+def _top(times: Dict[str, Tuple[int, int]], n: int = 10) -> List[str]:
+    ranked = sorted(times.items(), key=lambda kv: kv[1][0], reverse=True)[:n]
+    return [f"{name}: {self_us} us" for name, (self_us, _) in ranked]
+
+
+@pytest.mark.parametrize("code", ["import ore", "import ore.cli"])
+def test_import_time_budget(code):
+    times = _importtime(code)
+    assert times, "no -X importtime output parsed"
+    worst = max(self_us for self_us, _ in times.values())
+    total = sum(self_us for self_us, _ in times.values())
+    offenders = "\n".join(_top(times))
+    assert worst <= MAX_SINGLE_SELF_US, f"{code}: slow import\n{offenders}"
+    if code == "import ore":
+        assert total <= MAX_TOTAL_SELF_US, f"{code}: total {total} us\n{offenders}"
+
+
+def test_import_ore_skips_heavy_dependencies():
+    times = _importtime("import ore")
+    loaded = [name for name in HEAVY_FOR_ORE if name in times]
+    assert loaded == [], f"`import ore` pulled in {loaded}"
+
+
+def test_import_cli_skips_heavy_dependencies():
+    times = _importtime("import ore.cli")
+    loaded = [name for name in HEAVY_FOR_CLI if name in times]
+    assert loaded == [], f"`import ore.cli` pulled in {loaded}"
+
+
+def test_import_cli_defers_branch_modules():
+    times = _importtime("import ore.cli")
+    loaded = [name for name in LAZY_FOR_CLI if name in times]
+    assert loaded == [], f"`import ore.cli` eagerly imported {loaded}"
+
+
+@pytest.mark.parametrize(
+    "module, sdk", [("ore.reasoner", "ollama"), ("ore.reasoner_deepseek", "openai")]
+)
+def test_reasoner_modules_defer_backend_sdk(module, sdk):
+    """Each backend SDK is imported when a reasoner is built, not on import."""
+    times = _importtime(f"import {module}")
+    assert sdk not in times, f"`import {module}` pulled in {sdk}"
+
+
+@pytest.mark.parametrize("flag", ["--list-tools", "--list-skills"])
+def test_list_commands_skip_argparse(flag, tmp_path):
+    """Trivial list commands are served by the fast argv parser, not argparse."""
+    code = (
+        "import sys\n"
+        "from ore import cli\n"
+        f"sys.argv = ['ore', {flag!r}]\n"
+        "try:\n"
+        "    cli.run()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('argparse' in sys.modules, file=sys.stderr)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=_ROOT,
+        env={**os.environ, "HOME": str(tmp_path)},
+    )
+    assert proc.stderr.strip().splitlines()[-1] == "False"
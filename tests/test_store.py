@@ -1,10 +1,13 @@
 """Tests for ore/store.py — FileSessionStore persistence."""
 
 import json
+import sys
+from dataclasses import asdict
+from unittest.mock import patch
 
 import pytest
 
-from ore.store import FileSessionStore, _session_to_dict
+from ore.store import FileSessionStore, _message_to_dict, _session_to_dict
 from ore.types import Message, Session
 
 # Session file JSON shape (interface lock). Top-level and message keys.
@@ -12,10 +15,15 @@ SESSION_TOP_KEYS = frozenset({"id", "created_at", "messages"})
 SESSION_MESSAGE_KEYS = frozenset({"role", "content", "id", "timestamp"})
 
 
-@pytest.fixture
-def store(tmp_path):
-    """FileSessionStore backed by a temp directory."""
-    return FileSessionStore(root=tmp_path)
+@pytest.fixture(params=["orjson", "stdlib"])
+def store(request, tmp_path):
+    """FileSessionStore backed by a temp directory; with and without orjson."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        yield FileSessionStore(root=tmp_path)
+    else:
+        with patch("ore.store.orjson", None):
+            yield FileSessionStore(root=tmp_path)
 
 
 @pytest.mark.invariant
@@ -33,6 +41,19 @@ def test_session_serialization_exact_keys():
         ), f"Message keys expected {SESSION_MESSAGE_KEYS}, got {set(msg.keys())}"
 
 
+def test_old_schema_message_defaults(store, tmp_path):
+    (tmp_path / "old.json").write_text(
+        json.dumps({"id": "s", "messages": [{"role": "user", "content": "hi"}]})
+    )
+    msg = store.load("old").messages[0]
+    assert (msg.role, msg.content, msg.id, msg.timestamp) == ("user", "hi", "", 0.0)
+
+
+def test_message_dict_matches_asdict():
+    msg = Message(role="assistant", content="x")
+    assert _message_to_dict(msg) == asdict(msg)
+
+
 class TestFileSessionStore:
     def test_save_creates_json(self, store, tmp_path):
         session = Session()
@@ -56,6 +77,21 @@ class TestFileSessionStore:
         assert loaded.messages[1].role == "assistant"
         assert loaded.messages[1].content == "pong"
 
+    def test_loaded_roles_interned(self, store):
+        session = Session()
+        session.messages.append(Message(role="user", content="ping"))
+        store.save(session, "interned")
+        assert store.load("interned").messages[0].role is sys.intern("user")
+
+    def test_round_trip_non_ascii(self, store, tmp_path):
+        session = Session()
+        session.messages.append(Message(role="user", content="café ☕ 你好"))
+        store.save(session, "utf8")
+        assert json.loads((tmp_path / "utf8.json").read_bytes()) == _session_to_dict(
+            session
+        )
+        assert store.load("utf8").messages[0].content == "café ☕ 你好"
+
     def test_round_trip_preserves_timestamps(self, store):
         session = Session()
         msg = Message(role="user", content="ts")
@@ -98,6 +134,78 @@ class TestFileSessionStore:
         assert len(loaded.messages) == 1
 
 
+class TestSessionJournal:
+    """append() journals messages as JSONL; load() replays, save() compacts."""
+
+    def test_append_then_load_replays(self, store, tmp_path):
+        session = Session()
+        store.save(session, "j")
+        msgs = [
+            Message(role="user", content="q"),
+            Message(role="assistant", content="a"),
+        ]
+        store.append("j", msgs)
+
+        assert len((tmp_path / "j.jsonl").read_text().splitlines()) == 2
+        loaded = store.load("j")
+        assert [m.content for m in loaded.messages] == ["q", "a"]
+        assert loaded.messages[0].id == msgs[0].id
+
+    def test_save_compacts_journal(self, store, tmp_path):
+        session = Session()
+        store.save(session, "c")
+        session.messages.append(Message(role="user", content="q"))
+        store.append("c", session.messages)
+        store.save(session, "c")
+
+        assert not (tmp_path / "c.jsonl").exists()
+        data = json.loads((tmp_path / "c.json").read_text())
+        assert set(data.keys()) == SESSION_TOP_KEYS
+        assert len(data["messages"]) == 1
+
+    def test_replay_skips_messages_already_in_snapshot(self, store):
+        session = Session()
+        session.messages.append(Message(role="user", content="q"))
+        store.save(session, "d")
+        store.append("d", session.messages)
+        assert len(store.load("d").messages) == 1
+
+    def test_replay_stops_at_torn_line(self, store, tmp_path):
+        store.save(Session(), "t")
+        store.append("t", [Message(role="user", content="ok")])
+        with (tmp_path / "t.jsonl").open("a") as f:
+            f.write('{"role": "assist')
+        assert [m.content for m in store.load("t").messages] == ["ok"]
+
+    @pytest.mark.parametrize("line", ["[]", '"x"', "42", '{"role": 1, "content": "c"}'])
+    def test_replay_stops_at_non_object_line(self, store, tmp_path, line):
+        store.save(Session(), "n")
+        store.append("n", [Message(role="user", content="ok")])
+        with (tmp_path / "n.jsonl").open("a") as f:
+            f.write(line + "\n")
+        assert [m.content for m in store.load("n").messages] == ["ok"]
+
+    def test_failed_save_keeps_snapshot_and_journal(self, store, tmp_path):
+        session = Session()
+        store.save(session, "f")
+        session.messages.append(Message(role="user", content="kept"))
+        store.append("f", session.messages)
+        with patch("ore.store._dumps_snapshot", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                store.save(session, "f")
+        assert {p.name for p in tmp_path.iterdir()} == {"f.json", "f.jsonl"}
+        assert [m.content for m in store.load("f").messages] == ["kept"]
+
+    def test_journal_not_listed(self, store):
+        store.save(Session(), "only")
+        store.append("only", [Message(role="user", content="x")])
+        assert store.list() == ["only"]
+
+    def test_append_rejects_bad_name(self, store):
+        with pytest.raises(ValueError):
+            store.append("a/b", [])
+
+
 # C-2 session name path traversal: validation rejects bad names
 @pytest.mark.invariant
 def test_session_name_with_slash_rejected(store):
@@ -61,3 +61,48 @@ def test_ore_all_exports_are_importable():
 
     for name in ore.__all__:
         assert hasattr(ore, name), f"ore.{name} missing (in __all__ but not on module)"
+
+
+def test_import_ore_defers_submodules():
+    """`import ore` loads only the version; submodules load on first access."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys, ore\n"
+        "print(sorted(m for m in sys.modules if m.startswith('ore.')))\n"
+        "ore.Message\n"
+        "print('ore.types' in sys.modules)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[1],
+    ).stdout.splitlines()
+    assert out == ["['ore._version']", "True"]
+
+
+def test_dir_lists_lazy_exports():
+    import ore
+
+    assert set(ore.__all__) <= set(dir(ore))
+
+
+def test_no_versioned_module_copies():
+    """ore/ is flat and holds one copy of each module (no cli_v0_3.py-style shims)."""
+    import re
+    from pathlib import Path
+
+    import ore
+
+    pkg = Path(__file__).resolve().parents[1] / "ore"
+    modules = sorted(p.name for p in pkg.glob("*.py"))
+    versioned = [m for m in modules if re.search(r"[_.-]v?\d+(_\d+)*\.py$", m)]
+    assert versioned == [], f"Versioned module copies in ore/: {versioned}"
+    subpackages = [p.name for p in pkg.iterdir() if (p / "__init__.py").is_file()]
+    assert subpackages == [], f"Unexpected subpackages in ore/: {subpackages}"
+    lazy_modules = {m.lstrip(".") for m in ore._LAZY_IMPORTS.values()}
+    assert {f"{m}.py" for m in lazy_modules} <= set(modules)
@@ -8,7 +8,7 @@ from pathlib import Path
 import pytest
 
 from ore.gate import Permission
-from ore.tools import EchoTool, ReadFileTool, Tool, TOOL_REGISTRY
+from ore.tools import EchoTool, ReadFileTool, Tool, TOOL_REGISTRY, tool_listing
 
 # Tool ABC contract (interface lock): required members.
 TOOL_ABSTRACT_PROPERTIES = frozenset({"name", "description", "required_permissions"})
@@ -137,6 +137,22 @@ class TestReadFileTool:
         finally:
             os.chdir(old_cwd)
 
+    @pytest.mark.parametrize(
+        "prompt, path",
+        [
+            # Quoted path wins even when a phrase pattern starts earlier
+            ("read the file at 'my notes.txt'", "my notes.txt"),
+            ('read file "a b.txt" please', "a b.txt"),
+            ("read the file at /tmp/x.txt", "/tmp/x.txt"),
+            ("cat notes.md", "notes.md"),
+        ],
+    )
+    def test_extract_args_precedence(self, prompt, path):
+        assert ReadFileTool().extract_args(prompt) == {"path": path}
+
+    def test_extract_args_no_path(self):
+        assert ReadFileTool().extract_args("what is this") == {}
+
 
 class TestToolRegistry:
     def test_echo_registered(self):
@@ -152,3 +168,31 @@ class TestToolRegistry:
         result = tool.run({"k": "v"})
         assert result.tool_name == "echo"
         assert "k=v" in result.output
+
+
+class TestToolListing:
+    def test_sorted_rows(self):
+        assert tool_listing() == (
+            ("echo", EchoTool().description, ""),
+            ("read-file", ReadFileTool().description, "filesystem-read"),
+        )
+
+    def test_reflects_registry_changes(self, monkeypatch):
+        tool_listing()
+        monkeypatch.setitem(TOOL_REGISTRY, "another", EchoTool())
+        rows = tool_listing()
+        assert [name for name, _, _ in rows] == ["another", "echo", "read-file"]
+
+    def test_sorted_permission_values_computed_once(self):
+        class MultiPermTool(EchoTool):
+            calls = 0
+
+            @property
+            def required_permissions(self):
+                MultiPermTool.calls += 1
+                return frozenset({Permission.SHELL, Permission.FILESYSTEM_READ})
+
+        tool = MultiPermTool()
+        assert tool.sorted_permission_values == ("filesystem-read", "shell")
+        assert tool.sorted_permission_values == ("filesystem-read", "shell")
+        assert MultiPermTool.calls == 1
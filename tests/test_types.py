@@ -3,7 +3,7 @@
 import json
 import time
 import uuid
-from dataclasses import fields
+from dataclasses import asdict, fields
 
 import pytest
 
@@ -67,6 +67,12 @@ def test_dataclass_field_contracts():
         ), f"{cls.__name__}: expected fields {expected}, missing {expected - actual}"
 
 
+def test_dataclasses_slotted_except_message():
+    """Every type but Message uses __slots__; Message keeps __dict__ for .wire."""
+    for cls in DATACLASS_FIELD_CONTRACTS:
+        assert ("__slots__" in vars(cls)) is (cls is not Message), cls.__name__
+
+
 class TestMessage:
     def test_defaults(self):
         msg = Message(role="user", content="hello")
@@ -87,6 +93,23 @@ class TestMessage:
         assert msg.id == "custom-id"
         assert msg.timestamp == 1.0
 
+    def test_wire_follows_in_place_edits(self):
+        msg = Message(role="user", content="draft")
+        assert msg.wire["content"] == "draft"
+        msg.content = "final"
+        assert msg.wire == {"role": "user", "content": "final"}
+        msg.role = "assistant"
+        assert msg.wire == {"role": "assistant", "content": "final"}
+
+    def test_wire_built_once_and_not_serialized(self):
+        msg = Message(role="user", content="hi")
+        assert msg.wire == {"role": "user", "content": "hi"}
+        assert msg.wire is msg.wire
+        assert "wire" not in asdict(msg) and "_wire" not in asdict(msg)
+        assert msg == Message(
+            role="user", content="hi", id=msg.id, timestamp=msg.timestamp
+        )
+
 
 class TestResponse:
     def test_defaults(self):
@@ -109,6 +132,12 @@ class TestResponse:
         assert resp.metadata["eval_count"] == 42
 
 
+class TestToolResult:
+    def test_rendered(self):
+        r = ToolResult(tool_name="echo", output="a\nb", status="ok")
+        assert r.rendered == "[Tool:echo]\na\nb"
+
+
 class TestSession:
     def test_defaults(self):
         session = Session()